@@ -0,0 +1,79 @@
+"""
+Atomic file replacement and cross-process locks for compiled data files.
+
+Under ``app.serve`` several forked workers may compile the same file (the
+dataset snapshot, the recap sidecar) at the same moment.  A fixed
+``<name>.tmp`` staging file would then be truncated by one worker while
+another renames it into place, publishing a torn file that a third worker
+may memory-map.  :func:`write_atomic` stages each write in its own uniquely
+named temp file in the destination directory, so ``os.replace`` only ever
+publishes complete files.  :func:`file_lock` serialises whole
+compile-then-open sequences between processes, so only one of them does the
+work.
+"""
+
+import fcntl
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Union
+
+# Permissions of published files (mkstemp creates them owner-only).
+FILE_MODE = 0o644
+
+
+def write_atomic(path: Path, data: Union[bytes, Iterable[bytes]]) -> int:
+    """Write ``data`` to ``path`` through a unique temp file and ``os.replace``.
+
+    Readers see either the old file or the complete new one, even when
+    several processes write ``path`` at once.
+
+    Args:
+        path: Destination file; its directory must exist.
+        data: The file contents, or parts written in order.
+
+    Returns:
+        Number of bytes written.
+
+    Raises:
+        OSError: If the file cannot be written (the temp file is removed).
+    """
+    parts = [data] if isinstance(data, (bytes, bytearray, memoryview)) else data
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            for part in parts:
+                fh.write(part)
+                size += len(part)
+        os.chmod(tmp, FILE_MODE)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    return size
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive ``flock`` on ``path`` (created if needed).
+
+    The lock is per open file, so it also excludes other threads only when
+    they take it through their own call; callers that share state between
+    threads still need a :class:`threading.Lock`.  It is not re-entrant.
+
+    Raises:
+        OSError: If the lock file cannot be created or locked.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as fh:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,507 @@
+"""
+Exact tournament advancement probabilities by dynamic programming over the bracket.
+
+Every team's chance of reaching each round follows exactly from the bracket
+tree and the head-to-head win probabilities, because the two teams meeting in
+a game come from disjoint sub-brackets and reach it independently:
+
+    P(i wins round r) = P(i reaches r) * sum_j P(j reaches r) * P(i beats j)
+
+where ``j`` ranges over the teams of the sub-bracket ``i`` meets in round
+``r``.  :class:`BracketEngine` evaluates that for all 68 teams at once, one
+matrix-vector product per round, with the sub-bracket structure folded into
+a precomputed ``(rounds, n, n)`` opponent-weighted matrix — a full field takes
+tens of microseconds.
+
+The bracket's shape is the usual 64-slot tree plus the four First Four games.
+Slot order is not stored anywhere explicitly; :func:`layout_from_bracket`
+reconstructs it from ``most-likely-bracket.json`` by following each game's
+winner into the next round.
+
+Round indices used throughout:
+
+    0 First Four, 1 Round of 64, 2 Round of 32, 3 Sweet Sixteen,
+    4 Elite Eight, 5 Final Four, 6 National Championship
+
+First Four wins are play-in games and do not count as tournament wins, so a
+team's 0–6 win distribution only counts rounds 1–6.
+
+Completed games are folded in by pinning their outcomes (:func:`fix_results`).
+Once a game's winner is known, earlier games in its sub-bracket no longer
+affect anything later, so the DP stays exact.  :class:`LiveBracket` keeps the
+last conditioned result and, when new games finish, recomputes only the
+sub-brackets that contain them.
+"""
+
+import threading
+from typing import Iterable, Mapping, Optional
+
+import numpy as np
+
+# Display names of the rounds, by round index (as used in results.json).
+ROUND_NAMES = (
+    "First Four",
+    "Round of 64",
+    "Round of 32",
+    "Sweet Sixteen",
+    "Elite Eight",
+    "Final Four",
+    "National Championship",
+)
+
+# Keys of most-likely-bracket.json for rounds 1–6, and their game counts.
+_BRACKET_ROUNDS = (
+    ("round_of_64", 32),
+    ("round_of_32", 16),
+    ("sweet_16", 8),
+    ("elite_8", 4),
+    ("final_four", 2),
+    ("championship", 1),
+)
+
+# ---------------------------------------------------------------------------
+# Layout
+# ---------------------------------------------------------------------------
+
+
+class BracketLayout:
+    """Slot structure of a tournament field.
+
+    Teams are listed in bracket order: walking the tree left to right, with
+    the two teams of a First Four game next to each other in one slot.
+
+    Attributes:
+        names: Team display names, in bracket order.
+        slots: Read-only ``(n,)`` int array — each team's Round of 64 slot
+            (0–63).  Two teams share a slot only if they meet in the First
+            Four.
+    """
+
+    __slots__ = ("names", "slots")
+
+    def __init__(self, names: list[str], slots: list[int]) -> None:
+        if len(names) != len(slots):
+            raise ValueError("Every team needs exactly one slot")
+        if sorted(set(slots)) != list(range(64)):
+            raise ValueError("A bracket needs teams in all 64 slots")
+        if np.bincount(slots).max() > 2:
+            raise ValueError("A First Four slot holds at most two teams")
+        if len({name.casefold() for name in names}) != len(names):
+            raise ValueError("A team appears in the bracket more than once")
+        self.names = tuple(names)
+        slot_array = np.asarray(slots, dtype=np.int64)
+        slot_array.setflags(write=False)
+        self.slots = slot_array
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def layout_from_bracket(data: Mapping) -> BracketLayout:
+    """Reconstruct the bracket layout from ``most-likely-bracket.json``.
+
+    Each game from the Round of 32 on is played between the winners of two
+    earlier games; following those winners back from the championship yields
+    the tree, and a First Four game sits in the Round of 64 slot its winner
+    occupies.
+
+    Args:
+        data: Parsed most-likely bracket with ``first_four``, ``round_of_64``
+            … ``championship`` (a single game) keys.
+
+    Returns:
+        The :class:`BracketLayout` of the field.
+
+    Raises:
+        ValueError: If the file does not describe a complete, consistent
+            68-team bracket.
+    """
+    try:
+        rounds = []
+        for key, count in _BRACKET_ROUNDS:
+            games = data[key]
+            games = [games] if isinstance(games, Mapping) else list(games)
+            if len(games) != count:
+                raise ValueError(f"{key} has {len(games)} games, expected {count}")
+            rounds.append([(g["team1"], g["team2"], g["winner"]) for g in games])
+        first_four = {
+            g["winner"].casefold(): (g["team1"], g["team2"])
+            for g in data.get("first_four", ())
+        }
+    except (KeyError, TypeError) as exc:
+        raise ValueError(f"Malformed bracket: {exc!r}") from exc
+
+    # children[k][g] = the two round-(k-1) games whose winners meet in game g.
+    children: list[list[tuple[int, int]]] = [[]]
+    for k in range(1, len(rounds)):
+        won = {winner.casefold(): g for g, (_, _, winner) in enumerate(rounds[k - 1])}
+        pairs = []
+        for team1, team2, _ in rounds[k]:
+            for team in (team1, team2):
+                if team.casefold() not in won:
+                    raise ValueError(
+                        f"{_BRACKET_ROUNDS[k][0]} team {team!r} did not win a "
+                        f"{_BRACKET_ROUNDS[k - 1][0]} game"
+                    )
+            pairs.append((won[team1.casefold()], won[team2.casefold()]))
+        children.append(pairs)
+
+    # Walk the tree left to right to put the Round of 64 teams in slot order.
+    order: list[str] = []
+
+    def visit(k: int, g: int) -> None:
+        if k == 0:
+            order.extend(rounds[0][g][:2])
+            return
+        left, right = children[k][g]
+        visit(k - 1, left)
+        visit(k - 1, right)
+
+    visit(len(rounds) - 1, 0)
+
+    names: list[str] = []
+    slots: list[int] = []
+    for slot, name in enumerate(order):
+        pair = first_four.pop(name.casefold(), None)
+        names.extend(pair or (name,))
+        slots.extend([slot] * len(pair or (name,)))
+    if first_four:
+        raise ValueError(
+            f"First Four winners missing from the Round of 64: {sorted(first_four)}"
+        )
+    return BracketLayout(names, slots)
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+
+class BracketEngine:
+    """Vectorized exact advancement DP over one bracket and H2H matrix.
+
+    Args:
+        layout: The field in bracket order.
+        probs: ``(n, n)`` matrix in ``layout`` order; ``probs[i, j]`` is the
+            probability that team ``i`` beats team ``j``.  Each pair is
+            normalised so ``P(i beats j) + P(j beats i) == 1``.
+
+    Raises:
+        ValueError: If the matrix has the wrong shape or lacks a probability
+            for two teams that can meet.
+    """
+
+    __slots__ = ("layout", "probs", "_games", "_bye", "_blocks")
+
+    def __init__(self, layout: BracketLayout, probs: np.ndarray) -> None:
+        n = len(layout)
+        probs = np.asarray(probs, dtype=np.float64)
+        if probs.shape != (n, n):
+            raise ValueError(f"Expected a {n}x{n} matrix, got {probs.shape}")
+
+        slots = layout.slots
+        # meets[r, i, j]: i and j are opponents if both reach round r.
+        meets = np.empty((len(ROUND_NAMES), n, n), dtype=bool)
+        meets[0] = slots[:, None] == slots[None, :]
+        np.fill_diagonal(meets[0], False)
+        for r in range(1, len(ROUND_NAMES)):
+            block = slots >> (r - 1)
+            meets[r] = (block[:, None] ^ 1) == block[None, :]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            fair = probs / (probs + probs.T)
+        can_meet = meets.any(axis=0)
+        missing = can_meet & ~np.isfinite(fair)
+        if missing.any():
+            i, j = np.argwhere(missing)[0]
+            raise ValueError(
+                f"No head-to-head probability for {layout.names[i]} vs "
+                f"{layout.names[j]}"
+            )
+        fair = np.where(can_meet, fair, 0.0)
+        fair.setflags(write=False)
+
+        games = meets * fair
+        games.setflags(write=False)
+        bye = ~meets[0].any(axis=1)
+        bye.setflags(write=False)
+        # _blocks[r, i]: the round r game (bracket node) team i plays in.
+        blocks = slots >> np.arange(len(ROUND_NAMES))[:, None]
+        blocks.setflags(write=False)
+
+        self.layout = layout
+        self.probs = fair
+        self._games = games
+        self._bye = bye
+        self._blocks = blocks
+
+    def advancement(
+        self,
+        reach: Optional[np.ndarray] = None,
+        winners: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Return every team's probability of winning each round.
+
+        Args:
+            reach: Optional starting probabilities of reaching the First Four
+                slot, ``(n,)`` or ``(n, k)`` to evaluate ``k`` scenarios at
+                once (default: every team present).
+            winners: Optional results of completed games, from
+                :func:`fix_results`, to condition on.
+
+        Returns:
+            ``(7, n)`` array (``(7, n, k)`` for batched input): row ``r`` is
+            the probability of winning round ``r`` — row 0 is reaching the
+            Round of 64 (1 for teams without a First Four game) and row 6 is
+            winning the title.
+        """
+        n = len(self.layout)
+        reach = np.ones(n) if reach is None else np.asarray(reach, dtype=np.float64)
+        bye = self._bye if reach.ndim == 1 else self._bye[:, None]
+        team = np.arange(n) if reach.ndim == 1 else np.arange(n)[:, None]
+        levels = np.empty((len(ROUND_NAMES),) + reach.shape)
+        for r, games in enumerate(self._games):
+            won = reach * (games @ reach)
+            if r == 0:
+                won = np.where(bye, reach, won)
+            if winners is not None:
+                pinned = winners[r, self._blocks[r]]
+                if reach.ndim == 2:
+                    pinned = pinned[:, None]
+                won = np.where(pinned >= 0, pinned == team, won)
+            levels[r] = reach = won
+        return levels
+
+    def total_wins(
+        self, counts: np.ndarray, winners: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Return the exact distribution of a roster's combined wins.
+
+        Rostered teams share bracket paths: two teams from one region cannot
+        both reach the Final Four, and every game has one winner.  So the
+        total is not a sum of independent per-team distributions.  The DP
+        tracks, for each team, the probability that it won its latest game
+        *and* the roster won ``k`` games inside its sub-bracket so far.  The
+        two halves of a game are independent, so each round is one
+        matrix product (opponent mixture) and a convolution.
+
+        Args:
+            counts: ``(n,)`` times each team is on the roster (usually 0/1).
+            winners: Optional completed games from :func:`fix_results`.
+
+        Returns:
+            ``(6 * counts.sum() + 1,)`` array: probability of each total.
+        """
+        counts = np.asarray(counts, dtype=np.int64)
+        size = 6 * int(counts.sum()) + 1
+        n = len(self.layout)
+
+        # Round 0: the First Four, which counts no wins.
+        f = np.zeros((n, size))
+        f[:, 0] = np.where(self._bye, 1.0, self._round_games(0, winners).sum(axis=1))
+        deg = 0  # highest total with nonzero probability so far
+        for r in range(1, len(ROUND_NAMES)):
+            opponents = self._round_games(r, winners) @ f[:, :deg + 1]
+            played = np.zeros((n, size))
+            for k in range(deg + 1):
+                m = min(deg + 1, size - k)
+                played[:, k:k + m] += f[:, k:k + 1] * opponents[:, :m]
+            f = np.zeros((n, size))
+            for c in np.unique(counts):
+                rows = counts == c
+                f[rows, c:] = played[rows, :size - c]
+            deg = min(2 * deg + int(counts.max()), size - 1)
+        return f.sum(axis=0)
+
+    def _round_games(self, r: int, winners: Optional[np.ndarray]) -> np.ndarray:
+        """Round ``r`` games matrix with completed games pinned to their winner."""
+        games = self._games[r]
+        if winners is None:
+            return games
+        decided = winners[r, self._blocks[r]]
+        if not (decided >= 0).any():
+            return games
+        slots = self.layout.slots
+        games = np.where((decided >= 0)[:, None], 0.0, games)
+        for w in np.unique(decided[decided >= 0]):
+            if r == 0:
+                opponents = slots == slots[w]
+                opponents[w] = False
+            else:
+                block = slots >> (r - 1)
+                opponents = block == block[w] ^ 1
+            games[w] = opponents
+        return games
+
+    def record(self, winners: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return each team's results so far.
+
+        Args:
+            winners: Completed games, from :func:`fix_results`.
+
+        Returns:
+            ``(wins, eliminated)`` — ``(n,)`` tournament wins (First Four
+            excluded) and whether the team has lost a game.
+        """
+        played = winners[np.arange(len(ROUND_NAMES))[:, None], self._blocks]
+        won = played == np.arange(len(self.layout))
+        return won[1:].sum(axis=0), ((played >= 0) & ~won).any(axis=0)
+
+    @staticmethod
+    def win_distribution(levels: np.ndarray) -> np.ndarray:
+        """Convert advancement levels to 0–6 tournament-win distributions.
+
+        Args:
+            levels: Output of :meth:`advancement`.
+
+        Returns:
+            ``(7, n, ...)`` array: row ``k`` is the probability of exactly
+            ``k`` wins (First Four games do not count; a First Four loser
+            has 0 wins).
+        """
+        at_least = np.concatenate([
+            np.ones((1,) + levels.shape[1:]),
+            levels[1:],
+            np.zeros((1,) + levels.shape[1:]),
+        ])
+        return at_least[:-1] - at_least[1:]
+
+
+# ---------------------------------------------------------------------------
+# Completed games
+# ---------------------------------------------------------------------------
+
+
+def fix_results(
+    layout: BracketLayout, games: Iterable[tuple[int, str, str, str]]
+) -> np.ndarray:
+    """Record the winners of completed games, by bracket node.
+
+    The round ``r`` game played by slot ``s`` is node ``s >> r`` of that
+    round.  Winning a game implies winning every earlier game in the same
+    sub-bracket, and the loser must have won its earlier games too, so those
+    games are also filled in.  This keeps the conditioned levels consistent
+    even when an earlier game is missing from the results.
+
+    Args:
+        layout: The field in bracket order.
+        games: ``(round index, team1, team2, winner)`` for every completed
+            game, in any order.
+
+    Returns:
+        ``(7, 64)`` int array: ``winners[r, node]`` is the index of the team
+        that won that game, or -1 if it has not been played (only the first
+        ``64 >> r`` nodes of round ``r`` exist).
+
+    Raises:
+        ValueError: If a team is not in the bracket, two teams could not have
+            met in that round, or the results contradict each other.
+    """
+    index = {name.casefold(): i for i, name in enumerate(layout.names)}
+    slots = layout.slots.tolist()
+    winners = [[-1] * 64 for _ in ROUND_NAMES]
+
+    def credit(team: int, last: int) -> None:
+        for r in range(last + 1):
+            node = slots[team] >> r
+            other = winners[r][node]
+            if other not in (-1, team):
+                raise ValueError(
+                    f"{layout.names[team]} cannot have won the {ROUND_NAMES[r]} "
+                    f"game that {layout.names[other]} won"
+                )
+            winners[r][node] = team
+
+    for r, team1, team2, winner in sorted(games, key=lambda g: g[0]):
+        for team in (team1, team2, winner):
+            if team.casefold() not in index:
+                raise ValueError(f"Team {team!r} is not in the bracket")
+        i, j, w = (index[t.casefold()] for t in (team1, team2, winner))
+        if r == 0:
+            met = slots[i] == slots[j] and i != j
+        else:
+            met = (slots[i] >> (r - 1)) ^ 1 == slots[j] >> (r - 1)
+        if not met or w not in (i, j):
+            raise ValueError(
+                f"{team1} vs {team2} (winner {winner}) is not a possible "
+                f"{ROUND_NAMES[r]} game"
+            )
+        if r > 0:
+            credit(j if w == i else i, r - 1)
+        credit(w, r)
+    return np.array(winners, dtype=np.int64)
+
+
+class LiveBracket:
+    """Advancement conditioned on completed games, updated incrementally.
+
+    A team's round ``r`` probability only depends on the earlier rounds of its
+    own round ``r`` sub-bracket.  So when games are added, only their
+    sub-brackets and the larger sub-brackets above them are recomputed, up to
+    the whole field for the title game.  Rounds below the earliest new result
+    and untouched parts of the bracket keep their previous values, and a
+    decided game needs no arithmetic at all.
+
+    Args:
+        engine: The unconditioned bracket.
+
+    Attributes:
+        winners: Results the current :attr:`levels` are conditioned on, as
+            from :func:`fix_results`.
+        levels: ``(7, n)`` conditioned advancement, as from
+            :meth:`BracketEngine.advancement`.  It is replaced, never
+            modified, on update, so callers may keep a reference.
+        recomputed: Team-rounds recomputed by the last update.
+    """
+
+    def __init__(self, engine: BracketEngine) -> None:
+        self.engine = engine
+        self.winners = np.full((len(ROUND_NAMES), 64), -1, dtype=np.int64)
+        self.levels = engine.advancement()
+        self.recomputed = self.levels.size
+        self._lock = threading.Lock()
+        # _nodes[r][node]: the node's teams and their round r games matrix.
+        self._nodes = []
+        for r, blocks in enumerate(engine._blocks):
+            nodes = []
+            for node in range(64 >> r):
+                idx = np.flatnonzero(blocks == node)
+                nodes.append((idx, engine._games[r][np.ix_(idx, idx)]))
+            self._nodes.append(nodes)
+
+    def update(self, winners: np.ndarray) -> np.ndarray:
+        """Condition on ``winners`` (from :func:`fix_results`), reusing what it can.
+
+        Returns:
+            The new :attr:`levels`.
+        """
+        with self._lock:
+            changed = np.argwhere(winners != self.winners).tolist()
+            if not changed:
+                return self.levels
+
+            levels = self.levels.copy()
+            dirty: set[int] = set()
+            recomputed = 0
+            for r, nodes in enumerate(self._nodes):
+                # Parents of last round's dirty nodes, plus new results.
+                dirty = {node >> 1 for node in dirty} if r else set()
+                dirty.update(node for rr, node in changed if rr == r)
+                for node in dirty:
+                    idx, games = nodes[node]
+                    winner = winners[r, node]
+                    if winner >= 0:
+                        levels[r, idx] = 0.0
+                        levels[r, winner] = 1.0
+                        continue
+                    reach = levels[r - 1, idx] if r else np.ones(len(idx))
+                    if r == 0 and len(idx) == 1:
+                        levels[r, idx] = reach
+                    else:
+                        levels[r, idx] = reach * (games @ reach)
+                    recomputed += len(idx)
+
+            self.winners = winners
+            self.levels = levels
+            self.recomputed = recomputed
+            return levels
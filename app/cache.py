@@ -0,0 +1,329 @@
+"""
+Pre-serialized response cache for read-only API endpoints.
+
+Most endpoints derive their response purely from the prediction and results
+files, which change rarely.  Rather than rebuilding Pydantic models and
+re-serializing them on every request, each endpoint's final JSON bytes are
+stored together with the dependency fingerprint they were built from, and
+served directly until that fingerprint changes.
+
+A dependency fingerprint is a tuple of the loaded dataset objects an endpoint
+reads (see :func:`app.services.dataset_fingerprint`).  Every loader returns
+the same object for as long as its source file is unchanged and a new object
+once it changes, so comparing fingerprints by identity detects any change in
+the underlying files without hashing their contents.
+
+Each cached body also carries a strong ETag (a hash of its bytes, computed
+once per rebuild), so clients and proxies that send ``If-None-Match`` are
+answered with ``304 Not Modified`` and no body.  Routes attach one of the
+Cache-Control policies below to say how long that validation may be skipped.
+
+Large bodies are compressed once, when the entry is rebuilt, and kept next to
+the identity bytes as gzip (and, if the optional ``brotli`` package is
+installed, br) variants.  Each variant has its own ETag, and the variant sent
+is negotiated from the request's ``Accept-Encoding``.
+"""
+
+import gzip
+import hashlib
+import logging
+import threading
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+from pydantic_core import to_json
+
+from app.config import (
+    CACHE_MAX_AGE_RESULTS,
+    CACHE_MAX_AGE_STATIC,
+    CACHE_STALE_WHILE_REVALIDATE,
+)
+
+try:
+    import brotli
+except ImportError:  # brotli is optional — gzip alone is always available
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Cache-Control policies
+# ---------------------------------------------------------------------------
+
+# Data that only changes between seasons (predictions, team list, info).
+STATIC_CACHE_CONTROL = f"public, max-age={CACHE_MAX_AGE_STATIC}"
+
+# Data backed by results.json, which is updated during games.
+RESULTS_CACHE_CONTROL = (
+    f"public, max-age={CACHE_MAX_AGE_RESULTS}, "
+    f"stale-while-revalidate={CACHE_STALE_WHILE_REVALIDATE}"
+)
+
+# Responses that must be revalidated on every use (e.g. degraded results).
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# ---------------------------------------------------------------------------
+# Compression
+# ---------------------------------------------------------------------------
+
+# Bodies smaller than this are always sent uncompressed; the framing overhead
+# would eat most of the saving.
+COMPRESS_MIN_BYTES = 1024
+
+
+def _compressors() -> dict[str, Callable[[bytes], bytes]]:
+    """Return the available content codings in server preference order."""
+    codecs: dict[str, Callable[[bytes], bytes]] = {}
+    if brotli is not None:
+        codecs["br"] = lambda body: brotli.compress(body, quality=11)
+    # mtime=0 keeps the output byte-identical across rebuilds of the same body.
+    codecs["gzip"] = lambda body: gzip.compress(body, compresslevel=9, mtime=0)
+    return codecs
+
+
+def compress_variants(body: bytes, etag: str) -> dict[str, tuple[bytes, str]]:
+    """Pre-compress ``body`` into every available content coding.
+
+    Args:
+        body: Identity (uncompressed) response bytes.
+        etag: Strong ETag of the identity bytes.
+
+    Returns:
+        Content coding → ``(compressed bytes, variant ETag)``, in server
+        preference order.  Empty for small bodies; codings that do not
+        shrink the body are left out.
+    """
+    if len(body) < COMPRESS_MIN_BYTES:
+        return {}
+    variants: dict[str, tuple[bytes, str]] = {}
+    for coding, compress in _compressors().items():
+        encoded = compress(body)
+        if len(encoded) < len(body):
+            variants[coding] = (encoded, f'{etag[:-1]}-{coding}"')
+    return variants
+
+
+def negotiate_encoding(
+    accept_encoding: Optional[str], available: Iterable[str]
+) -> Optional[str]:
+    """Pick the content coding to send for an ``Accept-Encoding`` header.
+
+    Args:
+        accept_encoding: Raw header value, or ``None`` if absent.
+        available: Codings that have a pre-compressed variant, in server
+            preference order.
+
+    Returns:
+        The first available coding the client accepts with a non-zero
+        q-value, or ``None`` to send the identity body.
+    """
+    if not accept_encoding:
+        return None
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[coding.strip().lower()] = q
+    for coding in available:
+        if weights.get(coding, weights.get("*", 0.0)) > 0:
+            return coding
+    return None
+
+
+# ---------------------------------------------------------------------------
+# ETags
+# ---------------------------------------------------------------------------
+
+
+def make_etag(body: bytes) -> str:
+    """Return a strong ETag for a response body."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Return True if an ``If-None-Match`` header value matches ``etag``.
+
+    ``If-None-Match`` uses weak comparison, so a ``W/`` prefix on either side
+    is ignored.  ``*`` matches any current representation.
+
+    Args:
+        if_none_match: Raw header value, or ``None`` if absent.
+        etag: The current strong ETag (quoted).
+
+    Returns:
+        True if the client's cached copy is still current.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def json_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    cache_control: str,
+    variants: Optional[dict[str, tuple[bytes, str]]] = None,
+) -> Response:
+    """Return ``body`` as JSON, or a bodiless 304 if the client has it already.
+
+    Args:
+        request: Incoming request (read for ``If-None-Match`` and
+            ``Accept-Encoding``).
+        body: Serialized JSON response bytes.
+        etag: Strong ETag for ``body``.
+        cache_control: Cache-Control header value for the route.
+        variants: Pre-compressed variants from :func:`compress_variants`;
+            computed here when omitted.
+
+    Returns:
+        A 200 JSON :class:`Response` in the negotiated content coding, or a
+        304 carrying the validators of that variant.
+    """
+    if variants is None:
+        variants = compress_variants(body, etag)
+    headers = {"Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    coding = negotiate_encoding(request.headers.get("accept-encoding"), variants)
+    if coding is not None:
+        body, etag = variants[coding]
+        headers["Content-Encoding"] = coding
+    headers["ETag"] = etag
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+
+class CachedResponse:
+    """One endpoint's serialized response and the dependencies it came from.
+
+    Attributes:
+        deps: Dependency fingerprint the body was built from.
+        body: Final JSON response bytes.
+        etag: Strong ETag for ``body``.
+        variants: Pre-compressed variants (see :func:`compress_variants`).
+    """
+
+    __slots__ = ("deps", "body", "etag", "variants")
+
+    def __init__(self, deps: tuple, body: bytes) -> None:
+        self.deps = deps
+        self.body = body
+        self.etag = make_etag(body)
+        self.variants = compress_variants(body, self.etag)
+
+    def matches(self, deps: tuple) -> bool:
+        """Return True if ``deps`` is the fingerprint this body was built from."""
+        return len(deps) == len(self.deps) and all(
+            a is b or a == b for a, b in zip(deps, self.deps)
+        )
+
+
+class ResponseCache:
+    """Keyed store of pre-serialized responses, rebuilt on dependency change.
+
+    Entries hold strong references to their dependency objects, so an object
+    identity in a fingerprint can never be recycled while its entry exists.
+
+    Attributes:
+        hits: Requests served straight from cached bytes.
+        misses: Requests that had to build and serialize a response.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Hashable, CachedResponse] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, key: Hashable, deps: tuple, build: Callable[[], Any]
+    ) -> CachedResponse:
+        """Return the cached response for ``key``, rebuilding it if stale.
+
+        Args:
+            key: Cache key, usually the route path (plus any parameters).
+            deps: Current dependency fingerprint for the endpoint.
+            build: Zero-argument callable returning the response value (a
+                Pydantic model, or a list/dict of them).  Only called on a
+                miss; any exception it raises propagates to the caller.
+
+        Returns:
+            The up-to-date :class:`CachedResponse`.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry.matches(deps):
+            self.hits += 1
+            return entry
+
+        entry = CachedResponse(deps, to_json(build()))
+        with self._lock:
+            self._entries[key] = entry
+            self.misses += 1
+        logger.info(
+            "Response cache rebuilt %r (%d bytes; %s)",
+            key,
+            len(entry.body),
+            ", ".join(f"{c} {len(b)}" for c, (b, _) in entry.variants.items())
+            or "uncompressed",
+        )
+        return entry
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return the hit/miss counters and the derived hit ratio."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+# Process-wide cache shared by every cached route.
+response_cache = ResponseCache()
+
+
+def cached_json_response(
+    request: Request,
+    key: Hashable,
+    deps: tuple,
+    build: Callable[[], Any],
+    cache_control: str = STATIC_CACHE_CONTROL,
+) -> Response:
+    """Serve ``key`` from :data:`response_cache` with ETag validation.
+
+    Args:
+        request: Incoming request (read for ``If-None-Match``).
+        key: Cache key for the endpoint.
+        deps: Current dependency fingerprint for the endpoint.
+        build: Builder called only when the cached bytes are stale.
+        cache_control: Cache-Control policy for the route.
+
+    Returns:
+        A 200 JSON :class:`Response` carrying the cached bytes in the
+        negotiated content coding, or a 304.
+    """
+    entry = response_cache.get(key, deps, build)
+    return json_response(
+        request, entry.body, entry.etag, cache_control, entry.variants
+    )
@@ -20,6 +20,20 @@ DATA_DIR: Path = Path(os.getenv("DATA_DIR", str(Path(__file__).parent.parent / "
 # Directory that holds per-season team prediction JSON files.
 PREDICTIONS_DIR: Path = DATA_DIR / "predictions"
 
+# Directory for artifacts derived from the prediction files (e.g. the recap
+# sidecar).  Safe to delete — everything in it is rebuilt on demand.
+COMPILED_DIR: Path = Path(os.getenv("COMPILED_DIR", str(DATA_DIR / "compiled")))
+
+# Exported team vectors (the file scripts/import_vectors.py loads into
+# ChromaDB); also the source of the in-process similarity index.
+VECTORS_FILE: Path = Path(
+    os.getenv("VECTORS_FILE", str(DATA_DIR / "vector_db" / "chroma_vectors.json"))
+)
+
+# Precomputed similar teams for the current field, written by the startup
+# warmup (and the admin refresh endpoint) so restarts do not need ChromaDB.
+SIMILAR_TEAMS_FILE: Path = COMPILED_DIR / "similar-teams.json"
+
 # ---------------------------------------------------------------------------
 # ChromaDB settings
 # ---------------------------------------------------------------------------
@@ -35,3 +49,95 @@ CHROMA_PORT: int = int(os.getenv("CHROMA_PORT", "8001"))
 # Name of the ChromaDB collection that stores the PCA-reduced team vectors.
 # Must match the --collection argument used when running scripts/import_vectors.py.
 CHROMA_COLLECTION: str = os.getenv("CHROMA_COLLECTION", "ncaa_teams")
+
+# Similar-team search engine: "chroma" queries ChromaDB; "numpy" searches the
+# in-process index built from VECTORS_FILE (or pulled from ChromaDB at startup).
+SIMILARITY_ENGINE: str = os.getenv("SIMILARITY_ENGINE", "chroma").lower()
+
+# When true, the in-process index answers similar-team lookups that ChromaDB
+# could not (connection errors, reconnect backoff).
+SIMILARITY_FALLBACK: bool = os.getenv("SIMILARITY_FALLBACK", "true").lower() in (
+    "1", "true", "yes",
+)
+
+# Threads reserved for blocking similar-team lookups, and the deadline (seconds)
+# after which a lookup is abandoned and the caller gets an empty list.
+SIMILARITY_WORKERS: int = int(os.getenv("SIMILARITY_WORKERS", "4"))
+SIMILARITY_TIMEOUT: float = float(os.getenv("SIMILARITY_TIMEOUT", "2.0"))
+
+# Seconds before a failed similarity-index load (missing or unreadable
+# VECTORS_FILE) is attempted again; until then lookups get no index at once.
+SIMILARITY_RETRY_SECONDS: float = float(os.getenv("SIMILARITY_RETRY_SECONDS", "60"))
+
+# Circuit breaker around ChromaDB queries: open after this many consecutive
+# failures, then allow a single trial query once the reset timeout (seconds)
+# has elapsed.
+BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_TIMEOUT: float = float(os.getenv("BREAKER_RESET_TIMEOUT", "30"))
+
+# Backoff (seconds) between reconnect attempts after ChromaDB becomes
+# unreachable; doubles after each failure up to CHROMA_BACKOFF_MAX.
+CHROMA_BACKOFF_INITIAL: float = float(os.getenv("CHROMA_BACKOFF_INITIAL", "0.5"))
+CHROMA_BACKOFF_MAX: float = float(os.getenv("CHROMA_BACKOFF_MAX", "30"))
+
+# ---------------------------------------------------------------------------
+# HTTP caching
+# ---------------------------------------------------------------------------
+
+# max-age (seconds) for responses built only from pre-tournament data
+# (predictions, team list, project info), which change at most once a season.
+CACHE_MAX_AGE_STATIC: int = int(os.getenv("CACHE_MAX_AGE_STATIC", "86400"))
+
+# max-age (seconds) for responses backed by results.json, which is updated
+# while games are being played.
+CACHE_MAX_AGE_RESULTS: int = int(os.getenv("CACHE_MAX_AGE_RESULTS", "15"))
+
+# How long (seconds) a stale results-backed response may still be served while
+# a cache revalidates it in the background.
+CACHE_STALE_WHILE_REVALIDATE: int = int(os.getenv("CACHE_STALE_WHILE_REVALIDATE", "60"))
+
+# ---------------------------------------------------------------------------
+# Admin
+# ---------------------------------------------------------------------------
+
+# Shared secret for /api/admin endpoints, sent in the X-Admin-Token header.
+# Admin endpoints are disabled while this is unset.
+ADMIN_TOKEN: str = os.getenv("ADMIN_TOKEN", "")
+
+# ---------------------------------------------------------------------------
+# Serving
+# ---------------------------------------------------------------------------
+
+# Number of worker processes started by app/serve.py (`--workers` overrides).
+WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# ---------------------------------------------------------------------------
+# Simulation
+# ---------------------------------------------------------------------------
+
+# Processes app/simulation.py shards Monte Carlo runs across.  1 samples in the
+# calling process, which suits web workers (already one process per CPU);
+# the command line (`--workers`) is where more pay off.
+SIMULATION_WORKERS: int = int(os.getenv("SIMULATION_WORKERS", "1"))
+
+# Tournaments per shard.  Each shard has its own seeded random stream, so a
+# seeded run only depends on this (not on the worker count); it also bounds
+# the memory a shard needs (roughly 1 KB per tournament while sampling).
+SIMULATION_SHARD_SIZE: int = int(os.getenv("SIMULATION_SHARD_SIZE", "100000"))
+
+# Root seed of the shared tournament sample that simulated pool answers are
+# computed from.  Fixed, so every worker serves the same numbers.
+SIMULATION_SEED: int = int(os.getenv("SIMULATION_SEED", "2026"))
+
+# Tournaments in that shared sample, drawn once per dataset (and results)
+# version.  100,000 keep the standard error of a probability below 0.002.
+POOL_SIMULATIONS: int = int(os.getenv("POOL_SIMULATIONS", "100000"))
+
+# ---------------------------------------------------------------------------
+# Dataset reloads
+# ---------------------------------------------------------------------------
+
+# Seconds between checks for changed prediction files; a change triggers a
+# background reload and atomic swap.  0 disables the watcher (reloads then
+# only happen on SIGHUP or POST /api/admin/datasets/reload).
+DATASET_POLL_INTERVAL: float = float(os.getenv("DATASET_POLL_INTERVAL", "30"))
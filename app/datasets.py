@@ -0,0 +1,284 @@
+"""
+Versioned dataset registry with atomic hot-swap.
+
+The prediction records, the H2H entries and everything derived from them (team
+store, H2H matrix, recap store) are bundled into one immutable :class:`Dataset`.
+The :class:`DatasetRegistry` holds a single reference to the current one.  A
+reload builds and validates a complete replacement off to the side and then
+swaps that reference in one assignment, so readers see either the old or the
+new dataset and never a mix of the two.
+
+Every HTTP request pins the dataset that was current when it arrived
+(:class:`DatasetPinMiddleware`, via a context variable that follows the request
+into worker threads), so requests in flight during a swap finish against the
+version they started with.  The pinned version is reported to clients in the
+``X-Dataset-Version`` response header.
+
+Reloads are triggered by ``POST /api/admin/datasets/reload``, by SIGHUP, or by
+:func:`watch_datasets` polling the source files' size and mtime.  A version is
+a digest of those signatures, so every worker process serving the same files
+reports the same version.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Mapping, Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Response header carrying the version a request was served from.
+VERSION_HEADER = "X-Dataset-Version"
+
+# ---------------------------------------------------------------------------
+# Dataset
+# ---------------------------------------------------------------------------
+
+
+def dataset_version(sources: Mapping[str, Any]) -> str:
+    """Return the version identifier for a set of source-file signatures.
+
+    Args:
+        sources: File name → ``{"size", "mtime_ns"}`` signature (or ``None``
+            for a missing optional file).
+
+    Returns:
+        A 12-character hex digest, stable across processes.
+    """
+    encoded = json.dumps(sources, sort_keys=True).encode()
+    return hashlib.blake2b(encoded, digest_size=6).hexdigest()
+
+
+class Dataset:
+    """One immutable, fully built version of the prediction datasets.
+
+    Attributes:
+        version: Identifier derived from the source signatures.
+        sources: Source-file signatures the dataset was built from.
+        teams: Team records, as returned by ``load_predictions``.
+        team_store: :class:`~app.services.TeamStore` indexing ``teams``.
+        h2h_entries: H2H matchup records, or ``None`` without an H2H file.
+        h2h_matrix: :class:`~app.services.H2HMatrix` for ``h2h_entries``.
+        recaps: :class:`~app.recaps.RecapStore` paired with ``teams``.
+        loaded_at: Unix time the dataset was built.
+    """
+
+    __slots__ = (
+        "version", "sources", "teams", "team_store", "h2h_entries",
+        "h2h_matrix", "recaps", "loaded_at",
+    )
+
+    def __init__(
+        self,
+        sources: Mapping[str, Any],
+        teams: Any,
+        team_store: Any,
+        h2h_entries: Any = None,
+        h2h_matrix: Any = None,
+        recaps: Any = None,
+    ) -> None:
+        self.version = dataset_version(sources)
+        self.sources = sources
+        self.teams = teams
+        self.team_store = team_store
+        self.h2h_entries = h2h_entries
+        self.h2h_matrix = h2h_matrix
+        self.recaps = recaps
+        self.loaded_at = time.time()
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+# Dataset pinned to the current request (unset outside a request).
+_pinned: ContextVar[Optional[Dataset]] = ContextVar("pinned_dataset", default=None)
+
+
+class DatasetRegistry:
+    """Holds the current :class:`Dataset` and swaps in reloaded versions.
+
+    Args:
+        builder: Builds and validates a new :class:`Dataset` from the files on
+            disk; raises ``FileNotFoundError`` or ``ValueError`` on failure.
+        probe: Returns the current source-file signatures, compared with
+            :attr:`Dataset.sources` to detect changed files cheaply.
+    """
+
+    def __init__(
+        self,
+        builder: Callable[[], Dataset],
+        probe: Callable[[], Mapping[str, Any]],
+    ) -> None:
+        self._builder = builder
+        self._probe = probe
+        self._current: Optional[Dataset] = None
+        # Serialises builds so concurrent triggers never build twice.
+        self._lock = threading.Lock()
+        # Sources of the last failed build, not retried until they change.
+        self._failed_sources: Optional[Mapping[str, Any]] = None
+        self.reloads = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def current(self) -> Optional[Dataset]:
+        """The most recently swapped-in dataset, or ``None`` before the first load."""
+        return self._current
+
+    def peek(self) -> Optional[Dataset]:
+        """Return the request's pinned dataset, else the current one; never loads."""
+        return _pinned.get() or self._current
+
+    def get(self) -> Dataset:
+        """Return the dataset to serve from, loading the first one if needed.
+
+        Raises:
+            FileNotFoundError: If there is no dataset yet and the source files
+                are missing.
+            ValueError: If there is no dataset yet and the files are invalid.
+        """
+        dataset = _pinned.get() or self._current
+        if dataset is None:
+            with self._lock:
+                if self._current is None:
+                    self._swap(self._builder())
+                dataset = self._current
+        return dataset
+
+    def reload(self, force: bool = False) -> tuple[Dataset, Optional[Dataset]]:
+        """Build a new dataset from disk and atomically make it current.
+
+        The old dataset stays current until the new one is fully built and
+        validated, and stays current if building fails.
+
+        Args:
+            force: Rebuild even if the source files look unchanged.
+
+        Returns:
+            ``(current, previous)`` — the dataset now current and the one
+            that was current before the call (the same object when the files
+            were unchanged; ``None`` on the first load).
+
+        Raises:
+            FileNotFoundError: If the source files are missing.
+            ValueError: If the new files fail to parse or validate.
+        """
+        with self._lock:
+            previous = self._current
+            sources = self._probe()
+            if not force and previous is not None and previous.sources == sources:
+                return previous, previous
+            try:
+                dataset = self._builder()
+            except (OSError, ValueError) as exc:
+                self.failures += 1
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                self._failed_sources = sources
+                logger.error("Dataset reload failed, keeping %s: %s",
+                             previous.version if previous else "nothing", exc)
+                raise
+            self._swap(dataset)
+            self.reloads += 1
+            return dataset, previous
+
+    def stale(self) -> bool:
+        """Return True if the source files changed since the current build.
+
+        Files whose last build failed are not reported again until they
+        change once more.
+        """
+        current = self._current
+        if current is None:
+            return False
+        sources = self._probe()
+        return sources != current.sources and sources != self._failed_sources
+
+    def stats(self) -> dict:
+        """Return the current version and reload counters (for /api/metrics)."""
+        current = self._current
+        return {
+            "version": current.version if current else None,
+            "loaded_at": current.loaded_at if current else None,
+            "reloads": self.reloads,
+            "failures": self.failures,
+            "last_error": self.last_error,
+        }
+
+    def _swap(self, dataset: Dataset) -> None:
+        self._current = dataset
+        self._failed_sources = None
+        self.last_error = None
+        logger.info("Dataset version %s is now current", dataset.version)
+
+
+# ---------------------------------------------------------------------------
+# Request pinning
+# ---------------------------------------------------------------------------
+
+
+class DatasetPinMiddleware:
+    """Pin each HTTP request to the dataset current when it arrives.
+
+    Requests that arrive before the first dataset is loaded are not pinned
+    and report whichever version their loaders loaded.
+
+    Args:
+        app: The wrapped ASGI application.
+        registry: Registry whose current dataset is pinned.
+    """
+
+    def __init__(self, app: ASGIApp, registry: DatasetRegistry) -> None:
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        dataset = self.registry.current
+
+        async def send_with_version(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                served = dataset or self.registry.current
+                if served is not None:
+                    MutableHeaders(scope=message)[VERSION_HEADER] = served.version
+            await send(message)
+
+        token = _pinned.set(dataset)
+        try:
+            await self.app(scope, receive, send_with_version)
+        finally:
+            _pinned.reset(token)
+
+
+# ---------------------------------------------------------------------------
+# Reload triggers
+# ---------------------------------------------------------------------------
+
+
+async def reload_datasets(registry: DatasetRegistry) -> None:
+    """Reload in a worker thread, logging (not raising) a failed build."""
+    try:
+        await asyncio.to_thread(registry.reload)
+    except (OSError, ValueError):
+        pass  # already logged; the previous dataset stays current
+    except Exception:
+        logger.exception("Dataset reload failed unexpectedly")
+
+
+async def watch_datasets(registry: DatasetRegistry, interval: float) -> None:
+    """Reload whenever the source files change, checking every ``interval`` s."""
+    while True:
+        await asyncio.sleep(interval)
+        if await asyncio.to_thread(registry.stale):
+            logger.info("Dataset source files changed — reloading")
+            await reload_datasets(registry)
@@ -8,42 +8,141 @@ all route groups.
 The app is started by uvicorn as specified in the project Dockerfile:
 
     uv run uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload
+
+or, in production, by the preloading multi-worker launcher in app/serve.py:
+
+    uv run python -m app.serve --host 0.0.0.0 --port 8000 --workers 2
 """
 
+import asyncio
 import logging
+import os
+import signal
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 
-from app.config import CHROMA_HOST, CHROMA_PORT, PREDICTIONS_DIR
+from app.cache import (
+    RESULTS_CACHE_CONTROL,
+    STATIC_CACHE_CONTROL,
+    cached_json_response,
+    response_cache,
+)
+from app.config import (
+    CHROMA_HOST,
+    CHROMA_PORT,
+    DATASET_POLL_INTERVAL,
+    PREDICTIONS_DIR,
+)
+from app.datasets import (
+    VERSION_HEADER,
+    DatasetPinMiddleware,
+    reload_datasets,
+    watch_datasets,
+)
 from app.models import (
+    BreakerStats,
+    CacheStats,
     ContactInfo,
+    DatasetStats,
     DataSourceInfo,
     HealthResponse,
     InfoResponse,
+    MetricsResponse,
     ModelMetrics,
+    ReadinessResponse,
+    SimulationStats,
+    SingleFlightStats,
     TeamListItem,
     WinsEvaluationResponse,
 )
-from app.routers import analyze, head_to_head, pool, projections, results
-from app.services import get_all_teams, get_wins_evaluation
+from app.routers import admin, analyze, head_to_head, pool, projections, results
+from app.services import (
+    dataset_fingerprint,
+    dataset_registry,
+    get_all_teams,
+    get_wins_evaluation,
+    load_similar_table,
+    load_similarity_engine,
+    preload_datasets,
+    results_cache,
+    similar_table_size,
+    single_flights,
+    warm_similar_teams,
+)
+from app.simulation import meter as simulation_meter
+from app.vector_store import chroma_breaker, vector_store
 
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
-# Lifespan — startup / shutdown logging
+# Lifespan — startup / shutdown
 # ---------------------------------------------------------------------------
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Log key configuration on startup and confirm clean shutdown."""
+    """Open shared connections on startup and release them on shutdown.
+
+    The ChromaDB client is opened once here and reused by every similar-team
+    lookup, and the in-process similarity index is loaded when configured.
+    A failed connect is not fatal: the API starts without it and the vector
+    store reconnects lazily (with backoff) once ChromaDB is reachable.
+
+    Similar teams for the whole field are loaded from the persisted table or,
+    if there is none, precomputed by a background warmup job so startup is
+    never blocked on ChromaDB.
+
+    Every dataset is loaded before the worker starts accepting requests, and
+    ``GET /ready`` only reports ready once that succeeded.  Under app.serve
+    the datasets were already loaded in the parent, so this is a cache hit.
+    Afterwards the prediction files are reloaded and swapped in atomically on
+    SIGHUP and, unless DATASET_POLL_INTERVAL is 0, whenever they change.
+    """
     logger.info(
         "API starting — ChromaDB: %s:%s | Predictions: %s",
         CHROMA_HOST, CHROMA_PORT, PREDICTIONS_DIR,
     )
+    app.state.datasets = None
+    try:
+        app.state.datasets = await asyncio.to_thread(preload_datasets)
+    except FileNotFoundError:
+        logger.exception("Dataset preload failed — worker will report not ready")
+    await asyncio.to_thread(vector_store.connect)
+    await asyncio.to_thread(load_similarity_engine)
+    if not similar_table_size() and not await asyncio.to_thread(load_similar_table):
+        app.state.similar_teams_warmup = asyncio.create_task(
+            asyncio.to_thread(warm_similar_teams)
+        )
+
+    loop = asyncio.get_running_loop()
+    reloads: set[asyncio.Task] = set()
+
+    def _on_sighup() -> None:
+        logger.info("SIGHUP received — reloading datasets")
+        task = loop.create_task(reload_datasets(dataset_registry))
+        reloads.add(task)
+        task.add_done_callback(reloads.discard)
+
+    try:
+        loop.add_signal_handler(signal.SIGHUP, _on_sighup)
+    except (AttributeError, NotImplementedError, RuntimeError):
+        pass  # no SIGHUP (Windows) or not the main thread
+    watcher = None
+    if DATASET_POLL_INTERVAL > 0:
+        watcher = asyncio.create_task(
+            watch_datasets(dataset_registry, DATASET_POLL_INTERVAL)
+        )
     yield
+    if watcher is not None:
+        watcher.cancel()
+    try:
+        loop.remove_signal_handler(signal.SIGHUP)
+    except (AttributeError, NotImplementedError, RuntimeError):
+        pass
+    vector_store.close()
     logger.info("API shutting down.")
 
 
@@ -75,8 +174,17 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[VERSION_HEADER],
 )
 
+# ---------------------------------------------------------------------------
+# Dataset pinning
+# ---------------------------------------------------------------------------
+
+# Serve every request from the dataset version current when it arrived, and
+# report that version in the X-Dataset-Version header (see app/datasets.py).
+app.add_middleware(DatasetPinMiddleware, registry=dataset_registry)
+
 # ---------------------------------------------------------------------------
 # Routers
 # ---------------------------------------------------------------------------
@@ -88,6 +196,7 @@ app.include_router(pool.router,        prefix="/api")
 app.include_router(projections.router, prefix="/api")
 app.include_router(head_to_head.router,   prefix="/api")
 app.include_router(results.router,        prefix="/api")
+app.include_router(admin.router,          prefix="/api")
 
 # ---------------------------------------------------------------------------
 # Root — health check
@@ -108,6 +217,27 @@ async def root() -> HealthResponse:
     )
 
 
+@app.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    tags=["health"],
+    summary="Readiness check",
+    responses={503: {"description": "Datasets are not loaded yet"}},
+)
+async def ready(request: Request) -> ReadinessResponse:
+    """
+    Readiness endpoint.
+
+    Returns 200 only once this worker has loaded every dataset, so health
+    checks and load balancers never route users to a cold worker.  The
+    answering worker's PID is included to tell workers apart.
+    """
+    datasets = getattr(request.app.state, "datasets", None)
+    if datasets is None:
+        raise HTTPException(status_code=503, detail="Datasets are not loaded.")
+    return ReadinessResponse(status="ready", pid=os.getpid(), **datasets)
+
+
 # ---------------------------------------------------------------------------
 # Info
 # ---------------------------------------------------------------------------
@@ -119,14 +249,23 @@ async def root() -> HealthResponse:
     tags=["teams"],
     summary="List all tournament teams",
 )
-async def teams() -> list[TeamListItem]:
+async def teams(request: Request) -> Response:
     """
     Return every team in the current tournament field, sorted by seed then name.
 
     Used by the frontend to populate the Analyze-page dropdown.
     Only teams with a tournament seed set in the predictions data are included.
+    The team list is precomputed by the team store, so it doubles as the
+    dependency fingerprint for the cached response bytes.
     """
-    return [TeamListItem(**t) for t in get_all_teams()]
+    team_list = get_all_teams()
+    return cached_json_response(
+        request,
+        "teams",
+        (team_list,),
+        lambda: [TeamListItem(**t) for t in team_list],
+        STATIC_CACHE_CONTROL,
+    )
 
 
 @app.get(
@@ -135,14 +274,22 @@ async def teams() -> list[TeamListItem]:
     tags=["info"],
     summary="Project information",
 )
-async def info() -> InfoResponse:
+async def info(request: Request) -> Response:
     """
     Return structured information about the project, model, and data sources.
 
     All values here are static — they describe the model trained for the 2026
     tournament season and the fixed set of data sources used.  The frontend Info
-    page renders these fields directly rather than hard-coding them.
+    page renders these fields directly rather than hard-coding them.  The
+    response has no dependencies, so it is serialized once per process.
     """
+    return cached_json_response(
+        request, "info", (), _build_info, STATIC_CACHE_CONTROL
+    )
+
+
+def _build_info() -> InfoResponse:
+    """Build the static InfoResponse (response-cache miss path)."""
     return InfoResponse(
         project="March Madness Pool Analytics",
         description=(
@@ -188,7 +335,7 @@ async def info() -> InfoResponse:
     tags=["evaluation"],
     summary="Predicted vs actual wins evaluation",
 )
-async def wins_evaluation() -> WinsEvaluationResponse:
+async def wins_evaluation(request: Request) -> Response:
     """
     Compare each team's expected wins (weighted average of the predicted win
     probability distribution) against their actual tournament wins derived from
@@ -198,10 +345,51 @@ async def wins_evaluation() -> WinsEvaluationResponse:
     by seed within each group.  Summary metrics — MAE, bias, and within-one
     percentage — are computed only over fully eliminated teams.
 
-    Results are read fresh on every request so the evaluation updates
-    automatically as new game results are added to results.json.
+    results.json is re-validated on every request and re-parsed only when it
+    has changed, so the evaluation updates automatically as new game results
+    are added without paying a parse on every poll.  The serialized response
+    is cached until either predictions.json or results.json changes.
     """
     try:
-        return get_wins_evaluation()
+        return cached_json_response(
+            request,
+            "wins-evaluation",
+            dataset_fingerprint("predictions", "results"),
+            get_wins_evaluation,
+            RESULTS_CACHE_CONTROL,
+        )
     except FileNotFoundError as exc:
         raise HTTPException(status_code=503, detail=str(exc)) from exc
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+
+@app.get(
+    "/api/metrics",
+    response_model=MetricsResponse,
+    tags=["health"],
+    summary="In-process cache and engine counters",
+)
+async def metrics() -> MetricsResponse:
+    """
+    Return operational counters for this worker process.
+
+    Exposes hit/miss counts for the results.json cache and the pre-serialized
+    response cache so the benefit of caching can be monitored on game days,
+    plus the state and recent transitions of the ChromaDB circuit breaker,
+    the lead/follower counts of each request-coalescing group, the loaded
+    dataset version with its reload counters, and Monte Carlo throughput.
+    """
+    return MetricsResponse(
+        results_cache=CacheStats(**results_cache.stats()),
+        response_cache=CacheStats(**response_cache.stats()),
+        chroma_breaker=BreakerStats(**chroma_breaker.stats()),
+        single_flight=[
+            SingleFlightStats(**flight.stats()) for flight in single_flights.values()
+        ],
+        datasets=DatasetStats(**dataset_registry.stats()),
+        simulation=SimulationStats(**simulation_meter.stats()),
+    )
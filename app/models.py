@@ -6,9 +6,9 @@ the API endpoints.  Using Pydantic ensures automatic validation and clean
 OpenAPI documentation.
 """
 
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 # ---------------------------------------------------------------------------
 # Shared / nested models
@@ -80,6 +80,8 @@ class SimilarTeam(BaseModel):
     seed: int             # Tournament seed (1–16)
     tournament_wins: int  # Number of tournament games that team won
     similarity: float     # Cosine similarity score (0–1); higher is more similar
+    stale: bool = False   # True when served from the last known good result
+                          # because the vector store is unavailable
 
 
 # ---------------------------------------------------------------------------
@@ -119,6 +121,18 @@ class SimilarTeamsResponse(BaseModel):
     similar_teams: list[SimilarTeam]
 
 
+class TeamRecapsResponse(BaseModel):
+    """
+    Response returned by GET /analyze/{team}/recaps.
+
+    Game recaps are stored outside the core team records and read on demand,
+    so they are served by their own endpoint rather than inside TeamAnalysis.
+    """
+
+    team: str           # Canonical team display name
+    recaps: list[str]   # Full-text game recaps for the season, oldest first
+
+
 class TeamListItem(BaseModel):
     """
     Lightweight team descriptor returned by GET /teams.
@@ -138,6 +152,113 @@ class HealthResponse(BaseModel):
     message: str  # Human-readable status message
 
 
+class ReadinessResponse(BaseModel):
+    """Readiness of one worker process, returned by GET /ready."""
+
+    status: str       # "ready" once every dataset is loaded
+    pid: int          # Worker process that answered
+    teams: int        # Team records loaded from predictions.json
+    h2h_teams: int    # Teams in the compiled head-to-head matrix
+    tournaments: int  # Tournament years loaded from results.json
+
+
+# ---------------------------------------------------------------------------
+# Metrics models
+# ---------------------------------------------------------------------------
+
+
+class CacheStats(BaseModel):
+    """Hit/miss counters for one in-process cache."""
+
+    hits: int          # Lookups served from the cached value
+    misses: int        # Lookups that had to rebuild or re-parse
+    hit_ratio: float   # hits / (hits + misses), 0.0 before the first lookup
+
+
+class BreakerTransition(BaseModel):
+    """One circuit-breaker state change."""
+
+    at: float          # Unix timestamp of the change
+    from_state: str    # "closed", "open" or "half_open"
+    to_state: str
+
+
+class BreakerStats(BaseModel):
+    """State and counters for one circuit breaker."""
+
+    state: str                          # "closed", "open" or "half_open"
+    consecutive_failures: int
+    rejected: int                       # Calls refused while open
+    transitions: list[BreakerTransition]  # Most recent changes, oldest first
+
+
+class SingleFlightStats(BaseModel):
+    """Coalescing counters for one single-flight group."""
+
+    name: str       # e.g. "similar-teams", "team-analysis"
+    leads: int      # Calls that started a computation
+    followers: int  # Calls that joined an in-flight computation
+    in_flight: int  # Keys currently being computed
+
+
+class DatasetStats(BaseModel):
+    """Version and reload counters of the dataset registry."""
+
+    version: Optional[str]      # Current dataset version (None before the first load)
+    loaded_at: Optional[float]  # Unix time the current version was built
+    reloads: int                # Successful reloads since startup
+    failures: int               # Reloads rejected by parsing or validation
+    last_error: Optional[str]   # Why the latest reload failed, until one succeeds
+
+
+class SimulationStats(BaseModel):
+    """Monte Carlo throughput counters (see app/simulation.py)."""
+
+    runs: int
+    simulations: int                # Tournaments drawn since startup
+    seconds: float                  # Wall time spent simulating
+    sims_per_second: int            # Overall throughput
+    last_sims_per_second: int       # Throughput of the most recent run
+
+
+class MetricsResponse(BaseModel):
+    """
+    Operational counters returned by GET /api/metrics.
+
+    Counters are per worker process and reset when the process restarts.
+    """
+
+    results_cache: CacheStats   # results.json parse cache
+    response_cache: CacheStats  # Pre-serialized derived-response cache
+    chroma_breaker: BreakerStats  # Circuit breaker around ChromaDB queries
+    single_flight: list[SingleFlightStats]  # Request coalescing per group
+    datasets: DatasetStats      # Loaded dataset version and reloads
+    simulation: SimulationStats  # Monte Carlo runs in this process
+
+
+# ---------------------------------------------------------------------------
+# Admin models
+# ---------------------------------------------------------------------------
+
+
+class SimilarTeamsRefreshResponse(BaseModel):
+    """Response returned by POST /admin/similar-teams/refresh."""
+
+    teams: int            # Teams with a precomputed similar-teams entry
+    missing: list[str]    # Chroma IDs of field teams with no stored embedding
+    source: str           # Engine that computed the table: "chroma" or "numpy"
+
+
+class DatasetReloadResponse(BaseModel):
+    """Response returned by POST /admin/datasets/reload."""
+
+    version: str                     # Version now being served
+    previous_version: Optional[str]  # Version it replaced (None if unchanged)
+    changed: bool                    # False when the files were unchanged
+    teams: int                       # Team records in the current version
+    h2h_teams: int                   # Teams in its head-to-head matrix
+
+
 # ---------------------------------------------------------------------------
 # Info models
 # ---------------------------------------------------------------------------
@@ -227,6 +348,30 @@ class PoolRequest(BaseModel):
     """
 
     teams: list[str]  # Up to 8 team display names
+    # Also return the roster's combined wins: "exact" (bracket DP) or
+    # "simulated" (shared Monte Carlo sample).
+    total_wins: Optional[Literal["exact", "simulated"]] = None
+    target: Optional[float] = None  # Report P(total wins > target)
+    live: bool = False              # Condition on the games played so far
+
+
+class RosterTotalWins(BaseModel):
+    """
+    Distribution of a roster's combined tournament wins.
+
+    Accounts for the bracket: rostered teams that would meet knock each
+    other out, so the total is not a sum of independent distributions.
+    """
+
+    method: str              # "exact" or "simulated"
+    teams: int               # Rostered teams in the tournament field
+    distribution: list[float]  # distribution[k] = P(total wins == k)
+    expected_wins: float
+    std: float
+    quantiles: dict[str, int]  # "p10", "p25", "p50", "p75", "p90" → total wins
+    target: Optional[float] = None
+    beat_target: Optional[float] = None  # P(total wins > target)
+    simulations: Optional[int] = None    # Sample size ("simulated" only)
 
 
 class PoolResponse(BaseModel):
@@ -239,6 +384,58 @@ class PoolResponse(BaseModel):
     """
 
     teams: list[PoolTeamSummary]
+    total_wins: Optional[RosterTotalWins] = None  # Only when requested
+
+
+# Upper bound on rosters per standings request.
+STANDINGS_MAX_ROSTERS = 100_000
+
+
+class StandingsRoster(BaseModel):
+    """One manager's roster in one pool (POST /pools/standings)."""
+
+    pool: str = "default"  # Rosters are ranked against their own pool only
+    manager: str
+    teams: list[str]       # Team display names, as for POST /create-a-team
+
+
+class StandingsRequest(BaseModel):
+    """
+    Request body for POST /pools/standings.
+
+    Any number of pools, each with any number of rosters, up to
+    STANDINGS_MAX_ROSTERS rosters in total.
+    """
+
+    rosters: list[StandingsRoster] = Field(..., max_length=STANDINGS_MAX_ROSTERS)
+    # Simulated tournaments to score (default: the whole shared sample).
+    simulations: Optional[int] = Field(None, ge=1)
+    places: int = Field(3, ge=1, le=20)  # Finishing places to report
+    live: bool = False                   # Condition on the games played so far
+
+
+class StandingsEntry(BaseModel):
+    """One roster's finishing-place odds within its pool."""
+
+    pool: str
+    manager: str
+    teams: int                # Rostered teams in the tournament field
+    pool_size: int
+    place_probabilities: list[float]  # [P(1st), P(2nd), …]; ties share a place
+    expected_rank: float      # 1 = best
+
+
+class StandingsResponse(BaseModel):
+    """
+    Response returned by POST /pools/standings.
+
+    One entry per roster, in request order.  Names that did not resolve to a
+    tournament team are listed once in ``unresolved_teams`` and add no wins.
+    """
+
+    simulations: int
+    rosters: list[StandingsEntry]
+    unresolved_teams: list[str]
 
 
 # ---------------------------------------------------------------------------
@@ -265,6 +462,53 @@ class H2HResponse(BaseModel):
     team2: H2HTeamResult  # Right-side team with its win probability
 
 
+# Upper bound on pairs per batch request — every ordered pair of a 68-team
+# field is 68 × 67 = 4,556, so this comfortably covers any real page.
+H2H_BATCH_MAX_PAIRS = 5000
+
+
+class H2HPair(BaseModel):
+    """One requested matchup in a POST /head-to-head/batch body."""
+
+    team1: str  # Display name of the first (left-side) team
+    team2: str  # Display name of the second (right-side) team
+
+
+class H2HBatchRequest(BaseModel):
+    """
+    Request body for POST /head-to-head/batch.
+
+    Each pair is resolved independently with the same direction semantics as
+    GET /head-to-head (team1 in the result always maps to the requested team1).
+    """
+
+    pairs: list[H2HPair] = Field(..., max_length=H2H_BATCH_MAX_PAIRS)
+
+
+class H2HBatchResult(BaseModel):
+    """
+    Outcome for a single pair in a batch request.
+
+    Exactly one of ``prediction`` and ``error`` is set.  Missing pairs and
+    self-matchups are reported here rather than failing the whole batch.
+    """
+
+    team1: str                              # team1 exactly as requested
+    team2: str                              # team2 exactly as requested
+    prediction: Optional[H2HResponse] = None  # Set when the pair was found
+    error: Optional[str] = None             # Reason the pair could not be resolved
+
+
+class H2HBatchResponse(BaseModel):
+    """
+    Response returned by POST /head-to-head/batch.
+
+    Contains one H2HBatchResult per requested pair, in request order.
+    """
+
+    results: list[H2HBatchResult]
+
+
 # ---------------------------------------------------------------------------
 # Projections models
 # ---------------------------------------------------------------------------
@@ -412,3 +656,69 @@ class ProjectionsResponse(BaseModel):
     two_wins: list[PoolTeamSummary]    # Teams most likely to win exactly 2 games
     one_win: list[PoolTeamSummary]     # Teams most likely to win exactly 1 game
     zero_wins: list[PoolTeamSummary]   # Teams most likely to win 0 games
+
+
+class RoundAdvancement(BaseModel):
+    """Probability of a team reaching each round of the tournament."""
+
+    round_of_64: float   # Below 1 only for First Four teams
+    round_of_32: float
+    sweet_16: float
+    elite_8: float
+    final_four: float
+    championship: float  # Reaches the title game
+    champion: float      # Wins the title
+
+
+class TeamAdvancement(BaseModel):
+    """One team's exact bracket projection."""
+
+    name: str
+    seed: int
+    region: str
+    advancement: RoundAdvancement
+    win_probability_distribution: WinProbabilityDistribution  # 0–6 wins
+    expected_wins: float  # Mean tournament wins (First Four excluded)
+
+
+class AdvancementResponse(BaseModel):
+    """
+    Response returned by GET /projections/advancement.
+
+    Computed exactly from the bracket and the head-to-head probabilities.
+    Teams are sorted by title probability descending, then by name.
+    """
+
+    teams: list[TeamAdvancement]
+
+
+# ---------------------------------------------------------------------------
+# Live projection models
+# ---------------------------------------------------------------------------
+
+
+class LiveTeamProjection(BaseModel):
+    """One team's bracket projection conditioned on the games played so far."""
+
+    name: str
+    seed: int
+    region: str
+    wins: int          # Tournament wins so far (First Four excluded)
+    eliminated: bool
+    advancement: RoundAdvancement  # 1 or 0 for rounds already decided
+    win_probability_distribution: WinProbabilityDistribution  # Final 0–6 wins
+    expected_wins: float  # Mean final wins, including those already earned
+
+
+class LiveProjectionsResponse(BaseModel):
+    """
+    Response returned by GET /projections/live.
+
+    Conditioned on every completed game in results.json.  Teams are sorted
+    by title probability descending, then expected wins descending, then by
+    name.
+    """
+
+    year: Optional[int]  # Tournament year the results come from
+    games_played: int
+    teams: list[LiveTeamProjection]
@@ -0,0 +1,228 @@
+"""
+Offset-indexed sidecar store for per-team game recaps.
+
+Each team record in ``predictions.json`` carries a ``summaries`` list of full
+ESPN game recaps — roughly 90% of the file — that no endpoint needs on the
+hot path.  This module splits them out of the team records into three derived
+files under COMPILED_DIR:
+
+  - ``predictions.core.json``  — the team records with ``summaries`` removed.
+  - ``recaps.bin``             — every team's recap list as a UTF-8 JSON array,
+                                 concatenated back to back.
+  - ``recaps.index.json``      — team name → ``[offset, length]`` into
+                                 ``recaps.bin``, plus the size/mtime of the
+                                 ``predictions.json`` it was compiled from.
+
+The core file is what the API parses at startup; recaps are read on demand
+from a memory-mapped view of ``recaps.bin``, one team slice at a time.
+
+The files are (re)built automatically the first time stale or missing
+sidecars are detected, or ahead of time with:
+
+    uv run python -m app.recaps
+"""
+
+import json
+import logging
+import mmap
+import os
+from pathlib import Path
+from typing import Optional
+
+from app.atomic import write_atomic
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+CORE_FILENAME = "predictions.core.json"
+BLOB_FILENAME = "recaps.bin"
+INDEX_FILENAME = "recaps.index.json"
+
+# ---------------------------------------------------------------------------
+# Recap store
+# ---------------------------------------------------------------------------
+
+
+class RecapStore:
+    """Read-only, offset-indexed access to per-team recap lists.
+
+    The backing buffer is either a memory-mapped ``recaps.bin`` (the normal
+    case, shared through the page cache) or an in-memory ``bytes`` blob when
+    the sidecar could not be written to disk.
+
+    Attributes:
+        offsets: Casefolded team name → ``(offset, length)`` into the buffer.
+    """
+
+    def __init__(self, buffer, offsets: dict[str, tuple[int, int]]) -> None:
+        self._buffer = buffer
+        self.offsets = offsets
+
+    @classmethod
+    def open(cls, blob_path: Path, offsets: dict[str, tuple[int, int]]) -> "RecapStore":
+        """Memory-map ``blob_path`` and wrap it in a store.
+
+        Args:
+            blob_path: Path to a ``recaps.bin`` file.
+            offsets: Team offsets read from the matching index file.
+
+        Returns:
+            A :class:`RecapStore` backed by a read-only memory map.
+        """
+        with open(blob_path, "rb") as fh:
+            # mmap cannot map an empty file; fall back to an empty buffer.
+            if os.fstat(fh.fileno()).st_size == 0:
+                return cls(b"", offsets)
+            buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, offsets)
+
+    def get(self, team_name: str) -> Optional[list[str]]:
+        """Decode and return one team's recap list.
+
+        Args:
+            team_name: Team display name (case-insensitive).
+
+        Returns:
+            List of recap strings, or ``None`` if the team has no entry.
+        """
+        entry = self.offsets.get(team_name.casefold())
+        if entry is None:
+            return None
+        offset, length = entry
+        return json.loads(self._buffer[offset:offset + length])
+
+
+# The store for the currently loaded predictions, set by the loaders below.
+_active_store: Optional[RecapStore] = None
+
+
+def get_active_store() -> Optional[RecapStore]:
+    """Return the recap store paired with the most recently loaded predictions."""
+    return _active_store
+
+
+def set_active_store(store: Optional[RecapStore]) -> None:
+    """Install the recap store for newly loaded predictions (e.g. a snapshot)."""
+    global _active_store
+    _active_store = store
+
+
+# ---------------------------------------------------------------------------
+# Compile / load
+# ---------------------------------------------------------------------------
+
+
+def _source_signature(source: Path) -> dict:
+    """Return the size/mtime fingerprint recorded for a source file."""
+    stat = source.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def split_recaps(
+    teams: list[dict], source: Path, out_dir: Path
+) -> list[dict]:
+    """Strip ``summaries`` from team records and move them into a sidecar.
+
+    Records are modified in place so the parsed recap strings can be freed.
+    The sidecar files are written best-effort: if ``out_dir`` is not writable
+    the recaps are kept in a single in-memory blob instead.
+
+    Args:
+        teams: Raw team dicts freshly parsed from ``source``.
+        source: Path of the ``predictions.json`` the records came from.
+        out_dir: Directory that receives the compiled files.
+
+    Returns:
+        The same ``teams`` list, now without ``summaries`` keys.
+    """
+    global _active_store
+
+    chunks: list[bytes] = []
+    offsets: dict[str, tuple[int, int]] = {}
+    position = 0
+    for team in teams:
+        encoded = json.dumps(
+            team.pop("summaries", None) or [], ensure_ascii=False
+        ).encode("utf-8")
+        offsets.setdefault(team["name"].casefold(), (position, len(encoded)))
+        chunks.append(encoded)
+        position += len(encoded)
+    blob = b"".join(chunks)
+
+    try:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        write_atomic(out_dir / BLOB_FILENAME, blob)
+        write_atomic(
+            out_dir / CORE_FILENAME,
+            json.dumps(teams, ensure_ascii=False).encode("utf-8"),
+        )
+        # The index is written last: it is what marks the sidecar as valid.
+        write_atomic(
+            out_dir / INDEX_FILENAME,
+            json.dumps({
+                "source": _source_signature(source),
+                "teams": {name: list(span) for name, span in offsets.items()},
+            }).encode("utf-8"),
+        )
+        _active_store = RecapStore.open(out_dir / BLOB_FILENAME, offsets)
+        logger.info(
+            "Compiled recap sidecar: %d teams, %d bytes → %s",
+            len(offsets), len(blob), out_dir,
+        )
+    except OSError:
+        logger.warning(
+            "Could not write recap sidecar to %s — keeping recaps in memory",
+            out_dir, exc_info=True,
+        )
+        _active_store = RecapStore(blob, offsets)
+
+    return teams
+
+
+def load_compiled_predictions(source: Path, out_dir: Path) -> Optional[list[dict]]:
+    """Load the compact core records if a fresh sidecar exists for ``source``.
+
+    Args:
+        source: Path of the authoritative ``predictions.json``.
+        out_dir: Directory holding the compiled files.
+
+    Returns:
+        Team records without ``summaries``, or ``None`` when the sidecar is
+        missing, unreadable, or was compiled from a different source file.
+    """
+    global _active_store
+
+    try:
+        index = json.loads((out_dir / INDEX_FILENAME).read_text(encoding="utf-8"))
+        if index.get("source") != _source_signature(source):
+            logger.info("Recap sidecar in %s is stale — recompiling", out_dir)
+            return None
+        teams = json.loads((out_dir / CORE_FILENAME).read_text(encoding="utf-8"))
+        offsets = {name: tuple(span) for name, span in index["teams"].items()}
+        _active_store = RecapStore.open(out_dir / BLOB_FILENAME, offsets)
+    except (OSError, ValueError, KeyError):
+        return None
+
+    return teams
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    """Compile the recap sidecar for the configured predictions file."""
+    from app.config import COMPILED_DIR, PREDICTIONS_DIR
+
+    logging.basicConfig(level=logging.INFO)
+    source = PREDICTIONS_DIR / "predictions.json"
+    teams = json.loads(source.read_text(encoding="utf-8"))
+    split_recaps(teams, source, COMPILED_DIR)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Admin router — operational endpoints guarded by a shared token.
+
+Routes defined in this module
+(router prefix "/admin", global prefix "/api" applied in main.py):
+
+    POST /api/admin/similar-teams/refresh
+        Recompute the similar-teams table for the whole tournament field and
+        persist it, replacing the one built by the startup warmup.
+
+    POST /api/admin/datasets/reload
+        Rebuild the prediction datasets from disk and atomically swap them in
+        for this worker process.
+
+Every route requires the ``X-Admin-Token`` header to match the ADMIN_TOKEN
+environment variable.  While ADMIN_TOKEN is unset the endpoints are disabled.
+"""
+
+import asyncio
+import logging
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+
+from app.config import ADMIN_TOKEN
+from app.models import DatasetReloadResponse, SimilarTeamsRefreshResponse
+from app.services import (
+    CURRENT_YEAR,
+    dataset_registry,
+    get_all_teams,
+    precompute_similar_teams,
+    team_name_to_chroma_id,
+)
+from app.vector_store import VectorStoreUnavailable
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Authentication
+# ---------------------------------------------------------------------------
+
+
+def require_admin_token(
+    x_admin_token: Optional[str] = Header(default=None),
+) -> None:
+    """
+    Reject the request unless it carries the configured admin token.
+
+    Raises:
+        HTTPException 403: If admin endpoints are disabled or the token is
+            missing or wrong.
+    """
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled.")
+    if x_admin_token is None or not secrets.compare_digest(
+        x_admin_token.encode(), ADMIN_TOKEN.encode()
+    ):
+        logger.warning("admin: rejected request with missing or invalid token")
+        raise HTTPException(status_code=403, detail="Invalid admin token.")
+
+
+# ---------------------------------------------------------------------------
+# Router
+# ---------------------------------------------------------------------------
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin_token)],
+)
+
+
+# ---------------------------------------------------------------------------
+# POST /admin/similar-teams/refresh
+# ---------------------------------------------------------------------------
+
+
+@router.post(
+    "/similar-teams/refresh",
+    response_model=SimilarTeamsRefreshResponse,
+    summary="Recompute similar teams for the whole tournament field",
+)
+async def refresh_similar_teams() -> SimilarTeamsRefreshResponse:
+    """
+    Recompute and persist the similar-teams table for every tournament team.
+
+    The batch query runs in a worker thread so the event loop keeps serving
+    other requests while ChromaDB (or the in-process index) is queried.
+
+    Returns:
+        SimilarTeamsRefreshResponse with the number of teams computed, the
+        teams that had no stored embedding, and the engine used.
+
+    Raises:
+        HTTPException 503: If no similarity engine is available.
+    """
+    try:
+        table, source = await asyncio.to_thread(precompute_similar_teams)
+    except VectorStoreUnavailable as exc:
+        logger.error("admin: similar-teams refresh failed: %s", exc)
+        raise HTTPException(
+            status_code=503, detail="No similarity engine is available."
+        ) from exc
+
+    missing = sorted(
+        chroma_id
+        for chroma_id in (
+            team_name_to_chroma_id(t["name"], CURRENT_YEAR) for t in get_all_teams()
+        )
+        if chroma_id not in table
+    )
+    logger.info("admin: refreshed similar teams for %d teams (%s)", len(table), source)
+    return SimilarTeamsRefreshResponse(teams=len(table), missing=missing, source=source)
+
+
+# ---------------------------------------------------------------------------
+# POST /admin/datasets/reload
+# ---------------------------------------------------------------------------
+
+
+@router.post(
+    "/datasets/reload",
+    response_model=DatasetReloadResponse,
+    summary="Reload the prediction datasets without a restart",
+)
+async def reload_datasets(
+    force: bool = Query(False, description="Rebuild even if the files are unchanged"),
+) -> DatasetReloadResponse:
+    """
+    Rebuild predictions, the H2H matrix and their indexes, then swap them in.
+
+    The new version is built and validated in a worker thread while requests
+    keep being served from the current one; requests already in flight finish
+    against the version they started with.  Only the worker process that
+    answers is reloaded — under app.serve, send SIGHUP to the parent to reload
+    every worker.
+
+    Returns:
+        DatasetReloadResponse with the version now served and the one it
+        replaced.
+
+    Raises:
+        HTTPException 422: If the new files fail to parse or validate (the
+            current version keeps being served).
+        HTTPException 503: If predictions.json is missing.
+    """
+    try:
+        current, previous = await asyncio.to_thread(dataset_registry.reload, force)
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=422, detail=f"Dataset validation failed: {exc}"
+        ) from exc
+
+    changed = current is not previous
+    logger.info("admin: dataset reload → %s (changed=%s)", current.version, changed)
+    matrix = current.h2h_matrix
+    return DatasetReloadResponse(
+        version=current.version,
+        previous_version=previous.version if changed and previous else None,
+        changed=changed,
+        teams=len(current.team_store.by_id),
+        h2h_teams=len(matrix.names) if matrix is not None else 0,
+    )
@@ -7,6 +7,10 @@ Routes defined in this module
     GET /api/analyze/most-similar/{team}
         Query ChromaDB for the 3 most similar historical teams to the given team.
 
+    GET /api/analyze/{team}/recaps
+        Return the team's season game recaps, read on demand from the recap
+        sidecar rather than kept in the core team records.
+
     GET /api/analyze/{team}
         Load team data from the predictions JSON and return a full TeamAnalysis,
         including similar_teams populated from ChromaDB.
@@ -18,10 +22,25 @@ wildcard route (/{team}) so that FastAPI does not accidentally swallow
 
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
 
-from app.models import SimilarTeamsResponse, TeamAnalysis
-from app.services import build_team_analysis, find_team, get_similar_teams
+from app.cache import (
+    REVALIDATE_CACHE_CONTROL,
+    STATIC_CACHE_CONTROL,
+    CachedResponse,
+    json_response,
+    response_cache,
+)
+from app.models import SimilarTeamsResponse, TeamAnalysis, TeamRecapsResponse
+from app.services import (
+    analysis_flight,
+    build_team_analysis,
+    dataset_registry,
+    find_team,
+    get_similar_teams,
+    get_team_recaps,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -65,11 +84,49 @@ async def get_most_similar(team: str) -> SimilarTeamsResponse:
         logger.warning("most-similar: team not found — '%s'", team)
         raise HTTPException(status_code=404, detail=f"Team '{team}' not found.")
 
-    # Query ChromaDB for the 3 most similar historical teams.
-    similar = get_similar_teams(team)
+    # Query ChromaDB for the 3 most similar historical teams (keyed by the
+    # canonical name, so aliases resolve to the same neighbours).
+    similar = await get_similar_teams(team_data["name"])
     return SimilarTeamsResponse(team=team_data["name"], similar_teams=similar)
 
 
+# ---------------------------------------------------------------------------
+# GET /analyze/{team}/recaps
+# ---------------------------------------------------------------------------
+
+
+@router.get(
+    "/{team}/recaps",
+    response_model=TeamRecapsResponse,
+    summary="Get the season's game recaps for a team",
+)
+async def get_recaps(team: str) -> TeamRecapsResponse:
+    """
+    Return the full-text game recaps for a team's season.
+
+    Recaps are roughly 90% of the predictions data, so they are kept out of
+    the in-memory team records and read from a memory-mapped sidecar file
+    only when this endpoint is called.
+
+    Args:
+        team: URL-decoded team name (e.g. "Duke" or "North Carolina").
+
+    Returns:
+        TeamRecapsResponse with the canonical team name and its recaps.
+
+    Raises:
+        HTTPException 404: If the team is not found in the predictions data.
+    """
+    team_data = find_team(team)
+    if team_data is None:
+        logger.warning("recaps: team not found — '%s'", team)
+        raise HTTPException(status_code=404, detail=f"Team '{team}' not found.")
+
+    return TeamRecapsResponse(
+        team=team_data["name"], recaps=get_team_recaps(team_data["name"]) or []
+    )
+
+
 # ---------------------------------------------------------------------------
 # GET /analyze/{team}
 # ---------------------------------------------------------------------------
@@ -80,7 +137,7 @@ async def get_most_similar(team: str) -> SimilarTeamsResponse:
     response_model=TeamAnalysis,
     summary="Get full team analysis",
 )
-async def get_team_analysis(team: str) -> TeamAnalysis:
+async def get_team_analysis(team: str, request: Request) -> Response:
     """
     Return the complete analysis profile for a given NCAA tournament team.
 
@@ -91,6 +148,13 @@ async def get_team_analysis(team: str) -> TeamAnalysis:
       - Pre-calculated win-probability distribution (0 / 1 / 2+ wins)
       - The 3 most similar historical teams from ChromaDB (empty if unavailable).
 
+    The serialized (and pre-compressed) profile is cached per team until the
+    team record or its similar teams change, and carries a strong ETag so
+    unchanged profiles are answered with 304.  A profile whose similar teams
+    are missing or stale (ChromaDB unavailable) is marked no-cache so clients
+    pick up the full profile once it recovers.  Concurrent requests for the
+    same team share one lookup and build (:data:`analysis_flight`).
+
     Args:
         team: URL-decoded team name (e.g. "Duke" or "North Carolina").
 
@@ -106,6 +170,35 @@ async def get_team_analysis(team: str) -> TeamAnalysis:
         logger.warning("analyze: team not found — '%s'", team)
         raise HTTPException(status_code=404, detail=f"Team '{team}' not found.")
 
+    # Requests pinned to different dataset versions must not share a build.
+    dataset = dataset_registry.peek()
+    entry, fresh = await analysis_flight.do(
+        (team_data["name"], dataset.version if dataset is not None else None),
+        lambda: _build_analysis_entry(team_data),
+    )
+    return json_response(
+        request,
+        entry.body,
+        entry.etag,
+        STATIC_CACHE_CONTROL if fresh else REVALIDATE_CACHE_CONTROL,
+        entry.variants,
+    )
+
+
+async def _build_analysis_entry(team_data: dict) -> tuple[CachedResponse, bool]:
+    """
+    Fetch similar teams and return the cached TeamAnalysis body for a team.
+
+    Returns:
+        ``(entry, fresh)`` where ``fresh`` is False when the similar teams are
+        missing or stale.
+    """
     # Query ChromaDB for the 3 most similar historical teams.
-    similar = get_similar_teams(team)
-    return build_team_analysis(team_data, similar=similar)
+    similar = await get_similar_teams(team_data["name"])
+    fresh = bool(similar) and not any(t.stale for t in similar)
+    entry = response_cache.get(
+        ("analyze", team_data["name"]),
+        (team_data, tuple(similar)),
+        lambda: build_team_analysis(team_data, similar=similar),
+    )
+    return entry, fresh
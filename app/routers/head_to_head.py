@@ -6,14 +6,18 @@ Routes defined in this module (no prefix applied — registered at root in main.
     GET /head-to-head?team1=<name>&team2=<name>
         Return the predicted win probabilities for a matchup between two
         tournament teams, sourced from the pre-calculated h2h-predictions.json.
+
+    POST /head-to-head/batch
+        Resolve many matchups in one request.  Missing pairs and self-matchups
+        are reported inline per pair instead of failing the whole batch.
 """
 
 import logging
 
 from fastapi import APIRouter, HTTPException, Query
 
-from app.models import H2HResponse
-from app.services import get_h2h_prediction
+from app.models import H2HBatchRequest, H2HBatchResponse, H2HResponse
+from app.services import get_h2h_batch, get_h2h_prediction
 
 logger = logging.getLogger(__name__)
 
@@ -79,3 +83,38 @@ async def head_to_head(
         result.team2.name, result.team2.win_probability,
     )
     return result
+
+
+# ---------------------------------------------------------------------------
+# POST /head-to-head/batch
+# ---------------------------------------------------------------------------
+
+
+@router.post(
+    "/head-to-head/batch",
+    response_model=H2HBatchResponse,
+    summary="Get head-to-head win probabilities for many pairs at once",
+)
+async def head_to_head_batch(request: H2HBatchRequest) -> H2HBatchResponse:
+    """
+    Return predicted win probabilities for a list of matchups in one response.
+
+    Replaces a fan-out of GET /head-to-head calls (e.g. the Projections page's
+    upset candidates) with a single round-trip.  Every pair keeps the
+    single-pair direction semantics: ``prediction.team1`` is always the pair's
+    requested ``team1``.  Pairs that cannot be resolved — unknown teams, no
+    stored prediction, or a team matched against itself — carry an ``error``
+    message instead of a prediction, and the rest of the batch still succeeds.
+
+    Args:
+        request: JSON body containing a ``pairs`` list of ``{team1, team2}``.
+
+    Returns:
+        H2HBatchResponse with one result per requested pair, in request order.
+    """
+    results = get_h2h_batch(request.pairs)
+    missing = sum(1 for r in results if r.prediction is None)
+    logger.info(
+        "head-to-head batch: %d pair(s), %d unresolved", len(results), missing
+    )
+    return H2HBatchResponse(results=results)
@@ -1,23 +1,36 @@
 """
-Pool router — handles the /create-a-team endpoint for the Create a Team page.
+Pool router — handles /create-a-team for the Create a Team page and bulk
+/pools/standings for running many pools at once.
 
 Routes defined in this module (no prefix applied — registered at root in main.py):
 
     POST /create-a-team
         Accept a list of up to 8 team names and return lightweight pool
-        summaries for each team found in the predictions data.
+        summaries for each team found in the predictions data, plus
+        (optionally) the distribution of the roster's combined wins.
+
+    POST /pools/standings
+        Accept up to 100,000 rosters across any number of pools and return
+        each roster's finishing-place probabilities and expected rank within
+        its pool, against the shared simulated tournaments.
 
 Teams not found in the predictions data are silently omitted from the
 response rather than raising a 404, so a partially-valid pool request
 still returns useful data for the teams that do exist.
 """
 
+import asyncio
 import logging
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 
-from app.models import PoolRequest, PoolResponse
-from app.services import build_pool_team_summary, find_team
+from app.models import PoolRequest, PoolResponse, StandingsRequest, StandingsResponse
+from app.services import (
+    build_pool_team_summary,
+    find_team,
+    get_pool_standings,
+    get_roster_total_wins,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -50,13 +63,24 @@ async def analyze_pool(request: PoolRequest) -> PoolResponse:
     The returned list preserves the same order as the request list (minus any
     skipped teams), allowing the frontend to correlate results with slots.
 
+    With ``total_wins`` set, the response also carries the distribution of
+    the roster's combined wins.  It accounts for shared bracket paths (two
+    rostered teams that would meet cannot both win).  It comes with
+    quantiles and, given ``target``, the probability of beating that total.
+
     Args:
-        request: JSON body containing a ``teams`` list of display names.
+        request: JSON body containing a ``teams`` list of display names and
+            the optional ``total_wins``, ``target`` and ``live`` settings.
 
     Returns:
         PoolResponse with one PoolTeamSummary per successfully resolved team.
+
+    Raises:
+        HTTPException 503: If the combined wins were requested but the
+            bracket or H2H data is unavailable.
     """
-    # Resolve each team name against the predictions JSON.
+    # Resolve each team name through the indexed team store (O(1) per name,
+    # case-insensitive, alias-aware).
     summaries = []
     for name in request.teams:
         team_data = find_team(name)
@@ -69,4 +93,59 @@ async def analyze_pool(request: PoolRequest) -> PoolResponse:
     logger.info(
         "pool: resolved %d / %d teams", len(summaries), len(request.teams)
     )
-    return PoolResponse(teams=summaries)
+    total_wins = None
+    if request.total_wins is not None:
+        try:
+            total_wins = await asyncio.to_thread(
+                get_roster_total_wins,
+                request.teams,
+                request.total_wins,
+                request.target,
+                request.live,
+            )
+        except (FileNotFoundError, ValueError) as exc:
+            logger.error("pool: total wins unavailable — %s", exc)
+            raise HTTPException(status_code=503, detail=str(exc)) from exc
+    return PoolResponse(teams=summaries, total_wins=total_wins)
+
+
+# ---------------------------------------------------------------------------
+# POST /pools/standings
+# ---------------------------------------------------------------------------
+
+
+@router.post(
+    "/pools/standings",
+    response_model=StandingsResponse,
+    summary="Get finishing-place odds for many rosters across pools",
+)
+async def pool_standings(request: StandingsRequest) -> StandingsResponse:
+    """
+    Return each roster's finishing-place probabilities within its pool.
+
+    Every roster is scored against the same simulated tournaments, so the
+    rosters of a pool are ranked against each other tournament by tournament.
+    Tied rosters share the better place.  The whole request is scored in
+    bulk; 100,000 rosters against 10,000 tournaments takes tens of seconds
+    on one core.
+
+    Args:
+        request: JSON body with the ``rosters`` (pool, manager, teams) and
+            the optional ``simulations``, ``places`` and ``live`` settings.
+
+    Returns:
+        StandingsResponse with one entry per roster, in request order.
+
+    Raises:
+        HTTPException 503: If the bracket or H2H data is unavailable.
+    """
+    try:
+        response = await asyncio.to_thread(get_pool_standings, request)
+    except (FileNotFoundError, ValueError) as exc:
+        logger.error("pool standings: unavailable — %s", exc)
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+    logger.info(
+        "pool standings: %d rosters × %d tournaments",
+        len(response.rosters), response.simulations,
+    )
+    return response
@@ -7,14 +7,37 @@ Routes defined in this module (no prefix applied — registered at root in main.
         Return all tournament teams grouped by their most likely win outcome
         (2+, 1, or 0 games won).  Within each group teams are ranked by their
         win-bucket probability descending, with alphabetical tie-breaking.
+
+    GET /projections/advancement
+        Return every team's exact probability of reaching each round, and its
+        0–6 win distribution, computed from the bracket and H2H matrix.
+
+    GET /projections/live
+        The same projections conditioned on every completed game in
+        results.json, with wins already earned included.
 """
 
 import logging
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
 
-from app.models import ProjectionsResponse
-from app.services import get_projections
+from app.cache import (
+    RESULTS_CACHE_CONTROL,
+    STATIC_CACHE_CONTROL,
+    cached_json_response,
+)
+from app.models import (
+    AdvancementResponse,
+    LiveProjectionsResponse,
+    ProjectionsResponse,
+)
+from app.services import (
+    dataset_fingerprint,
+    get_advancement,
+    get_live_projections,
+    get_projections,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +58,7 @@ router = APIRouter(tags=["projections"])
     response_model=ProjectionsResponse,
     summary="Get projections for all tournament teams",
 )
-async def projections() -> ProjectionsResponse:
+async def projections(request: Request) -> Response:
     """
     Return all tournament teams grouped by their expected win outcome.
 
@@ -45,10 +68,24 @@ async def projections() -> ProjectionsResponse:
     section is the team most likely to achieve that outcome.  Alphabetical
     order by name breaks any probability ties.
 
+    The serialized response is cached and only rebuilt when the predictions
+    data changes; clients revalidate it with the returned ETag.
+
     Returns:
         ProjectionsResponse with three ranked lists: two_wins, one_win,
         and zero_wins.
     """
+    return cached_json_response(
+        request,
+        "projections",
+        dataset_fingerprint("predictions"),
+        _build_projections,
+        STATIC_CACHE_CONTROL,
+    )
+
+
+def _build_projections() -> ProjectionsResponse:
+    """Build the ProjectionsResponse from scratch (response-cache miss path)."""
     rankings = get_projections()
     logger.info(
         "projections: %d six-win, %d five-win, %d four-win, %d three-win, "
@@ -62,3 +99,84 @@ async def projections() -> ProjectionsResponse:
         len(rankings["zero_wins"]),
     )
     return ProjectionsResponse(**rankings)
+
+
+# ---------------------------------------------------------------------------
+# GET /projections/advancement
+# ---------------------------------------------------------------------------
+
+
+@router.get(
+    "/projections/advancement",
+    response_model=AdvancementResponse,
+    summary="Get exact round-by-round advancement probabilities",
+)
+async def advancement(request: Request) -> Response:
+    """
+    Return every team's probability of reaching each round of the bracket.
+
+    Probabilities are computed exactly by dynamic programming over the
+    bracket tree (slot order from most-likely-bracket.json) using the
+    head-to-head win probabilities, and the 0–6 win distribution follows
+    from them.  The response is cached until the predictions, H2H or bracket
+    file changes.
+
+    Returns:
+        AdvancementResponse with one entry per team in the field.
+
+    Raises:
+        HTTPException 503: If a data file is missing or the bracket cannot be
+            built from it.
+    """
+    try:
+        return cached_json_response(
+            request,
+            "projections-advancement",
+            dataset_fingerprint("predictions", "h2h", "bracket"),
+            get_advancement,
+            STATIC_CACHE_CONTROL,
+        )
+    except (FileNotFoundError, ValueError) as exc:
+        logger.error("projections/advancement: %s", exc)
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+
+
+# ---------------------------------------------------------------------------
+# GET /projections/live
+# ---------------------------------------------------------------------------
+
+
+@router.get(
+    "/projections/live",
+    response_model=LiveProjectionsResponse,
+    summary="Get advancement probabilities conditioned on games played",
+)
+async def live(request: Request) -> Response:
+    """
+    Return every team's projection given the results so far.
+
+    Each completed game in results.json fixes its winner (and the winner's
+    earlier games).  The remaining games are projected exactly as in
+    /projections/advancement.  A results update only recomputes the
+    sub-brackets containing the new games, and the response is cached until
+    the results, predictions, H2H or bracket file changes.  It is sent with
+    the short results max-age.
+
+    Returns:
+        LiveProjectionsResponse with one entry per team in the field.
+
+    Raises:
+        HTTPException 503: If a data file is missing, or the bracket or
+            results cannot be reconciled.
+    """
+    try:
+        return cached_json_response(
+            request,
+            "projections-live",
+            dataset_fingerprint("predictions", "h2h", "bracket", "results"),
+            get_live_projections,
+            RESULTS_CACHE_CONTROL,
+        )
+    except (FileNotFoundError, ValueError) as exc:
+        logger.error("projections/live: %s", exc)
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
@@ -11,10 +11,12 @@ Routes defined in this module:
 
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
 
+from app.cache import RESULTS_CACHE_CONTROL, cached_json_response
 from app.models import ResultsResponse
-from app.services import get_results
+from app.services import dataset_fingerprint, get_results
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +37,7 @@ router = APIRouter(tags=["results"])
     response_model=ResultsResponse,
     summary="Get tournament model results by year and round",
 )
-async def results() -> ResultsResponse:
+async def results(request: Request) -> Response:
     """
     Return all tracked tournament results grouped by year and round.
 
@@ -45,6 +47,10 @@ async def results() -> ResultsResponse:
     both teams (name, seed, score), the winner, and whether the model's
     pre-tournament prediction was correct.
 
+    The serialized response is cached and only rebuilt when results.json or
+    the head-to-head predictions change.  It is sent with a short max-age and
+    stale-while-revalidate, since results are updated while games are played.
+
     Returns:
         ResultsResponse with a list of ResultsTournament objects.
 
@@ -52,7 +58,13 @@ async def results() -> ResultsResponse:
         HTTPException 503: If the results data file is missing or unreadable.
     """
     try:
-        response = get_results()
+        return cached_json_response(
+            request,
+            "results",
+            dataset_fingerprint("results", "h2h"),
+            _build_results,
+            RESULTS_CACHE_CONTROL,
+        )
     except FileNotFoundError as exc:
         logger.error("Results data file not found: %s", exc)
         raise HTTPException(
@@ -60,6 +72,11 @@ async def results() -> ResultsResponse:
             detail="Tournament results data is not available.",
         ) from exc
 
+
+def _build_results() -> ResultsResponse:
+    """Build the ResultsResponse from scratch (response-cache miss path)."""
+    response = get_results()
+
     # Log a brief summary of how many games are tracked across all years.
     total_games = sum(
         len(r.games)
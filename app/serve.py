@@ -0,0 +1,265 @@
+"""
+Multi-worker launcher that shares preloaded datasets between workers.
+
+``uvicorn --workers N`` spawns fresh interpreters, so every worker parses
+predictions.json, builds the H2H matrix, loads the similarity index and
+similar-teams table on its own, holding N private copies.  This launcher
+loads all of them once in a parent process and then forks the workers, which
+inherit the loaded objects copy-on-write.  Before forking the parent runs a
+full collection and ``gc.freeze()``, which moves every live object into the
+permanent generation so the workers' collector never touches (and dirties)
+the pages holding them.  Snapshot-backed records (see app/snapshot.py) live
+in a read-only memory map and are shared regardless.
+
+Usage:
+    python -m app.serve --host 0.0.0.0 --port 8000 --workers 2
+
+The listening socket is bound by the parent and inherited by every worker.
+The parent only supervises: it restarts workers that exit unexpectedly,
+forwards SIGTERM/SIGINT to them on shutdown, and on SIGHUP compiles the
+dataset snapshot for the new files itself before signalling every worker to
+reload (see app/datasets.py), so the workers only open the fresh snapshot
+instead of each parsing the JSON and compiling it.  Reloaded datasets are
+built in each worker after the fork, so only their snapshot-backed parts
+(mapped from the page cache) stay shared; the rest is no longer shared
+copy-on-write with the parent.  Each worker still runs the app lifespan
+(ChromaDB is connected per worker, never across a fork) and answers
+``GET /ready`` only once its datasets are loaded.
+
+With ``--workers 1``, or where ``os.fork`` is unavailable, the app is served
+in-process.
+"""
+
+import argparse
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Optional
+
+from app.config import SIMILARITY_ENGINE, SIMILARITY_FALLBACK, WEB_CONCURRENCY
+
+logger = logging.getLogger(__name__)
+
+# A worker that dies sooner than this after starting is restarted only after
+# RESTART_DELAY seconds, so a worker that crashes on startup does not spin.
+MIN_WORKER_UPTIME = 5.0
+RESTART_DELAY = 1.0
+
+# ---------------------------------------------------------------------------
+# Preloading
+# ---------------------------------------------------------------------------
+
+
+def preload() -> dict[str, int]:
+    """Load every dataset and index this process can share with its workers.
+
+    Only file-backed data is loaded; nothing here opens a network connection
+    or starts a thread, since neither survives a fork.
+
+    Returns:
+        Dataset sizes from :func:`app.services.preload_datasets`, plus
+        ``similar_teams`` (teams in the precomputed similar-teams table).
+
+    Raises:
+        FileNotFoundError: If predictions.json is missing.
+    """
+    from app.services import load_similar_table, preload_datasets
+    from app.similarity import load_similarity_index
+
+    counts = preload_datasets()
+    if SIMILARITY_ENGINE == "numpy" or SIMILARITY_FALLBACK:
+        load_similarity_index()
+    counts["similar_teams"] = load_similar_table()
+    return counts
+
+
+def freeze_heap() -> None:
+    """Collect garbage and move every surviving object to the permanent generation.
+
+    Frozen objects are never traversed by later collections, so forked
+    workers do not write to the shared pages that hold them.
+    """
+    gc.collect()
+    gc.freeze()
+    logger.info("Froze %d objects before forking workers", gc.get_freeze_count())
+
+
+def reload_workers(pids: list[int]) -> None:
+    """Compile the dataset snapshot once, then send SIGHUP to every worker.
+
+    Workers that reload afterwards find a snapshot compiled from the current
+    files and just open it.  If compiling fails the workers are signalled
+    anyway and fall back to loading the files on their own.
+    """
+    from app.services import load_dataset_snapshot
+
+    try:
+        load_dataset_snapshot()
+    except Exception:
+        logger.exception("Could not compile the dataset snapshot before reloading")
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGHUP)
+        except ProcessLookupError:
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Workers
+# ---------------------------------------------------------------------------
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    """Bind and listen on ``host:port`` in a socket workers can inherit."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(sock: socket.socket, log_level: str) -> None:
+    """Serve the app on the inherited socket until told to stop."""
+    import uvicorn
+
+    from app.main import app
+
+    config = uvicorn.Config(app, log_level=log_level)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def _spawn(sock: socket.socket, log_level: str) -> int:
+    """Fork one worker and return its PID."""
+    pid = os.fork()
+    if pid == 0:
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, signal.SIG_DFL)
+        # Ignored until the app lifespan installs the reload handler, so a
+        # reload signalled while the worker is still starting cannot kill it.
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        code = 0
+        try:
+            _run_worker(sock, log_level)
+        except BaseException:
+            logger.exception("Worker %d failed", os.getpid())
+            code = 1
+        finally:
+            os._exit(code)
+    logger.info("Started worker %d", pid)
+    return pid
+
+
+def supervise(sock: socket.socket, workers: int, log_level: str) -> int:
+    """Run ``workers`` forked workers until SIGTERM or SIGINT.
+
+    Workers that exit on their own are replaced.  On a stop signal the
+    parent forwards it to every worker and waits for them to finish their
+    graceful shutdown.  SIGHUP triggers :func:`reload_workers`; a SIGHUP that
+    arrives while it runs makes it run once more afterwards.
+
+    Returns:
+        Process exit status.
+    """
+    started: dict[int, float] = {}
+    stopping = False
+    reloading = reload_again = False
+
+    def _stop(signum: int, frame: Optional[object]) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(started):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def _reload(signum: int, frame: Optional[object]) -> None:
+        nonlocal reloading, reload_again
+        if reloading:
+            # The snapshot lock is not re-entrant; rerun once the current
+            # reload has finished instead of nesting one inside it.
+            reload_again = True
+            return
+        reloading = True
+        try:
+            while True:
+                reload_again = False
+                reload_workers(list(started))
+                if not reload_again or stopping:
+                    break
+        finally:
+            reloading = False
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+    signal.signal(signal.SIGHUP, _reload)
+
+    for _ in range(workers):
+        started[_spawn(sock, log_level)] = time.monotonic()
+
+    while started:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        uptime = time.monotonic() - started.pop(pid, 0.0)
+        if stopping:
+            continue
+        logger.warning(
+            "Worker %d exited with status %d; restarting",
+            pid, os.waitstatus_to_exitcode(status),
+        )
+        if uptime < MIN_WORKER_UPTIME:
+            time.sleep(RESTART_DELAY)
+        if not stopping:
+            started[_spawn(sock, log_level)] = time.monotonic()
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers", type=int, default=WEB_CONCURRENCY,
+        help="Worker processes (default: WEB_CONCURRENCY, %(default)s)",
+    )
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=args.log_level.upper(),
+        format="%(asctime)s %(process)d %(levelname)s %(name)s: %(message)s",
+    )
+
+    if args.workers <= 1 or not hasattr(os, "fork"):
+        import uvicorn
+
+        uvicorn.run("app.main:app", host=args.host, port=args.port,
+                    log_level=args.log_level)
+        return 0
+
+    import app.main  # noqa: F401  # import the whole app before forking
+
+    try:
+        logger.info("Preloaded datasets: %s", preload())
+    except FileNotFoundError:
+        logger.exception("Dataset preload failed — workers will load on their own")
+    sock = bind_socket(args.host, args.port)
+    freeze_heap()
+    return supervise(sock, args.workers, args.log_level)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
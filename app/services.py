@@ -2,23 +2,58 @@
 Business-logic services for the March Madness Pool Analytics API.
 
 Provides helpers for:
-  - Loading and caching the predictions JSON from disk.
+  - Loading and caching the predictions JSON from disk, via a memory-mapped
+    binary snapshot when one can be compiled.
+  - Indexing team records for O(1) name, alias, and team_id resolution.
   - Building Pydantic response models from raw JSON data.
+  - Compiling head-to-head predictions into a dense O(1) lookup matrix.
   - Querying ChromaDB for the most similar historical teams.
   - Returning a flat sorted team list for the frontend dropdown.
 """
 
+import asyncio
 import json
 import logging
-from functools import lru_cache
-from typing import Optional
-
-import chromadb
-
-from app.config import CHROMA_COLLECTION, CHROMA_HOST, CHROMA_PORT, PREDICTIONS_DIR
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from typing import Awaitable, Callable, Hashable, Mapping, Optional, TypeVar
+
+import numpy as np
+
+from app import recaps, simulation, snapshot
+from app.atomic import file_lock, write_atomic
+from app.bracket import (
+    ROUND_NAMES,
+    BracketEngine,
+    LiveBracket,
+    fix_results,
+    layout_from_bracket,
+)
+from app.config import (
+    COMPILED_DIR,
+    POOL_SIMULATIONS,
+    PREDICTIONS_DIR,
+    SIMILAR_TEAMS_FILE,
+    SIMILARITY_ENGINE,
+    SIMILARITY_FALLBACK,
+    SIMILARITY_TIMEOUT,
+    SIMILARITY_WORKERS,
+    SIMULATION_SEED,
+    VECTORS_FILE,
+)
+from app.datasets import Dataset, DatasetRegistry
 from app.models import (
+    AdvancementResponse,
+    H2HBatchResult,
+    H2HPair,
     H2HResponse,
     H2HTeamResult,
+    LiveProjectionsResponse,
+    LiveTeamProjection,
     PlayerProfile,
     PoolTeamSummary,
     ResultsGame,
@@ -26,7 +61,13 @@ from app.models import (
     ResultsRound,
     ResultsTeamEntry,
     ResultsTournament,
+    RosterTotalWins,
+    RoundAdvancement,
     SimilarTeam,
+    StandingsEntry,
+    StandingsRequest,
+    StandingsResponse,
+    TeamAdvancement,
     TeamAnalysis,
     TeamStats,
     WinProbabilityDistribution,
@@ -34,6 +75,13 @@ from app.models import (
     WinsEvaluationResponse,
     WinsEvaluationSummary,
 )
+from app.similarity import (
+    SimilarityIndex,
+    get_similarity_index,
+    load_similarity_index,
+)
+from app.standings import pool_standings
+from app.vector_store import VectorStoreUnavailable, chroma_breaker, vector_store
 
 # Module-level logger — output is captured by uvicorn and visible in docker logs.
 logger = logging.getLogger(__name__)
@@ -55,34 +103,219 @@ POSITION_LABELS: dict[int, str] = {
 # Year of the current-season predictions file (update each year).
 CURRENT_YEAR: int = 2026
 
+# Alternate spellings of team names, seeded from the ALIASES map in
+# scripts/download_logos.py.  Each pair is treated as equivalent in both
+# directions: whichever spelling the loaded data uses is canonical and the
+# other resolves to it.
+TEAM_ALIASES: dict[str, str] = {
+    "American University": "American",
+    "Appalachian State": "App State",
+    "IUPUI": "IU Indianapolis",
+    "Loyola (IL)": "Loyola Chicago",
+    "Loyola (MD)": "Loyola Maryland",
+    "Maryland-Eastern Shore": "Maryland Eastern Shore",
+    "McNeese": "McNeese State",
+    "Miami (FL)": "Miami",
+    "Nicholls": "Nicholls State",
+    "Pennsylvania": "Penn",
+    "Queens University": "Queens",
+    "Sam Houston": "Sam Houston State",
+    "San José State": "San Jose State",
+    "SE Louisiana": "Southeastern Louisiana",
+    "Seattle U": "Seattle",
+    "St. Thomas-Minnesota": "St. Thomas",
+    "Texas A&M-Commerce": "East Texas A&M",
+    "UAlbany": "Albany",
+    "UCF": "Central Florida",
+}
+
+# Casefolded alias → casefolded counterpart, covering both directions.
+_ALIAS_LOOKUP: dict[str, str] = {
+    **{a.casefold(): b.casefold() for a, b in TEAM_ALIASES.items()},
+    **{b.casefold(): a.casefold() for a, b in TEAM_ALIASES.items()},
+}
+
 # ---------------------------------------------------------------------------
 # Predictions data loading
 # ---------------------------------------------------------------------------
 
 
-@lru_cache(maxsize=1)
 def load_predictions() -> list[dict]:
-    """Load and cache the current season's predictions JSON.
+    """Return the current season's team records.
+
+    The records belong to the dataset pinned to the current request by the
+    :data:`dataset_registry`, so a request that started before a reload
+    keeps reading the version it started with.  The first call builds that
+    dataset from ``predictions.json`` in PREDICTIONS_DIR; later edits to the
+    file are picked up by a reload (admin endpoint, SIGHUP or file watcher).
+    Other files in the same directory (e.g. ``results.json``) are ignored so
+    that adding new data files never accidentally replaces the predictions.
 
-    Loads ``predictions.json`` directly from PREDICTIONS_DIR.  Other files in
-    the same directory (e.g. ``results.json``, ``h2h-predictions.json``) are
-    intentionally ignored so that adding new data files never accidentally
-    replaces the team predictions.
+    Records normally come from the memory-mapped dataset snapshot (see
+    :func:`load_dataset_snapshot`) as read-only mappings that behave like the
+    raw dicts.  If no snapshot can be compiled, the JSON is parsed instead,
+    using the recap sidecar under COMPILED_DIR.
+
+    Either way the bulky per-team ``summaries`` (game recaps) are not kept in
+    the returned records; they are read on demand via :func:`get_team_recaps`.
 
     Returns:
-        List of raw team dicts from the predictions JSON.
+        List of team records from the predictions JSON, without
+        ``summaries``.  Callers must not mutate them.
 
     Raises:
-        FileNotFoundError: If ``predictions.json`` does not exist in PREDICTIONS_DIR.
+        FileNotFoundError: If no dataset is loaded yet and ``predictions.json``
+            does not exist in PREDICTIONS_DIR.
+        ValueError: If no dataset is loaded yet and the files are invalid.
     """
-    path = PREDICTIONS_DIR / "predictions.json"
-    if not path.exists():
-        raise FileNotFoundError(f"Predictions file not found: {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
+    return dataset_registry.get().teams
+
+
+def _parse_predictions(path: Path) -> list[dict]:
+    """Parse predictions.json without a snapshot, using the recap sidecar."""
+    teams = recaps.load_compiled_predictions(path, COMPILED_DIR)
+    if teams is None:
+        teams = json.loads(path.read_text(encoding="utf-8"))
+        recaps.split_recaps(teams, path, COMPILED_DIR)
+    return teams
+
+
+def get_team_recaps(name: str) -> Optional[list[str]]:
+    """Return a team's game recaps, read on demand from the recap sidecar.
+
+    Args:
+        name: Team display name or alias (case-insensitive).
+
+    Returns:
+        List of recap strings (possibly empty), or ``None`` if the team is
+        not in the predictions data.
+    """
+    team = find_team(name)
+    if team is None:
+        return None
+    dataset = dataset_registry.peek()
+    if dataset is not None and load_predictions() is dataset.teams:
+        store = dataset.recaps
+    else:
+        store = recaps.get_active_store()
+    if store is None:
+        return []
+    return store.get(team["name"]) or []
+
+
+class TeamStore:
+    """Immutable, indexed view over the loaded team records.
+
+    Built once per loaded predictions list so that name resolution costs a
+    constant amount regardless of field size.  Indexes are read-only mappings;
+    the records themselves are the raw dicts from the predictions JSON and
+    must not be mutated by callers.
+
+    Attributes:
+        by_name: Casefolded display name (and alias) → raw team dict.
+        by_id: ``team_id`` → raw team dict.
+        tournament_teams: ``{"name", "seed"}`` dicts for every seeded team,
+            sorted by seed then name (the ``/api/teams`` payload).
+    """
+
+    __slots__ = ("by_name", "by_id", "tournament_teams")
+
+    def __init__(
+        self,
+        by_name: Mapping[str, dict],
+        by_id: Mapping[str, dict],
+        tournament_teams: list[dict],
+    ) -> None:
+        self.by_name = by_name
+        self.by_id = by_id
+        self.tournament_teams = tournament_teams
+
+    def find(self, name: str) -> Optional[dict]:
+        """Return the team matching a display name or alias (case-insensitive)."""
+        return self.by_name.get(name.casefold())
+
+    def get(self, team_id: str) -> Optional[dict]:
+        """Return the team with the given ``team_id``, or ``None``."""
+        return self.by_id.get(team_id)
+
+
+def build_team_store(teams: list[dict]) -> TeamStore:
+    """Index raw team records into an immutable :class:`TeamStore`.
+
+    When two records share a name or ``team_id`` the first one wins, matching
+    the old linear-scan behaviour of :func:`find_team`.  Aliases from
+    :data:`TEAM_ALIASES` are added only where they do not shadow a real name.
+
+    Args:
+        teams: Raw team dicts as returned by :func:`load_predictions`.
+
+    Returns:
+        Fully indexed :class:`TeamStore`.
+    """
+    by_name: dict[str, dict] = {}
+    by_id: dict[str, dict] = {}
+    for team in teams:
+        by_name.setdefault(team["name"].casefold(), team)
+        if team.get("team_id") is not None:
+            by_id.setdefault(team["team_id"], team)
+
+    # Point each alias at its counterpart when only one spelling is loaded.
+    for alias, target in _ALIAS_LOOKUP.items():
+        if alias not in by_name and target in by_name:
+            by_name[alias] = by_name[target]
+
+    tournament_teams = sorted(
+        (
+            {"name": t["name"], "seed": t["tournament_seed"]}
+            for t in teams
+            if t.get("tournament_seed") is not None
+        ),
+        key=lambda t: (t["seed"], t["name"]),
+    )
+    return TeamStore(
+        MappingProxyType(by_name), MappingProxyType(by_id), tournament_teams
+    )
+
+
+# Most recently built store, paired with the teams list it was built from.
+_team_store_cache: Optional[tuple[list[dict], TeamStore]] = None
+
+
+def get_team_store() -> TeamStore:
+    """Return the :class:`TeamStore` for the currently loaded predictions.
+
+    Records from the registry's dataset come with a store built alongside
+    them.  Any other list (e.g. a patched loader in tests) is indexed on first
+    use and cached on its identity, like :func:`get_h2h_matrix`.
+
+    Returns:
+        The shared :class:`TeamStore`.
+
+    Raises:
+        FileNotFoundError: If ``predictions.json`` does not exist.
+    """
+    global _team_store_cache
+    teams = load_predictions()
+    dataset = dataset_registry.peek()
+    if dataset is not None and teams is dataset.teams:
+        return dataset.team_store
+    cached = _team_store_cache
+    if cached is not None and cached[0] is teams:
+        return cached[1]
+
+    store = build_team_store(teams)
+    _team_store_cache = (teams, store)
+    logger.info(
+        "Built team store: %d teams, %d names", len(store.by_id), len(store.by_name)
+    )
+    return store
 
 
 def find_team(name: str) -> Optional[dict]:
-    """Find a team by display name in the predictions data (case-insensitive).
+    """Find a team by display name or alias in the predictions data.
+
+    Matching is case-insensitive and resolves alternate spellings listed in
+    :data:`TEAM_ALIASES` (e.g. ``"Appalachian State"`` → ``"App State"``).
 
     Args:
         name: Team display name to search for (e.g. ``"Duke"``).
@@ -90,27 +323,20 @@ def find_team(name: str) -> Optional[dict]:
     Returns:
         The raw team dict, or ``None`` if no matching team is found.
     """
-    needle = name.casefold()
-    for team in load_predictions():
-        if team["name"].casefold() == needle:
-            return team
-    return None
+    return get_team_store().find(name)
 
 
 def get_all_teams() -> list[dict]:
     """Return all tournament teams as a flat list sorted by seed then name.
 
-    Only includes teams that have a ``tournament_seed`` value set.
+    Only includes teams that have a ``tournament_seed`` value set.  The list
+    is precomputed by the :class:`TeamStore` and shared between calls, so
+    callers must not mutate it.
 
     Returns:
         List of dicts with keys ``name`` and ``seed``.
     """
-    teams = [
-        {"name": t["name"], "seed": t["tournament_seed"]}
-        for t in load_predictions()
-        if t.get("tournament_seed") is not None
-    ]
-    return sorted(teams, key=lambda t: (t["seed"], t["name"]))
+    return get_team_store().tournament_teams
 
 
 # ---------------------------------------------------------------------------
@@ -431,35 +657,179 @@ def get_projections() -> dict:
 H2H_PREDICTIONS_FILE = PREDICTIONS_DIR / "h2h-predictions.json"
 
 
-@lru_cache(maxsize=1)
 def load_h2h_predictions() -> list[dict]:
-    """Load and cache the head-to-head predictions JSON from disk.
+    """Return the head-to-head predictions of the current dataset.
 
-    The file at H2H_PREDICTIONS_FILE is read once and cached for the
-    lifetime of the server process.
+    H2H_PREDICTIONS_FILE is loaded together with the team predictions by
+    the :data:`dataset_registry` and served from the dataset pinned to the
+    current request.  When the dataset snapshot is available the entries
+    are read-only views into it instead of parsed dicts.
 
     Returns:
         List of raw matchup dicts, each with ``team1``, ``team2``, and
         ``year`` keys.
 
     Raises:
-        FileNotFoundError: If H2H_PREDICTIONS_FILE does not exist.
+        FileNotFoundError: If the current dataset was loaded without
+            H2H_PREDICTIONS_FILE (or predictions.json is missing).
     """
-    if not H2H_PREDICTIONS_FILE.exists():
+    entries = dataset_registry.get().h2h_entries
+    if entries is None:
         raise FileNotFoundError(
             f"H2H predictions file not found: {H2H_PREDICTIONS_FILE}"
         )
-    return json.loads(H2H_PREDICTIONS_FILE.read_text(encoding="utf-8"))
+    return entries
+
+
+class H2HMatrix:
+    """Dense head-to-head win-probability matrix compiled from the H2H JSON.
+
+    Every team that appears in the predictions file gets a row/column index.
+    ``probs[i, j]`` holds the stored probability that team ``i`` beats team
+    ``j``; pairs with no stored prediction (including the diagonal) are NaN.
+    The matrix is read-only once built so it can be shared by every consumer.
+
+    Attributes:
+        names: Display names in index order, as spelled in the JSON file.
+        index: Casefolded display name → row/column index.
+        probs: ``(n, n)`` float64 array of win probabilities.
+    """
+
+    __slots__ = ("names", "index", "probs")
+
+    def __init__(
+        self, names: list[str], index: dict[str, int], probs: np.ndarray
+    ) -> None:
+        self.names = names
+        self.index = index
+        self.probs = probs
+
+    def team_index(self, name: str) -> Optional[int]:
+        """Return the matrix index for a team name or alias, or ``None``.
+
+        Matching is case-insensitive; alternate spellings from
+        :data:`TEAM_ALIASES` resolve to the spelling used in the H2H file.
+        """
+        key = name.casefold()
+        idx = self.index.get(key)
+        if idx is None and key in _ALIAS_LOOKUP:
+            idx = self.index.get(_ALIAS_LOOKUP[key])
+        return idx
+
+    def pair(self, team1_name: str, team2_name: str) -> Optional[tuple[int, int]]:
+        """Resolve two team names to matrix indices if a prediction exists.
+
+        Args:
+            team1_name: Display name of the first team.
+            team2_name: Display name of the second team.
+
+        Returns:
+            ``(i, j)`` index tuple, or ``None`` when either team is unknown or
+            the pair has no stored prediction.
+        """
+        i = self.team_index(team1_name)
+        j = self.team_index(team2_name)
+        if i is None or j is None or np.isnan(self.probs[i, j]):
+            return None
+        return i, j
+
+
+def build_h2h_matrix(entries: list[dict]) -> H2HMatrix:
+    """Compile raw head-to-head matchup entries into an :class:`H2HMatrix`.
+
+    Team indices are assigned in order of first appearance.  When the same
+    pair is stored more than once, the first entry wins — matching the old
+    linear-scan behaviour of :func:`get_h2h_prediction`.
+
+    Args:
+        entries: Raw matchup dicts as returned by :func:`load_h2h_predictions`.
+
+    Returns:
+        Read-only :class:`H2HMatrix` covering every team in ``entries``.
+    """
+    names: list[str] = []
+    index: dict[str, int] = {}
+    rows: list[int] = []
+    cols: list[int] = []
+    p_row: list[float] = []
+    p_col: list[float] = []
+    seen: set[tuple[int, int]] = set()
+
+    for entry in entries:
+        # Assign indices on first sighting of each team name.
+        ids = []
+        for side in ("team1", "team2"):
+            name = entry[side]["name"]
+            key = name.casefold()
+            if key not in index:
+                index[key] = len(names)
+                names.append(name)
+            ids.append(index[key])
+        i, j = ids
+
+        # Keep only the first stored prediction for each unordered pair.
+        pair_key = (min(i, j), max(i, j))
+        if i == j or pair_key in seen:
+            continue
+        seen.add(pair_key)
+
+        rows.append(i)
+        cols.append(j)
+        p_row.append(entry["team1"]["win_probability"])
+        p_col.append(entry["team2"]["win_probability"])
+
+    probs = np.full((len(names), len(names)), np.nan, dtype=np.float64)
+    probs[rows, cols] = p_row
+    probs[cols, rows] = p_col
+    probs.setflags(write=False)
+    return H2HMatrix(names, index, probs)
+
+
+# Most recently compiled matrix, paired with the entries list it was built from.
+_h2h_matrix_cache: Optional[tuple[list[dict], H2HMatrix]] = None
+
+
+def get_h2h_matrix() -> H2HMatrix:
+    """Return the compiled H2H matrix for the currently loaded predictions.
+
+    Entries from the registry's dataset come with a matrix built alongside
+    them.  Any other list (e.g. a patched loader in tests) is compiled on
+    first use and cached on its identity.  Entries that came from the dataset
+    snapshot use the matrix stored in it, mapped rather than built.
+
+    Returns:
+        The shared :class:`H2HMatrix`.
+
+    Raises:
+        FileNotFoundError: If H2H_PREDICTIONS_FILE does not exist.
+    """
+    global _h2h_matrix_cache
+    entries = load_h2h_predictions()
+    dataset = dataset_registry.peek()
+    if dataset is not None and entries is dataset.h2h_entries:
+        return dataset.h2h_matrix
+    cached = _h2h_matrix_cache
+    if cached is not None and cached[0] is entries:
+        return cached[1]
+
+    snap = _active_snapshot
+    if snap is not None and entries is snap.h2h_entries:
+        matrix = _snapshot_h2h_matrix(snap)
+    else:
+        matrix = build_h2h_matrix(entries)
+    _h2h_matrix_cache = (entries, matrix)
+    logger.info("Compiled H2H matrix: %d teams", len(matrix.names))
+    return matrix
 
 
 def get_h2h_prediction(team1_name: str, team2_name: str) -> Optional[H2HResponse]:
     """Look up the head-to-head win probability for a given pair of teams.
 
-    Searches the pre-calculated h2h-predictions JSON for a matchup entry
-    where one team is ``team1_name`` and the other is ``team2_name``.
-    The lookup is case-insensitive and direction-agnostic — if the stored
-    entry has the teams in reverse order the probabilities are swapped so
-    that team1 in the response always corresponds to ``team1_name``.
+    Resolves both names against the compiled :class:`H2HMatrix`, so the
+    lookup is O(1) regardless of how many matchups are stored.  The lookup
+    is case-insensitive and direction-agnostic — team1 in the response
+    always corresponds to ``team1_name`` and carries the probability stored
+    for that team, whichever order the pair appears in the JSON file.
 
     Args:
         team1_name: Display name of the first team (e.g. ``"Duke"``).
@@ -469,40 +839,378 @@ def get_h2h_prediction(team1_name: str, team2_name: str) -> Optional[H2HResponse
         Populated :class:`~app.models.H2HResponse`, or ``None`` if no
         matching matchup is found in the predictions data.
     """
-    needle1 = team1_name.casefold()
-    needle2 = team2_name.casefold()
+    matrix = get_h2h_matrix()
+    pair = matrix.pair(team1_name, team2_name)
+    if pair is None:
+        return None
 
-    for entry in load_h2h_predictions():
-        stored1 = entry["team1"]["name"].casefold()
-        stored2 = entry["team2"]["name"].casefold()
+    i, j = pair
+    return H2HResponse(
+        team1=H2HTeamResult(
+            name=matrix.names[i], win_probability=float(matrix.probs[i, j])
+        ),
+        team2=H2HTeamResult(
+            name=matrix.names[j], win_probability=float(matrix.probs[j, i])
+        ),
+    )
 
-        # Match in stored order — team1 in entry matches team1 in request.
-        if stored1 == needle1 and stored2 == needle2:
-            return H2HResponse(
-                team1=H2HTeamResult(
-                    name=entry["team1"]["name"],
-                    win_probability=entry["team1"]["win_probability"],
-                ),
-                team2=H2HTeamResult(
-                    name=entry["team2"]["name"],
-                    win_probability=entry["team2"]["win_probability"],
+
+def get_h2h_batch(pairs: list[H2HPair]) -> list[H2HBatchResult]:
+    """Resolve many head-to-head pairs against a single H2H matrix snapshot.
+
+    Each pair follows the same rules as :func:`get_h2h_prediction` and the
+    single-pair endpoint: self-matchups and pairs with no stored prediction
+    are reported inline via ``error`` instead of failing the whole batch.
+
+    Args:
+        pairs: Requested matchups, in the order they should be returned.
+
+    Returns:
+        One :class:`~app.models.H2HBatchResult` per pair, in request order.
+    """
+    matrix = get_h2h_matrix()
+    results: list[H2HBatchResult] = []
+
+    for pair in pairs:
+        if pair.team1.casefold() == pair.team2.casefold():
+            results.append(H2HBatchResult(
+                team1=pair.team1,
+                team2=pair.team2,
+                error="team1 and team2 must be different teams.",
+            ))
+            continue
+
+        resolved = matrix.pair(pair.team1, pair.team2)
+        if resolved is None:
+            results.append(H2HBatchResult(
+                team1=pair.team1,
+                team2=pair.team2,
+                error=(
+                    f"No head-to-head prediction found for "
+                    f"'{pair.team1}' vs '{pair.team2}'."
                 ),
-            )
+            ))
+            continue
 
-        # Match in reverse order — swap so response aligns with request order.
-        if stored1 == needle2 and stored2 == needle1:
-            return H2HResponse(
+        i, j = resolved
+        results.append(H2HBatchResult(
+            team1=pair.team1,
+            team2=pair.team2,
+            prediction=H2HResponse(
                 team1=H2HTeamResult(
-                    name=entry["team2"]["name"],
-                    win_probability=entry["team2"]["win_probability"],
+                    name=matrix.names[i], win_probability=float(matrix.probs[i, j])
                 ),
                 team2=H2HTeamResult(
-                    name=entry["team1"]["name"],
-                    win_probability=entry["team1"]["win_probability"],
+                    name=matrix.names[j], win_probability=float(matrix.probs[j, i])
                 ),
+            ),
+        ))
+
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Dataset snapshot
+# ---------------------------------------------------------------------------
+
+# Snapshot currently backing load_predictions / load_h2h_predictions.
+_active_snapshot: Optional[snapshot.Snapshot] = None
+
+# Serialises snapshot opens and compiles between threads of one process;
+# compiles are also serialised between processes by a file lock next to the
+# snapshot (see load_dataset_snapshot).
+_snapshot_lock = threading.Lock()
+
+
+def _snapshot_sources() -> dict[str, Optional[dict]]:
+    """Return the current size/mtime signatures of the snapshot's sources."""
+    return {
+        "predictions.json": snapshot.source_signature(
+            PREDICTIONS_DIR / "predictions.json"
+        ),
+        "h2h-predictions.json": snapshot.source_signature(H2H_PREDICTIONS_FILE),
+    }
+
+
+def compile_dataset_snapshot(path: Optional[Path] = None) -> Path:
+    """Parse the prediction files and write a fresh dataset snapshot.
+
+    Args:
+        path: Destination (default: ``COMPILED_DIR/dataset.snap``).
+
+    Returns:
+        The path written.
+
+    Raises:
+        FileNotFoundError: If ``predictions.json`` does not exist.
+        OSError: If the snapshot cannot be written.
+    """
+    path = path or COMPILED_DIR / snapshot.SNAPSHOT_FILENAME
+    # Signatures are taken before reading, so a file that changes mid-compile
+    # leaves a snapshot that is already stale rather than one that looks fresh.
+    sources = _snapshot_sources()
+    teams = json.loads(
+        (PREDICTIONS_DIR / "predictions.json").read_text(encoding="utf-8")
+    )
+    entries = names = probs = None
+    if sources["h2h-predictions.json"] is not None:
+        entries = json.loads(H2H_PREDICTIONS_FILE.read_text(encoding="utf-8"))
+        matrix = build_h2h_matrix(entries)
+        names, probs = matrix.names, matrix.probs
+
+    size = snapshot.write_snapshot(path, sources, teams, entries, names, probs)
+    logger.info(
+        "Compiled dataset snapshot: %d teams, %d H2H entries, %d bytes → %s",
+        len(teams), len(entries or ()), size, path,
+    )
+    return path
+
+
+def _open_fresh_snapshot(path: Path, sources: dict) -> Optional[snapshot.Snapshot]:
+    """Open the snapshot at ``path`` if it was compiled from ``sources``."""
+    try:
+        snap = snapshot.open_snapshot(path)
+    except (OSError, ValueError):
+        return None
+    return snap if snap.sources == sources else None
+
+
+def load_dataset_snapshot() -> Optional[snapshot.Snapshot]:
+    """Return the mapped snapshot for the current prediction files.
+
+    The snapshot under COMPILED_DIR is opened if it was compiled from the
+    current files; otherwise it is recompiled first.  Compiles hold an
+    exclusive lock on ``dataset.snap.lock``, and a process that waited for
+    the lock opens the snapshot the holder just wrote instead of compiling
+    it again — so forked workers that notice the same change compile once.
+    Opening also installs the snapshot's recap store for
+    :func:`get_team_recaps`.
+
+    Returns:
+        The open :class:`~app.snapshot.Snapshot`, or ``None`` when
+        ``predictions.json`` is missing or no snapshot could be compiled and
+        opened (callers then parse the JSON directly).
+    """
+    global _active_snapshot
+
+    with _snapshot_lock:
+        sources = _snapshot_sources()
+        if sources["predictions.json"] is None:
+            return None
+        snap = _active_snapshot
+        if snap is not None and snap.sources == sources:
+            return snap
+
+        path = COMPILED_DIR / snapshot.SNAPSHOT_FILENAME
+        snap = _open_fresh_snapshot(path, sources)
+        if snap is None:
+            logger.info("Dataset snapshot %s is missing or stale — compiling", path)
+            try:
+                with file_lock(path.with_name(path.name + ".lock")):
+                    # Another process may have compiled it while we waited.
+                    snap = _open_fresh_snapshot(path, sources)
+                    if snap is None:
+                        compile_dataset_snapshot(path)
+                        snap = snapshot.open_snapshot(path)
+            except (OSError, ValueError):
+                logger.warning(
+                    "Could not compile dataset snapshot %s — parsing JSON instead",
+                    path, exc_info=True,
+                )
+                return None
+
+        _active_snapshot = snap
+        recaps.set_active_store(snap.recaps)
+        return snap
+
+
+def _snapshot_h2h_matrix(snap: snapshot.Snapshot) -> H2HMatrix:
+    """Wrap the H2H matrix stored in a snapshot (mapped, not rebuilt)."""
+    names = snap.h2h_names
+    return H2HMatrix(
+        names, {name.casefold(): i for i, name in enumerate(names)}, snap.h2h_probs
+    )
+
+
+# ---------------------------------------------------------------------------
+# Dataset registry
+# ---------------------------------------------------------------------------
+
+
+def validate_dataset(
+    teams: list[dict], store: TeamStore, matrix: Optional[H2HMatrix]
+) -> None:
+    """Check a freshly built dataset before it may replace the current one.
+
+    Args:
+        teams: Team records parsed from predictions.json.
+        store: The :class:`TeamStore` built from ``teams``.
+        matrix: The H2H matrix, or ``None`` without an H2H file.
+
+    Raises:
+        ValueError: Describing the first problem found.
+    """
+    if not teams:
+        raise ValueError("predictions.json contains no teams")
+    seen: set[str] = set()
+    for i, team in enumerate(teams):
+        if not isinstance(team, Mapping):
+            raise ValueError(f"Team record #{i} is not an object")
+        name = team.get("name")
+        if not isinstance(name, str) or not name:
+            raise ValueError(f"Team record #{i} has no name")
+        if name.casefold() in seen:
+            raise ValueError(f"Duplicate team name: {name}")
+        seen.add(name.casefold())
+        dist = team.get("win_probability_distribution")
+        try:
+            total = sum(dist.values())
+        except (AttributeError, TypeError):
+            raise ValueError(f"{name}: invalid win_probability_distribution") from None
+        if abs(total - 1.0) > 1e-2:
+            raise ValueError(f"{name}: win probabilities sum to {total:.4f}")
+
+    if matrix is not None:
+        unknown = [n for n in matrix.names if store.find(n) is None]
+        if unknown:
+            raise ValueError(
+                f"H2H predictions name unknown teams: {', '.join(unknown[:5])}"
+            )
+        stored = matrix.probs[~np.isnan(matrix.probs)]
+        if stored.size and (stored.min() < 0.0 or stored.max() > 1.0):
+            raise ValueError("H2H win probabilities outside [0, 1]")
+
+
+def build_dataset() -> Dataset:
+    """Load and validate a complete dataset from the prediction files.
+
+    Used by :data:`dataset_registry` for the first load and for every
+    reload.  Records come from the dataset snapshot (recompiled if the files
+    changed) or, failing that, straight from the JSON.
+
+    Returns:
+        A new, validated :class:`~app.datasets.Dataset`.
+
+    Raises:
+        FileNotFoundError: If ``predictions.json`` does not exist.
+        ValueError: If a file cannot be parsed or fails
+            :func:`validate_dataset`.
+    """
+    sources = _snapshot_sources()
+    path = PREDICTIONS_DIR / "predictions.json"
+    if sources["predictions.json"] is None:
+        raise FileNotFoundError(f"Predictions file not found: {path}")
+
+    try:
+        snap = load_dataset_snapshot()
+        if snap is not None:
+            sources, teams, entries, store_recaps = (
+                snap.sources, snap.teams, snap.h2h_entries, snap.recaps
             )
+            matrix = _snapshot_h2h_matrix(snap) if entries is not None else None
+        else:
+            teams = _parse_predictions(path)
+            store_recaps = recaps.get_active_store()
+            entries = matrix = None
+            if sources["h2h-predictions.json"] is not None:
+                entries = json.loads(
+                    H2H_PREDICTIONS_FILE.read_text(encoding="utf-8")
+                )
+                matrix = build_h2h_matrix(entries)
+        store = build_team_store(teams)
+    except (AttributeError, KeyError, TypeError) as exc:
+        # Records of the wrong shape fail while compiling or indexing.
+        raise ValueError(f"Malformed prediction records: {exc!r}") from exc
+    validate_dataset(teams, store, matrix)
+    logger.info(
+        "Built dataset: %d teams, %d H2H teams",
+        len(store.by_id), len(matrix.names) if matrix is not None else 0,
+    )
+    return Dataset(sources, teams, store, entries, matrix, store_recaps)
+
 
-    return None
+# Holds the current dataset; reloads swap it atomically (see app.datasets).
+dataset_registry = DatasetRegistry(build_dataset, _snapshot_sources)
+
+
+# ---------------------------------------------------------------------------
+# Request coalescing (single-flight)
+# ---------------------------------------------------------------------------
+
+T = TypeVar("T")
+
+# Every SingleFlight created in this process, by name (reported on /api/metrics).
+single_flights: dict[str, "SingleFlight"] = {}
+
+
+class SingleFlight:
+    """Coalesce concurrent async calls that share a key into one computation.
+
+    The first caller for a key (the *lead*) starts the computation as its own
+    task; callers arriving while it runs (*followers*) await the same task
+    and receive the same result or exception.  The key is released as soon
+    as the task finishes, so later calls compute afresh.
+
+    The shared task is shielded from its callers: a lead that is cancelled
+    (e.g. its client disconnected) does not cancel the work its followers
+    are waiting on.
+
+    Attributes:
+        name: Name used in logs and metrics.
+        leads: Calls that started a computation.
+        followers: Calls that joined an in-flight computation.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.leads = 0
+        self.followers = 0
+        single_flights[name] = self
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Return ``await fn()``, sharing one in-flight call per ``key``.
+
+        Args:
+            key: Coalescing key; calls with equal keys share a computation.
+            fn: Zero-argument coroutine function performing the work.  Only
+                the lead's ``fn`` is called.
+
+        Returns:
+            The result of the shared computation.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            self.leads += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, key=key: self._release(key, t))
+        else:
+            self.followers += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        """Return lead/follower counters and the number of in-flight keys."""
+        return {
+            "name": self.name,
+            "leads": self.leads,
+            "followers": self.followers,
+            "in_flight": len(self._inflight),
+        }
+
+    def _release(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished task and mark its exception as retrieved."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+
+# Shared by concurrent similar-team lookups for the same team.
+similar_flight = SingleFlight("similar-teams")
+
+# Shared by concurrent /analyze/{team} requests for the same team.
+analysis_flight = SingleFlight("team-analysis")
 
 
 # ---------------------------------------------------------------------------
@@ -527,88 +1235,399 @@ def team_name_to_chroma_id(name: str, year: int = CURRENT_YEAR) -> str:
     return f"{slug}_{year}"
 
 
-def get_similar_teams(team_name: str) -> list[SimilarTeam]:
-    """Find the 3 most similar historical teams via ChromaDB.
+def _build_similar_team(meta: dict, similarity: float) -> SimilarTeam:
+    """Build a SimilarTeam from a vector-store metadata dict and a similarity."""
+    return SimilarTeam(
+        name=meta["name"],
+        year=int(meta["year"]),
+        seed=int(meta["tournament_seed"]),
+        tournament_wins=int(meta["tournament_wins"]),
+        similarity=round(max(0.0, similarity), 4),
+    )
+
+
+def _neighbours_to_similar(
+    metadatas: list[dict], distances: list[float]
+) -> list[SimilarTeam]:
+    """Convert one ChromaDB result row into up to 3 historical SimilarTeams."""
+    similar: list[SimilarTeam] = []
+    for meta, dist in zip(metadatas, distances):
+        # Skip any team from the current season.
+        if meta.get("year") == CURRENT_YEAR:
+            continue
+
+        # Cosine distance is in [0, 1]; convert to similarity score.
+        similar.append(_build_similar_team(meta, 1.0 - dist))
+
+        if len(similar) == 3:
+            break
+    return similar
+
+
+def _query_chroma_batch(chroma_ids: list[str]) -> dict[str, list[SimilarTeam]]:
+    """Find the 3 most similar historical teams for many teams at once.
+
+    Issues exactly two ChromaDB calls regardless of how many IDs are given:
+    one ``get`` for all stored embeddings and one multi-embedding ``query``.
+
+    Args:
+        chroma_ids: Current-season document IDs to look up.
+
+    Returns:
+        Chroma ID → similar teams.  IDs with no stored embedding are absent.
+
+    Raises:
+        VectorStoreUnavailable: If ChromaDB cannot be reached.
+        Exception: Any error raised by the query itself (the shared handle is
+            dropped first so the next request reconnects).
+    """
+    # Shared handle opened in the app lifespan; reconnects lazily.
+    collection = vector_store.collection()
 
-    Retrieves the current team's PCA-reduced vector from ChromaDB using its
-    2025 document ID, then queries for the nearest neighbours.  Any 2025
-    teams in the results are filtered out so that only historical seasons
-    (pre-2025) are returned.
+    try:
+        # Retrieve the stored embeddings by their current-season document IDs.
+        result = collection.get(ids=chroma_ids, include=["embeddings"])
+        found_ids = list(result["ids"])
+        if not found_ids:
+            return {}
+
+        # Fetch 10 candidates so we have enough after filtering 2025 teams.
+        neighbors = collection.query(
+            query_embeddings=list(result["embeddings"]),
+            n_results=10,
+            include=["metadatas", "distances"],
+        )
+    except Exception:
+        # ChromaDB went away mid-query (or restarted with a new collection) —
+        # drop the handle so the next request reconnects.
+        vector_store.invalidate()
+        raise
+
+    return {
+        chroma_id: _neighbours_to_similar(metas, dists)
+        for chroma_id, metas, dists in zip(
+            found_ids, neighbors["metadatas"], neighbors["distances"]
+        )
+    }
+
+
+def _query_chroma_similar(team_name: str) -> list[SimilarTeam]:
+    """Find the 3 most similar historical teams with a ChromaDB query.
+
+    Raises:
+        VectorStoreUnavailable: If ChromaDB cannot be reached.
+        Exception: Any error raised by the query itself.
+    """
+    chroma_id = team_name_to_chroma_id(team_name, CURRENT_YEAR)
+    logger.info("Looking up neighbours for chroma_id='%s'", chroma_id)
+    similar = _query_chroma_batch([chroma_id]).get(chroma_id)
+    if similar is None:
+        logger.warning("No embedding found for chroma_id='%s'", chroma_id)
+        return []
+    return similar
+
+
+def _query_index_similar(team_name: str) -> Optional[list[SimilarTeam]]:
+    """Find the 3 most similar historical teams with the in-process index.
+
+    Returns:
+        Up to 3 similar teams, or ``None`` if no index is loaded.
+    """
+    index = get_similarity_index()
+    if index is None:
+        return None
+
+    chroma_id = team_name_to_chroma_id(team_name, CURRENT_YEAR)
+    matches = index.most_similar(chroma_id, 3, exclude_year=CURRENT_YEAR)
+    if matches is None:
+        logger.warning("No embedding found in index for chroma_id='%s'", chroma_id)
+        return []
+    return [_build_similar_team(meta, score) for meta, score in matches]
+
+
+def load_similarity_engine() -> Optional[SimilarityIndex]:
+    """Load the in-process similarity index if the configuration uses it.
+
+    Called once from the app lifespan.  The vectors JSON export is preferred;
+    when it is absent the vectors are pulled from ChromaDB instead.
+
+    Returns:
+        The loaded index, or ``None`` if it is not configured or unavailable.
+    """
+    if SIMILARITY_ENGINE != "numpy" and not SIMILARITY_FALLBACK:
+        return None
+    collection = None
+    if not VECTORS_FILE.exists():
+        try:
+            collection = vector_store.collection()
+        except VectorStoreUnavailable:
+            pass
+    return load_similarity_index(collection=collection)
+
+
+# Last successful ChromaDB result per team (keyed by chroma ID), served with
+# stale=True while the vector store is unavailable.
+_last_good_similar: dict[str, list[SimilarTeam]] = {}
+
+
+def _find_similar_teams(team_name: str) -> list[SimilarTeam]:
+    """Find the 3 most similar historical teams (blocking).
+
+    Retrieves the current team's PCA-reduced vector using its 2025 document
+    ID, then finds its nearest neighbours.  Any 2025 teams in the results are
+    filtered out so that only historical seasons (pre-2025) are returned.
 
     Distance metric is cosine (collection created with ``hnsw:space=cosine``).
     ChromaDB returns cosine distance in [0, 1] where 0 = identical, so
     cosine similarity = ``1 - distance``.
 
+    The search runs on ChromaDB (the shared handle from
+    :mod:`app.vector_store`) or, with ``SIMILARITY_ENGINE=numpy``, on the
+    in-process :class:`~app.similarity.SimilarityIndex`.  With
+    ``SIMILARITY_FALLBACK`` enabled, the index also answers when ChromaDB
+    fails.
+
+    ChromaDB queries go through :data:`~app.vector_store.chroma_breaker`.
+    While it is open no query is attempted; if no index can answer, the last
+    known good result for the team is returned with ``stale=True``.
+
     Args:
         team_name: Display name of the team to query for.
 
     Returns:
         List of up to 3 :class:`~app.models.SimilarTeam` objects ordered by
-        similarity descending.  Returns an empty list when ChromaDB is
-        unreachable or the team is absent from the vector store.
+        similarity descending.  Returns an empty list when no engine can
+        answer, nothing is cached for the team, or the team is absent from
+        the vector store.
     """
-    try:
-        client = chromadb.HttpClient(host=CHROMA_HOST, port=CHROMA_PORT)
-        logger.info("ChromaDB connected at %s:%s", CHROMA_HOST, CHROMA_PORT)
+    if SIMILARITY_ENGINE == "numpy":
+        similar = _query_index_similar(team_name)
+        if similar is not None:
+            return similar
+        logger.warning("Similarity index not loaded — querying ChromaDB instead")
+
+    chroma_id = team_name_to_chroma_id(team_name, CURRENT_YEAR)
+    if chroma_breaker.allow():
+        try:
+            similar = _query_chroma_similar(team_name)
+        except VectorStoreUnavailable as exc:
+            chroma_breaker.record_failure()
+            logger.warning("ChromaDB lookup skipped for '%s': %s", team_name, exc)
+        except Exception:
+            # ChromaDB unavailable or team not indexed — log and degrade gracefully.
+            chroma_breaker.record_failure()
+            logger.exception("get_similar_teams failed for '%s'", team_name)
+        else:
+            chroma_breaker.record_success()
+            if similar:
+                _last_good_similar[chroma_id] = similar
+            logger.info("Returning %d similar teams for '%s'", len(similar), team_name)
+            return similar
+    else:
+        logger.info("ChromaDB circuit open — not querying for '%s'", team_name)
+
+    if SIMILARITY_FALLBACK and SIMILARITY_ENGINE != "numpy":
+        similar = _query_index_similar(team_name)
+        if similar is not None:
+            logger.info("Served similar teams for '%s' from the fallback index",
+                        team_name)
+            return similar
+
+    last_good = _last_good_similar.get(chroma_id)
+    if last_good:
+        logger.info("Serving stale similar teams for '%s'", team_name)
+        return [t.model_copy(update={"stale": True}) for t in last_good]
+    return []
+
+
+# Bounded pool for the blocking lookups above, so a slow vector store only ties
+# up these threads — never the event loop serving every other request.
+_similarity_executor = ThreadPoolExecutor(
+    max_workers=SIMILARITY_WORKERS, thread_name_prefix="similarity"
+)
 
-        collection = client.get_collection(name=CHROMA_COLLECTION)
-        logger.info(
-            "Collection '%s' opened — count: %s", CHROMA_COLLECTION, collection.count()
-        )
 
-        # Retrieve the current team's stored embedding by its 2025 document ID.
-        chroma_id = team_name_to_chroma_id(team_name, CURRENT_YEAR)
-        logger.info("Looking up embedding for chroma_id='%s'", chroma_id)
-        result = collection.get(ids=[chroma_id], include=["embeddings"])
+async def get_similar_teams(team_name: str) -> list[SimilarTeam]:
+    """Find the 3 most similar historical teams without blocking the event loop.
 
-        if len(result["embeddings"]) == 0:
-            logger.warning("No embedding found for chroma_id='%s'", chroma_id)
-            return []
+    Runs :func:`_find_similar_teams` on a bounded thread pool and waits at
+    most ``SIMILARITY_TIMEOUT`` seconds (time spent queued for a worker
+    included).  A lookup that misses the deadline keeps running in its
+    thread, but the caller gets an empty list straight away.
 
-        query_vector = result["embeddings"][0]
-        logger.info(
-            "Embedding retrieved (%d dimensions) — querying neighbours",
-            len(query_vector),
-        )
+    Teams in the precomputed table (see :func:`precompute_similar_teams`) are
+    answered directly, without touching the thread pool.  Concurrent lookups
+    for the same team share one in-flight lookup (:data:`similar_flight`).
 
-        # Fetch 10 candidates so we have enough after filtering 2025 teams.
-        neighbors = collection.query(
-            query_embeddings=[query_vector],
-            n_results=10,
-            include=["metadatas", "distances"],
+    Args:
+        team_name: Display name of the team to query for.
+
+    Returns:
+        List of up to 3 :class:`~app.models.SimilarTeam` objects ordered by
+        similarity descending, or an empty list on failure or timeout.
+    """
+    chroma_id = team_name_to_chroma_id(team_name, CURRENT_YEAR)
+    precomputed = _similar_table.get(chroma_id)
+    if precomputed is not None:
+        return precomputed
+
+    async def lookup() -> list[SimilarTeam]:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            _similarity_executor, _find_similar_teams, team_name
         )
+        try:
+            return await asyncio.wait_for(future, SIMILARITY_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "get_similar_teams timed out after %.1fs for '%s'",
+                SIMILARITY_TIMEOUT, team_name,
+            )
+            return []
 
-        similar: list[SimilarTeam] = []
-        for meta, dist in zip(
-            neighbors["metadatas"][0], neighbors["distances"][0]
-        ):
-            # Skip any team from the current season.
-            if meta.get("year") == CURRENT_YEAR:
-                continue
+    return await similar_flight.do(chroma_id, lookup)
 
-            # Cosine distance is in [0, 1]; convert to similarity score.
-            similarity = round(max(0.0, 1.0 - dist), 4)
 
-            similar.append(
-                SimilarTeam(
-                    name=meta["name"],
-                    year=int(meta["year"]),
-                    seed=int(meta["tournament_seed"]),
-                    tournament_wins=int(meta["tournament_wins"]),
-                    similarity=similarity,
-                )
-            )
+# ---------------------------------------------------------------------------
+# Similar-team precomputation
+# ---------------------------------------------------------------------------
+
+# Teams queried per multi-embedding ChromaDB call during precomputation.
+_PRECOMPUTE_BATCH_SIZE = 34
+
+# Chroma ID → similar teams for every team in the current field.  Replaced
+# wholesale (never mutated) so readers always see a complete table.
+_similar_table: dict[str, list[SimilarTeam]] = {}
+
 
-            if len(similar) == 3:
-                break
+def load_similar_table(path: Optional[Path] = None) -> int:
+    """Load a persisted similar-teams table from disk.
 
-        logger.info("Returning %d similar teams for '%s'", len(similar), team_name)
-        return similar
+    Args:
+        path: Table file (default: ``SIMILAR_TEAMS_FILE``).
+
+    Returns:
+        Number of teams loaded; 0 if the file is missing, unreadable, or was
+        computed for a different season.
+    """
+    global _similar_table
 
+    path = path or SIMILAR_TEAMS_FILE
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("year") != CURRENT_YEAR:
+            logger.info("Ignoring similar-teams table for season %s", data.get("year"))
+            return 0
+        table = {
+            chroma_id: [SimilarTeam(**t) for t in teams]
+            for chroma_id, teams in data["teams"].items()
+        }
+    except FileNotFoundError:
+        return 0
+    except (OSError, ValueError, KeyError, TypeError):
+        logger.warning("Could not read similar-teams table %s", path, exc_info=True)
+        return 0
+
+    _similar_table = table
+    logger.info("Loaded precomputed similar teams for %d teams from %s",
+                len(table), path)
+    return len(table)
+
+
+def similar_table_size() -> int:
+    """Return the number of teams in the loaded similar-teams table."""
+    return len(_similar_table)
+
+
+def _save_similar_table(table: dict[str, list[SimilarTeam]], path: Path) -> None:
+    """Persist ``table`` atomically; failures are logged, not raised."""
+    payload = {
+        "year": CURRENT_YEAR,
+        "generated_at": time.time(),
+        "teams": {
+            chroma_id: [t.model_dump() for t in teams]
+            for chroma_id, teams in table.items()
+        },
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(path, json.dumps(payload).encode("utf-8"))
+    except OSError:
+        logger.warning("Could not persist similar-teams table to %s", path,
+                       exc_info=True)
+
+
+def precompute_similar_teams(
+    path: Optional[Path] = None,
+) -> tuple[dict[str, list[SimilarTeam]], str]:
+    """Compute similar teams for the whole current field and publish the table.
+
+    Uses the in-process index when it is the configured engine; otherwise
+    ChromaDB is queried in a few multi-embedding batches, falling back to
+    the index (if enabled) when ChromaDB fails.  On success the table
+    replaces the in-memory one and is written to ``path``.
+
+    Args:
+        path: Where to persist the table (default: ``SIMILAR_TEAMS_FILE``).
+
+    Returns:
+        ``(table, source)`` where ``source`` is ``"numpy"`` or ``"chroma"``.
+
+    Raises:
+        VectorStoreUnavailable: If no engine could compute any team.
+    """
+    global _similar_table
+
+    chroma_ids = [
+        team_name_to_chroma_id(t["name"], CURRENT_YEAR) for t in get_all_teams()
+    ]
+
+    def from_index() -> Optional[dict[str, list[SimilarTeam]]]:
+        index = get_similarity_index()
+        if index is None:
+            return None
+        table = {}
+        for chroma_id in chroma_ids:
+            matches = index.most_similar(chroma_id, 3, exclude_year=CURRENT_YEAR)
+            if matches is not None:
+                table[chroma_id] = [_build_similar_team(m, sc) for m, sc in matches]
+        return table
+
+    table: Optional[dict[str, list[SimilarTeam]]] = None
+    source = "numpy"
+    if SIMILARITY_ENGINE == "numpy":
+        table = from_index()
+    if table is None:
+        source = "chroma"
+        try:
+            table = {}
+            for start in range(0, len(chroma_ids), _PRECOMPUTE_BATCH_SIZE):
+                table.update(
+                    _query_chroma_batch(
+                        chroma_ids[start:start + _PRECOMPUTE_BATCH_SIZE]
+                    )
+                )
+        except Exception as exc:
+            logger.warning("Similar-team precomputation via ChromaDB failed: %s", exc)
+            table = from_index() if SIMILARITY_FALLBACK else None
+            source = "numpy"
+    if not table:
+        raise VectorStoreUnavailable("No similarity engine could precompute teams")
+
+    _similar_table = table
+    _save_similar_table(table, path or SIMILAR_TEAMS_FILE)
+    logger.info("Precomputed similar teams for %d/%d teams (%s)",
+                len(table), len(chroma_ids), source)
+    return table, source
+
+
+def warm_similar_teams() -> None:
+    """Startup job: precompute the table, logging rather than raising on failure."""
+    try:
+        precompute_similar_teams()
     except Exception:
-        # ChromaDB unavailable or team not indexed — log and degrade gracefully.
-        logger.exception("get_similar_teams failed for '%s'", team_name)
-        return []
+        logger.warning("Similar-team warmup failed — lookups stay on demand",
+                       exc_info=True)
 
 
 # ---------------------------------------------------------------------------
@@ -619,23 +1638,169 @@ def get_similar_teams(team_name: str) -> list[SimilarTeam]:
 RESULTS_FILE = PREDICTIONS_DIR / "results.json"
 
 
+class FileCache:
+    """Single-entry parsed-JSON cache validated against the file's identity.
+
+    Each lookup costs one ``stat`` call.  The file is re-parsed only when its
+    ``(path, mtime_ns, size, inode)`` signature differs from the cached one,
+    so in-place edits and atomic replacements are both picked up without a
+    restart.  Refreshes are serialised by a lock and re-checked inside it, so
+    a burst of requests arriving right after an update triggers one parse.
+
+    Attributes:
+        hits: Lookups served from the cached value.
+        misses: Lookups that had to (re-)parse the file.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entry: Optional[tuple[tuple, object]] = None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _signature(path, stat: os.stat_result) -> tuple:
+        """Return the change-detection key for a stat result."""
+        return (str(path), stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def get(self, path) -> object:
+        """Return the parsed JSON at ``path``, re-parsing only if it changed.
+
+        Args:
+            path: Path of the JSON file to load.
+
+        Returns:
+            The parsed JSON value (shared — callers must not mutate it).
+
+        Raises:
+            FileNotFoundError: If ``path`` does not exist.
+        """
+        signature = self._signature(path, os.stat(path))
+        entry = self._entry
+        if entry is not None and entry[0] == signature:
+            self.hits += 1
+            return entry[1]
+
+        with self._lock:
+            # Another request may have refreshed the entry while we waited.
+            entry = self._entry
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                return entry[1]
+
+            # Stat the open descriptor so the signature describes exactly the
+            # bytes we parse, even if the file is replaced mid-read.
+            with open(path, "rb") as fh:
+                signature = self._signature(path, os.fstat(fh.fileno()))
+                data = json.load(fh)
+            self._entry = (signature, data)
+            self.misses += 1
+
+        logger.info("Reloaded %s (mtime_ns=%d)", path, signature[1])
+        return data
+
+    def stats(self) -> dict:
+        """Return the hit/miss counters and the derived hit ratio."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+# Cache for results.json — re-validated on every call, re-parsed on change.
+results_cache = FileCache()
+
+
 def load_results_data() -> list[dict]:
-    """Load the tournament results JSON from disk on every call.
+    """Load the tournament results JSON, re-parsing only when it changes.
 
-    Results are NOT cached because results.json is updated throughout the
-    tournament as games are completed.  Reading fresh each request ensures the
-    page always reflects the latest results without requiring a server restart.
+    results.json is updated throughout the tournament as games complete, so
+    it cannot be cached for the process lifetime like the prediction files.
+    Instead every call validates the cached copy against the file's
+    ``(mtime_ns, size, inode)`` via :data:`results_cache`, so new results
+    still show up on the next request without a server restart.
 
     Returns:
         List of raw tournament dicts, each containing year, tournament_name,
-        and a list of round dicts with game results.
+        and a list of round dicts with game results.  The list is shared
+        between calls and must not be mutated.
 
     Raises:
         FileNotFoundError: If RESULTS_FILE does not exist.
     """
     if not RESULTS_FILE.exists():
         raise FileNotFoundError(f"Results file not found: {RESULTS_FILE}")
-    return json.loads(RESULTS_FILE.read_text(encoding="utf-8"))
+    return results_cache.get(RESULTS_FILE)
+
+
+def dataset_fingerprint(*names: str) -> tuple:
+    """Return the currently loaded objects for the named datasets.
+
+    Each loader returns the same object while its source file is unchanged
+    and a new object once it changes, so the returned tuple is a cheap
+    dependency fingerprint for caches of derived responses (compared by
+    identity, see :mod:`app.cache`).
+
+    Args:
+        *names: Any of ``"predictions"``, ``"h2h"``, ``"results"`` and
+            ``"bracket"``.
+
+    Returns:
+        Tuple of loaded datasets in the order requested.  A missing H2H file
+        yields ``None`` (it only enriches results); a missing predictions or
+        results file raises.
+
+    Raises:
+        FileNotFoundError: If predictions.json, results.json or
+            most-likely-bracket.json is missing.
+        KeyError: If an unknown dataset name is requested.
+    """
+    fingerprint = []
+    for name in names:
+        if name == "predictions":
+            fingerprint.append(load_predictions())
+        elif name == "results":
+            fingerprint.append(load_results_data())
+        elif name == "h2h":
+            try:
+                fingerprint.append(load_h2h_predictions())
+            except FileNotFoundError:
+                fingerprint.append(None)
+        elif name == "bracket":
+            fingerprint.append(load_bracket_data())
+        else:
+            raise KeyError(f"Unknown dataset: {name}")
+    return tuple(fingerprint)
+
+
+def preload_datasets() -> dict[str, int]:
+    """Load every dataset and derived index ahead of the first request.
+
+    Fills the loader caches (predictions and the team store, the H2H matrix,
+    results.json) so no request pays for a cold load.  Called from the
+    lifespan of every worker and, by :mod:`app.serve`, once in the parent
+    process before workers are forked so they inherit the loaded objects.
+
+    Returns:
+        Loaded sizes — ``teams``, ``h2h_teams`` and ``tournaments`` (0 when
+        the optional H2H or results file is missing).
+
+    Raises:
+        FileNotFoundError: If predictions.json is missing.
+    """
+    counts = {"teams": len(get_team_store().by_id)}
+    try:
+        counts["h2h_teams"] = len(get_h2h_matrix().names)
+    except FileNotFoundError:
+        counts["h2h_teams"] = 0
+    try:
+        counts["tournaments"] = len(load_results_data())
+    except FileNotFoundError:
+        counts["tournaments"] = 0
+    logger.info("Datasets preloaded: %s", counts)
+    return counts
 
 
 def _get_game_predicted_probability(
@@ -643,8 +1808,8 @@ def _get_game_predicted_probability(
 ) -> Optional[float]:
     """Return the model's confidence for a game matchup.
 
-    Looks up the pre-calculated h2h prediction for the two teams and returns
-    the higher of the two win probabilities.  This represents the model's
+    Looks up the pair in the shared :class:`H2HMatrix` and returns the
+    higher of the two win probabilities.  This represents the model's
     confidence in whichever team it predicted to win (always >= 0.5).
 
     Args:
@@ -655,26 +1820,17 @@ def _get_game_predicted_probability(
         The predicted winner's win probability (0.5–1.0), or ``None`` if the
         matchup is not found in h2h-predictions.json.
     """
-    needle1 = team1_name.casefold()
-    needle2 = team2_name.casefold()
-
     try:
-        predictions = load_h2h_predictions()
+        matrix = get_h2h_matrix()
     except FileNotFoundError:
         return None
 
-    for entry in predictions:
-        stored1 = entry["team1"]["name"].casefold()
-        stored2 = entry["team2"]["name"].casefold()
-
-        # Match in either direction — return the higher probability.
-        if (stored1 == needle1 and stored2 == needle2) or \
-           (stored1 == needle2 and stored2 == needle1):
-            p1 = entry["team1"]["win_probability"]
-            p2 = entry["team2"]["win_probability"]
-            return max(p1, p2)
+    pair = matrix.pair(team1_name, team2_name)
+    if pair is None:
+        return None
 
-    return None
+    i, j = pair
+    return float(max(matrix.probs[i, j], matrix.probs[j, i]))
 
 
 def get_results() -> ResultsResponse:
@@ -894,3 +2050,452 @@ def get_wins_evaluation() -> WinsEvaluationResponse:
         south=south,
         midwest=midwest,
     )
+
+
+# ---------------------------------------------------------------------------
+# Bracket projections
+# ---------------------------------------------------------------------------
+
+# Path to the pre-calculated most likely bracket, which also fixes the
+# bracket's slot order (see app.bracket.layout_from_bracket).
+BRACKET_FILE = PREDICTIONS_DIR / "most-likely-bracket.json"
+
+# Cache for most-likely-bracket.json — re-parsed only when it changes.
+bracket_cache = FileCache()
+
+
+def load_bracket_data() -> dict:
+    """Load the most likely bracket JSON, re-parsing only when it changes.
+
+    Returns:
+        The parsed bracket (shared between calls — must not be mutated).
+
+    Raises:
+        FileNotFoundError: If BRACKET_FILE does not exist.
+    """
+    if not BRACKET_FILE.exists():
+        raise FileNotFoundError(f"Bracket file not found: {BRACKET_FILE}")
+    return bracket_cache.get(BRACKET_FILE)
+
+
+# Most recently built engine, paired with the bracket and matrix it came from.
+_bracket_engine_cache: Optional[tuple[dict, H2HMatrix, BracketEngine]] = None
+
+
+def get_bracket_engine() -> BracketEngine:
+    """Return the :class:`~app.bracket.BracketEngine` for the current data.
+
+    The engine is rebuilt only when the bracket file or the H2H matrix
+    changes (compared by identity, like :func:`get_h2h_matrix`), which takes
+    about a millisecond.
+
+    Returns:
+        The shared engine.
+
+    Raises:
+        FileNotFoundError: If the bracket or H2H file is missing.
+        ValueError: If the bracket is inconsistent or a team has no
+            head-to-head predictions.
+    """
+    global _bracket_engine_cache
+    data = load_bracket_data()
+    matrix = get_h2h_matrix()
+    cached = _bracket_engine_cache
+    if cached is not None and cached[0] is data and cached[1] is matrix:
+        return cached[2]
+
+    layout = layout_from_bracket(data)
+    index = []
+    for name in layout.names:
+        i = matrix.team_index(name)
+        if i is None:
+            raise ValueError(f"No head-to-head predictions for {name}")
+        index.append(i)
+    engine = BracketEngine(layout, matrix.probs[np.ix_(index, index)])
+    _bracket_engine_cache = (data, matrix, engine)
+    logger.info("Built bracket engine: %d teams", len(layout))
+    return engine
+
+
+def get_advancement() -> AdvancementResponse:
+    """Compute every team's exact round-by-round advancement probabilities.
+
+    Runs the bracket DP (:meth:`~app.bracket.BracketEngine.advancement`)
+    on request, so the numbers always follow the loaded H2H matrix rather
+    than the precomputed distributions in predictions.json.
+
+    Returns:
+        AdvancementResponse sorted by title probability, then name.
+
+    Raises:
+        FileNotFoundError: If a required data file is missing.
+        ValueError: If the bracket cannot be built.
+    """
+    engine = get_bracket_engine()
+    levels = engine.advancement()
+    dists = engine.win_distribution(levels)
+    expected = np.arange(len(dists)) @ dists
+    store = get_team_store()
+
+    teams = []
+    for i, name in enumerate(engine.layout.names):
+        team = store.find(name) or {"name": name}
+        reach = [round(float(p), 6) for p in levels[:, i]]
+        teams.append(TeamAdvancement(
+            name=team["name"],
+            seed=team.get("tournament_seed") or 0,
+            region=team.get("region") or "",
+            advancement=RoundAdvancement(
+                round_of_64=reach[0],
+                round_of_32=reach[1],
+                sweet_16=reach[2],
+                elite_8=reach[3],
+                final_four=reach[4],
+                championship=reach[5],
+                champion=reach[6],
+            ),
+            win_probability_distribution=build_win_distribution(
+                {str(k): round(float(p), 6) for k, p in enumerate(dists[:, i])}
+            ),
+            expected_wins=round(float(expected[i]), 4),
+        ))
+    teams.sort(key=lambda t: (-t.advancement.champion, t.name))
+    return AdvancementResponse(teams=teams)
+
+
+# Conditioned bracket, kept across results updates for the engine it wraps.
+_live_bracket: Optional[LiveBracket] = None
+
+
+def get_live_bracket() -> LiveBracket:
+    """Return the :class:`~app.bracket.LiveBracket` for the current engine.
+
+    It is replaced (starting unconditioned) only when the engine is rebuilt,
+    so each results update only recomputes the sub-brackets it touches.
+
+    Raises:
+        FileNotFoundError: If the bracket or H2H file is missing.
+        ValueError: If the bracket cannot be built.
+    """
+    global _live_bracket
+    engine = get_bracket_engine()
+    live = _live_bracket
+    if live is None or live.engine is not engine:
+        live = _live_bracket = LiveBracket(engine)
+    return live
+
+
+def _completed_games(tournament: Mapping) -> list[tuple[int, str, str, str]]:
+    """Return ``(round index, team1, team2, winner)`` for a results.json year.
+
+    Raises:
+        ValueError: If a round name or game record is not recognised.
+    """
+    games = []
+    for round_data in tournament.get("rounds", []):
+        name = round_data.get("name")
+        if name not in ROUND_NAMES:
+            raise ValueError(f"Unknown round in results: {name!r}")
+        r = ROUND_NAMES.index(name)
+        try:
+            games.extend(
+                (r, g["team1"]["name"], g["team2"]["name"], g["winner"])
+                for g in round_data.get("games", [])
+            )
+        except (KeyError, TypeError) as exc:
+            raise ValueError(f"Malformed {name} game: {exc!r}") from exc
+    return games
+
+
+def _latest_results() -> tuple[Mapping, list[tuple[int, str, str, str]]]:
+    """Return the latest year of results.json and its completed games.
+
+    Raises:
+        FileNotFoundError: If results.json is missing.
+        ValueError: If a round name or game record is not recognised.
+    """
+    tournaments = load_results_data()
+    tournament = max(tournaments, key=lambda t: t.get("year", 0), default={})
+    return tournament, _completed_games(tournament)
+
+
+def get_live_winners() -> np.ndarray:
+    """Return the completed games of the current tournament, by bracket node.
+
+    Returns:
+        Winners array from :func:`~app.bracket.fix_results`.
+
+    Raises:
+        FileNotFoundError: If a required data file is missing.
+        ValueError: If the bracket cannot be built or the results do not
+            fit it.
+    """
+    _, games = _latest_results()
+    return fix_results(get_bracket_engine().layout, games)
+
+
+def get_live_projections() -> LiveProjectionsResponse:
+    """Re-project the bracket conditioned on the games played so far.
+
+    Every completed game in the latest year of results.json is pinned
+    (:func:`~app.bracket.fix_results`) and the rest of the bracket is
+    re-projected by :class:`~app.bracket.LiveBracket`.  Only the
+    sub-brackets affected by games added since the last call are
+    recomputed.  Wins already earned are included, so each distribution
+    is over a team's final win total.
+
+    Returns:
+        LiveProjectionsResponse sorted by title probability, then expected
+        wins, then name.
+
+    Raises:
+        FileNotFoundError: If a required data file is missing.
+        ValueError: If the bracket cannot be built or the results do not
+            fit it.
+    """
+    live = get_live_bracket()
+    engine = live.engine
+    tournament, games = _latest_results()
+    winners = fix_results(engine.layout, games)
+    levels = live.update(winners)
+    wins, eliminated = engine.record(winners)
+    dists = engine.win_distribution(levels)
+    expected = np.arange(len(dists)) @ dists
+    store = get_team_store()
+
+    teams = []
+    for i, name in enumerate(engine.layout.names):
+        team = store.find(name) or {"name": name}
+        reach = [round(float(p), 6) for p in levels[:, i]]
+        teams.append(LiveTeamProjection(
+            name=team["name"],
+            seed=team.get("tournament_seed") or 0,
+            region=team.get("region") or "",
+            wins=int(wins[i]),
+            eliminated=bool(eliminated[i]),
+            advancement=RoundAdvancement(
+                round_of_64=reach[0],
+                round_of_32=reach[1],
+                sweet_16=reach[2],
+                elite_8=reach[3],
+                final_four=reach[4],
+                championship=reach[5],
+                champion=reach[6],
+            ),
+            win_probability_distribution=build_win_distribution(
+                {str(k): round(float(p), 6) for k, p in enumerate(dists[:, i])}
+            ),
+            expected_wins=round(float(expected[i]), 4),
+        ))
+    teams.sort(key=lambda t: (-t.advancement.champion, -t.expected_wins, t.name))
+    logger.info("get_live_projections: %d games, %d team-rounds recomputed",
+                len(games), live.recomputed)
+    return LiveProjectionsResponse(
+        year=tournament.get("year"), games_played=len(games), teams=teams
+    )
+
+
+# ---------------------------------------------------------------------------
+# Roster totals
+# ---------------------------------------------------------------------------
+
+# Shared simulated wins matrices, by live flag: (engine, winners, wins).
+_simulated_wins: dict[bool, tuple[BracketEngine, Optional[np.ndarray], np.ndarray]] = {}
+_simulated_wins_lock = threading.Lock()
+
+# Quantiles reported for a roster's total wins.
+ROSTER_QUANTILES = {"p10": 0.10, "p25": 0.25, "p50": 0.50, "p75": 0.75, "p90": 0.90}
+
+
+def get_simulated_wins(live: bool = False) -> np.ndarray:
+    """Return the shared ``(POOL_SIMULATIONS, teams)`` simulated wins matrix.
+
+    The tournaments are drawn once per engine (and, with ``live``, per set of
+    completed games) from the fixed :data:`SIMULATION_SEED`.  Every roster
+    is evaluated against the same sample, so a roster edit only costs a
+    column sum, and every worker serves the same numbers.
+
+    Args:
+        live: Pin the games played so far (see :func:`get_live_winners`).
+
+    Returns:
+        Wins per tournament (rows) and team (columns, in engine layout
+        order).  Shared between calls — must not be mutated.
+
+    Raises:
+        FileNotFoundError: If a required data file is missing.
+        ValueError: If the bracket cannot be built or the results do not
+            fit it.
+    """
+    engine = get_bracket_engine()
+    winners = get_live_winners() if live else None
+
+    def current(entry) -> bool:
+        return entry is not None and entry[0] is engine and (
+            (entry[1] is None and winners is None)
+            or (entry[1] is not None and winners is not None
+                and np.array_equal(entry[1], winners))
+        )
+
+    entry = _simulated_wins.get(live)
+    if current(entry):
+        return entry[2]
+    with _simulated_wins_lock:
+        # Another request may have drawn the sample while we waited.
+        entry = _simulated_wins.get(live)
+        if current(entry):
+            return entry[2]
+        outcomes = simulation.run(
+            engine, POOL_SIMULATIONS, seed=SIMULATION_SEED, winners=winners
+        )
+        wins = simulation.TournamentSimulator(engine).wins(outcomes)
+        wins.setflags(write=False)
+        _simulated_wins[live] = (engine, winners, wins)
+    return wins
+
+
+def get_roster_total_wins(
+    names: list[str],
+    method: str = "exact",
+    target: Optional[float] = None,
+    live: bool = False,
+) -> RosterTotalWins:
+    """Compute the distribution of a roster's combined tournament wins.
+
+    ``"exact"`` runs :meth:`~app.bracket.BracketEngine.total_wins` (about a
+    millisecond).  ``"simulated"`` sums the roster's columns of the shared
+    :func:`get_simulated_wins` sample.  Teams that cannot be resolved or are
+    not in the tournament field add no wins; a team listed twice counts
+    twice.
+
+    Args:
+        names: Roster team names (resolved like :func:`find_team`).
+        method: ``"exact"`` or ``"simulated"``.
+        target: Optional total to report the probability of beating.
+        live: Condition on the games played so far.
+
+    Returns:
+        :class:`~app.models.RosterTotalWins` for the roster.
+
+    Raises:
+        FileNotFoundError: If a required data file is missing.
+        ValueError: If the bracket cannot be built or the results do not
+            fit it.
+    """
+    engine = get_bracket_engine()
+    index = {name.casefold(): i for i, name in enumerate(engine.layout.names)}
+    counts = np.zeros(len(index), dtype=np.int64)
+    for name in names:
+        team = find_team(name)
+        i = index.get(team["name"].casefold()) if team is not None else None
+        if i is not None:
+            counts[i] += 1
+
+    simulations = None
+    if method == "simulated":
+        wins = get_simulated_wins(live)
+        totals = wins[:, counts > 0].astype(np.int64) @ counts[counts > 0]
+        dist = np.bincount(totals, minlength=6 * int(counts.sum()) + 1) / len(wins)
+        simulations = len(wins)
+    else:
+        winners = get_live_winners() if live else None
+        dist = np.clip(engine.total_wins(counts, winners), 0.0, None)
+
+    totals = np.arange(len(dist))
+    mean = float(totals @ dist)
+    cdf = np.cumsum(dist)
+    return RosterTotalWins(
+        method=method,
+        teams=int(counts.sum()),
+        distribution=[round(float(p), 6) for p in dist],
+        expected_wins=round(mean, 4),
+        std=round(float(np.sqrt(max((totals - mean) ** 2 @ dist, 0.0))), 4),
+        quantiles={
+            key: int(np.searchsorted(cdf, q - 1e-12))
+            for key, q in ROSTER_QUANTILES.items()
+        },
+        target=target,
+        beat_target=(
+            round(float(dist[totals > target].sum()), 6)
+            if target is not None else None
+        ),
+        simulations=simulations,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Pool standings
+# ---------------------------------------------------------------------------
+
+
+def get_pool_standings(request: StandingsRequest) -> StandingsResponse:
+    """Compute every roster's finishing-place odds within its pool.
+
+    All rosters are scored against the same tournaments — the first
+    ``request.simulations`` rows of :func:`get_simulated_wins` — through one
+    roster-by-team incidence matrix (see :func:`app.standings.pool_standings`).
+    Each distinct team name is resolved once, like :func:`find_team`; names
+    that do not resolve to a tournament team add no wins.
+
+    Args:
+        request: Rosters with their pools, plus the simulation settings.
+
+    Returns:
+        :class:`~app.models.StandingsResponse` with one entry per roster, in
+        request order.
+
+    Raises:
+        FileNotFoundError: If a required data file is missing.
+        ValueError: If the bracket cannot be built or the results do not
+            fit it.
+    """
+    wins = get_simulated_wins(request.live)
+    if request.simulations is not None:
+        wins = wins[:request.simulations]
+    index = {
+        name.casefold(): i for i, name in enumerate(get_bracket_engine().layout.names)
+    }
+
+    # Column of each distinct name (None if not in the field).
+    columns: dict[str, Optional[int]] = {}
+    rows, cols = [], []
+    pool_ids: dict[str, int] = {}
+    pools = np.empty(len(request.rosters), dtype=np.int32)
+    for r, roster in enumerate(request.rosters):
+        pools[r] = pool_ids.setdefault(roster.pool, len(pool_ids))
+        for name in roster.teams:
+            if name not in columns:
+                team = find_team(name)
+                columns[name] = (
+                    index.get(team["name"].casefold()) if team is not None else None
+                )
+            if columns[name] is not None:
+                rows.append(r)
+                cols.append(columns[name])
+
+    incidence = np.zeros((len(request.rosters), wins.shape[1]), dtype=np.float32)
+    cells = (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp))
+    np.add.at(incidence, cells, 1)
+    place_probs, expected_rank = pool_standings(
+        incidence, pools, wins, request.places
+    )
+
+    pool_sizes = np.bincount(pools, minlength=len(pool_ids))
+    teams = incidence.sum(axis=1).astype(int).tolist()
+    place_probs = np.round(place_probs, 6).tolist()
+    expected_rank = np.round(expected_rank, 4).tolist()
+    return StandingsResponse(
+        simulations=len(wins),
+        rosters=[
+            StandingsEntry(
+                pool=roster.pool,
+                manager=roster.manager,
+                teams=teams[r],
+                pool_size=int(pool_sizes[pools[r]]),
+                place_probabilities=place_probs[r],
+                expected_rank=expected_rank[r],
+            )
+            for r, roster in enumerate(request.rosters)
+        ],
+        unresolved_teams=[name for name, col in columns.items() if col is None],
+    )
@@ -0,0 +1,212 @@
+"""
+In-process cosine-similarity index over the team embedding vectors.
+
+The vector set (one PCA-reduced embedding per tournament team since 2009-10)
+is only a few thousand short vectors, so an exact brute-force search over a
+row-normalised float32 matrix takes microseconds — far less than an HTTP
+round-trip to ChromaDB.  :class:`SimilarityIndex` holds that matrix together
+with each row's ID and metadata.
+
+The index is built from the ``chroma_vectors.json`` export consumed by
+``scripts/import_vectors.py`` (``VECTORS_FILE``) or, if that file is absent,
+pulled once from the ChromaDB collection.  ``get_similar_teams`` uses it as
+the primary engine when ``SIMILARITY_ENGINE=numpy``, or as a fallback when
+ChromaDB is unreachable (``SIMILARITY_FALLBACK``).
+"""
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+from app.config import SIMILARITY_RETRY_SECONDS, VECTORS_FILE
+
+logger = logging.getLogger(__name__)
+
+# Page size used when pulling vectors out of ChromaDB.
+_PULL_PAGE_SIZE = 1000
+
+
+class SimilarityIndex:
+    """Exact cosine top-k search over a normalised embedding matrix.
+
+    Attributes:
+        ids: Document ID of each row (e.g. ``"duke_2026"``).
+        metadatas: Metadata dict of each row.
+        index: Document ID → row number.
+        vectors: Read-only ``(n, d)`` float32 array of unit-length rows.
+        years: Read-only ``(n,)`` array of each row's season year.
+    """
+
+    __slots__ = ("ids", "metadatas", "index", "vectors", "years")
+
+    def __init__(
+        self, ids: list[str], embeddings: Any, metadatas: list[dict]
+    ) -> None:
+        if not (len(ids) == len(embeddings) == len(metadatas)):
+            raise ValueError(
+                f"Mismatched lengths — ids: {len(ids)}, embeddings: "
+                f"{len(embeddings)}, metadatas: {len(metadatas)}"
+            )
+        vectors = np.asarray(embeddings, dtype=np.float32).reshape(len(ids), -1)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        # Zero vectors stay zero (similarity 0 to everything) instead of NaN.
+        vectors /= np.where(norms == 0, 1.0, norms)
+        vectors.setflags(write=False)
+
+        years = np.array([int(m.get("year", 0)) for m in metadatas], dtype=np.int32)
+        years.setflags(write=False)
+
+        self.ids = list(ids)
+        self.metadatas = list(metadatas)
+        self.index = {doc_id: i for i, doc_id in enumerate(self.ids)}
+        self.vectors = vectors
+        self.years = years
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_json(cls, path: Path) -> "SimilarityIndex":
+        """Build an index from a ``chroma_vectors.json`` export.
+
+        Args:
+            path: Path to the export (keys ``ids``, ``embeddings``,
+                ``metadatas``; ``documents`` is ignored).
+
+        Returns:
+            The loaded :class:`SimilarityIndex`.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file is not valid JSON or the lists disagree.
+            KeyError: If a required key is missing.
+        """
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+        return cls(data["ids"], data["embeddings"], data["metadatas"])
+
+    @classmethod
+    def from_collection(cls, collection: Any) -> "SimilarityIndex":
+        """Build an index by paging every record out of a ChromaDB collection.
+
+        Args:
+            collection: ChromaDB collection handle.
+
+        Returns:
+            The loaded :class:`SimilarityIndex`.
+        """
+        ids: list[str] = []
+        embeddings: list = []
+        metadatas: list[dict] = []
+        offset = 0
+        while True:
+            page = collection.get(
+                include=["embeddings", "metadatas"],
+                limit=_PULL_PAGE_SIZE,
+                offset=offset,
+            )
+            if len(page["ids"]) == 0:
+                break
+            ids.extend(page["ids"])
+            embeddings.extend(page["embeddings"])
+            metadatas.extend(page["metadatas"])
+            offset += len(page["ids"])
+        return cls(ids, embeddings, metadatas)
+
+    def most_similar(
+        self, doc_id: str, k: int, exclude_year: Optional[int] = None
+    ) -> Optional[list[tuple[dict, float]]]:
+        """Return the ``k`` rows most similar to ``doc_id`` by cosine similarity.
+
+        Args:
+            doc_id: Document ID of the query row.
+            k: Number of neighbours to return.
+            exclude_year: Season whose rows are skipped (the query row's own
+                season, so current teams are never matched with each other).
+
+        Returns:
+            ``(metadata, cosine_similarity)`` pairs, most similar first, or
+            ``None`` if ``doc_id`` is not in the index.
+        """
+        row = self.index.get(doc_id)
+        if row is None:
+            return None
+
+        scores = self.vectors @ self.vectors[row]
+        scores[row] = -np.inf
+        if exclude_year is not None:
+            scores[self.years == exclude_year] = -np.inf
+
+        k = min(k, int(np.isfinite(scores).sum()))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.metadatas[i], float(scores[i])) for i in top]
+
+
+# ---------------------------------------------------------------------------
+# Process-wide index
+# ---------------------------------------------------------------------------
+
+_similarity_index: Optional[SimilarityIndex] = None
+# After a failed load, time.monotonic() before which no new load is tried.
+_similarity_retry_at = 0.0
+
+
+def load_similarity_index(
+    path: Optional[Path] = None, collection: Any = None
+) -> Optional[SimilarityIndex]:
+    """Load (or return the already loaded) process-wide similarity index.
+
+    The JSON export is preferred; ``collection`` is only pulled from when the
+    export is missing or unreadable.  A failed load is remembered for
+    ``SIMILARITY_RETRY_SECONDS``: until then calls return ``None`` without
+    touching the filesystem.
+
+    Args:
+        path: Path of the vectors JSON export (default: ``VECTORS_FILE``).
+        collection: Optional ChromaDB collection to pull vectors from.
+
+    Returns:
+        The loaded index, or ``None`` if neither source is available.
+    """
+    global _similarity_index, _similarity_retry_at
+
+    if _similarity_index is not None:
+        return _similarity_index
+    if time.monotonic() < _similarity_retry_at:
+        return None
+
+    path = path or VECTORS_FILE
+    index: Optional[SimilarityIndex] = None
+    if path.exists():
+        try:
+            index = SimilarityIndex.from_json(path)
+            logger.info("Similarity index loaded from %s (%d vectors)",
+                        path, len(index))
+        except (OSError, ValueError, KeyError):
+            logger.exception("Could not load similarity index from %s", path)
+    if index is None and collection is not None:
+        try:
+            index = SimilarityIndex.from_collection(collection)
+            logger.info("Similarity index pulled from ChromaDB (%d vectors)",
+                        len(index))
+        except Exception:
+            logger.exception("Could not pull similarity index from ChromaDB")
+
+    if index is None:
+        _similarity_retry_at = time.monotonic() + SIMILARITY_RETRY_SECONDS
+        logger.warning("No similarity index available (%s); retrying in %.0fs",
+                       path, SIMILARITY_RETRY_SECONDS)
+    _similarity_index = index
+    return index
+
+
+def get_similarity_index() -> Optional[SimilarityIndex]:
+    """Return the process-wide index, loading it from ``VECTORS_FILE`` if needed."""
+    return load_similarity_index()
@@ -0,0 +1,305 @@
+"""
+Vectorized Monte Carlo tournament simulation.
+
+The bracket DP (app/bracket.py) gives exact per-team marginals, but not
+joint outcomes — two teams' wins together, pool standings, bracket-score
+distributions.  Those come from sampling whole tournaments.
+
+:class:`TournamentSimulator` draws ``n`` tournaments at once as an ``(n,
+games)`` array with one column per game (the First Four games, then each
+round's games in bracket order).  Each round is a handful of whole-array
+NumPy operations: pair up the surviving teams, look up their head-to-head
+probabilities, and compare with uniform draws.  Completed games (from
+:func:`app.bracket.fix_results`) can be pinned so that only the rest of the
+tournament is sampled.
+
+:func:`run` splits large ``n`` into fixed-size shards.  Each shard gets its
+own :class:`numpy.random.SeedSequence` child stream, and the shards can run
+in a :class:`~concurrent.futures.ProcessPoolExecutor`.  Shard boundaries and
+streams depend only on ``n``, the seed and the shard size, so a seeded run
+returns the same tournaments whatever the number of workers.
+
+Usage:
+    python -m app.simulation -n 1000000 --workers 4 --seed 2026
+"""
+
+import argparse
+import logging
+import math
+import multiprocessing
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+from app.bracket import ROUND_NAMES, BracketEngine
+from app.config import SIMULATION_SHARD_SIZE, SIMULATION_WORKERS
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Simulator
+# ---------------------------------------------------------------------------
+
+
+class TournamentSimulator:
+    """Samples complete tournaments from a bracket and its H2H matrix.
+
+    Args:
+        engine: The bracket and head-to-head probabilities to sample from.
+        winners: Optional completed games from
+            :func:`~app.bracket.fix_results`; those games always go to their
+            recorded winner.
+
+    Attributes:
+        games: ``(round index, node)`` of each outcome column.  Round 0 holds
+            only the First Four games; a round ``r`` node is the game played
+            by slots ``node << r`` to ``((node + 1) << r) - 1``.
+        dtype: Integer type of team indices in sampled outcomes.
+    """
+
+    __slots__ = (
+        "engine", "games", "dtype", "_first", "_ff_slots", "_ff_teams",
+        "_probs", "_pinned",
+    )
+
+    def __init__(
+        self, engine: BracketEngine, winners: Optional[np.ndarray] = None
+    ) -> None:
+        slots = engine.layout.slots
+        n = len(engine.layout)
+        self.engine = engine
+        self.dtype = np.min_scalar_type(n - 1)
+
+        # First team of each slot; First Four slots get their winner later.
+        first = np.empty(64, dtype=self.dtype)
+        first[slots[::-1]] = np.arange(n)[::-1]
+        self._first = first
+        self._ff_slots = np.flatnonzero(np.bincount(slots, minlength=64) == 2)
+        self._ff_teams = np.array(
+            [np.flatnonzero(slots == s) for s in self._ff_slots], dtype=self.dtype
+        ).reshape(-1, 2)
+        self._probs = engine.probs.astype(np.float32)
+
+        nodes = [self._ff_slots] + [
+            np.arange(64 >> r) for r in range(1, len(ROUND_NAMES))
+        ]
+        self.games = tuple((r, int(node)) for r, ns in enumerate(nodes) for node in ns)
+
+        # _pinned[r]: (column positions within round r, winning teams).
+        self._pinned = []
+        for r, ns in enumerate(nodes):
+            known = winners[r, ns] if winners is not None else np.full(len(ns), -1)
+            decided = np.flatnonzero(known >= 0)
+            self._pinned.append((decided, known[decided].astype(self.dtype)))
+
+    def sample(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        """Draw ``n`` independent tournaments.
+
+        Args:
+            n: Number of tournaments.
+            rng: Random generator to draw from.
+
+        Returns:
+            ``(n, len(games))`` array of winning team indices (layout order).
+        """
+        out = np.empty((n, len(self.games)), dtype=self.dtype)
+        alive = np.empty((n, 64), dtype=self.dtype)
+        alive[:] = self._first
+
+        col = 0
+        for r, (decided, pinned) in enumerate(self._pinned):
+            if r == 0:
+                if not len(self._ff_slots):
+                    continue
+                a, b = self._ff_teams[:, 0], self._ff_teams[:, 1]
+            else:
+                a, b = alive[:, 0::2], alive[:, 1::2]
+            shape = np.broadcast_shapes((n, 1), np.shape(a))
+            draws = rng.random(shape, dtype=np.float32)
+            won = np.where(draws < self._probs[a, b], a, b)
+            won[:, decided] = pinned
+            if r == 0:
+                alive[:, self._ff_slots] = won
+            else:
+                alive = won
+            out[:, col:col + won.shape[1]] = won
+            col += won.shape[1]
+        return out
+
+    def wins(self, outcomes: np.ndarray) -> np.ndarray:
+        """Count each team's tournament wins in sampled outcomes.
+
+        Args:
+            outcomes: Output of :meth:`sample`.
+
+        Returns:
+            ``(n, teams)`` uint8 array of wins per tournament (First Four
+            games do not count).
+        """
+        n, teams = len(outcomes), len(self.engine.layout)
+        played = outcomes[:, len(self._ff_slots):].astype(np.intp)
+        played += np.arange(n)[:, None] * teams
+        counts = np.bincount(played.ravel(), minlength=n * teams)
+        return counts.reshape(n, teams).astype(np.uint8)
+
+
+# ---------------------------------------------------------------------------
+# Sharded runs
+# ---------------------------------------------------------------------------
+
+
+class ThroughputMeter:
+    """Counts the simulations run in this process (reported on /api/metrics).
+
+    Attributes:
+        runs: Calls to :func:`run`.
+        simulations: Tournaments drawn.
+        seconds: Wall time spent in :func:`run`.
+        last_rate: Tournaments per second of the most recent run.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.runs = 0
+        self.simulations = 0
+        self.seconds = 0.0
+        self.last_rate = 0.0
+
+    def record(self, n: int, seconds: float) -> float:
+        """Add one run and return its rate in tournaments per second."""
+        rate = n / seconds if seconds > 0 else 0.0
+        with self._lock:
+            self.runs += 1
+            self.simulations += n
+            self.seconds += seconds
+            self.last_rate = rate
+        return rate
+
+    def stats(self) -> dict:
+        """Return the counters and overall and last-run throughput."""
+        return {
+            "runs": self.runs,
+            "simulations": self.simulations,
+            "seconds": round(self.seconds, 3),
+            "sims_per_second": (
+                round(self.simulations / self.seconds) if self.seconds else 0
+            ),
+            "last_sims_per_second": round(self.last_rate),
+        }
+
+
+meter = ThroughputMeter()
+
+# Simulator of a process-pool worker, installed by _init_worker.
+_worker_simulator: Optional[TournamentSimulator] = None
+
+
+def _init_worker(engine: BracketEngine, winners: Optional[np.ndarray]) -> None:
+    global _worker_simulator
+    _worker_simulator = TournamentSimulator(engine, winners)
+
+
+def _run_shard(size: int, seed: np.random.SeedSequence) -> np.ndarray:
+    return _worker_simulator.sample(size, np.random.default_rng(seed))
+
+
+def run(
+    engine: BracketEngine,
+    n: int,
+    seed: Optional[int] = None,
+    workers: int = SIMULATION_WORKERS,
+    shard_size: int = SIMULATION_SHARD_SIZE,
+    winners: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Draw ``n`` tournaments in shards, optionally across worker processes.
+
+    Shard ``i`` has its own ``SeedSequence(seed).spawn()`` child stream and
+    shards are concatenated in order, so for a given ``seed`` and
+    ``shard_size`` the result does not depend on ``workers``.
+
+    Args:
+        engine: The bracket to sample.
+        n: Number of tournaments.
+        seed: Root seed (``None`` for fresh OS entropy).
+        workers: Worker processes; 1 samples in this process.
+        shard_size: Tournaments per shard, which bounds each shard's memory.
+        winners: Optional completed games to pin, from
+            :func:`~app.bracket.fix_results`.
+
+    Returns:
+        ``(n, games)`` outcomes, as from :meth:`TournamentSimulator.sample`.
+    """
+    started = time.perf_counter()
+    count = max(1, math.ceil(n / shard_size))
+    sizes = [min(shard_size, n - i * shard_size) for i in range(count)]
+    seeds = np.random.SeedSequence(seed).spawn(count)
+
+    if workers <= 1 or count == 1:
+        simulator = TournamentSimulator(engine, winners)
+        shards = [
+            simulator.sample(size, np.random.default_rng(s))
+            for size, s in zip(sizes, seeds)
+        ]
+    else:
+        # Spawned (not forked) workers: the server process runs threads.
+        with ProcessPoolExecutor(
+            max_workers=min(workers, count),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(engine, winners),
+        ) as pool:
+            shards = list(pool.map(_run_shard, sizes, seeds))
+
+    outcomes = np.concatenate(shards)
+    seconds = time.perf_counter() - started
+    rate = meter.record(n, seconds)
+    logger.info("Simulated %d tournaments in %.2fs (%.0f/s, %d shard(s), %d worker(s))",
+                n, seconds, rate, count, workers)
+    return outcomes
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("-n", type=int, default=1_000_000, help="Tournaments")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--workers", type=int, default=SIMULATION_WORKERS,
+        help="Worker processes (default: SIMULATION_WORKERS, %(default)s)",
+    )
+    parser.add_argument("--shard-size", type=int, default=SIMULATION_SHARD_SIZE)
+    parser.add_argument("--live", action="store_true",
+                        help="Condition on the completed games in results.json")
+    parser.add_argument("--top", type=int, default=10,
+                        help="Title odds to print (default: %(default)s)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level="WARNING")
+
+    from app import services
+
+    engine = services.get_bracket_engine()
+    winners = services.get_live_winners() if args.live else None
+    outcomes = run(engine, args.n, args.seed, args.workers, args.shard_size, winners)
+    stats = meter.stats()
+    print(f"{args.n:,} tournaments in {stats['seconds']:.2f}s — "
+          f"{stats['last_sims_per_second']:,} per second "
+          f"({stats['last_sims_per_second'] * 60:,} per minute)")
+
+    exact = engine.advancement(winners=winners)[-1]
+    champions = np.bincount(outcomes[:, -1], minlength=len(exact)) / args.n
+    print(f"{'Team':<24}{'Simulated':>10}{'Exact':>10}")
+    for i in np.argsort(-champions)[:args.top]:
+        print(f"{engine.layout.names[i]:<24}{champions[i]:>10.4f}{exact[i]:>10.4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
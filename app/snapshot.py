@@ -0,0 +1,530 @@
+"""
+Versioned binary snapshot of the prediction files, memory-mapped by the API.
+
+Parsing ``predictions.json`` and ``h2h-predictions.json`` costs every worker
+a few hundred milliseconds and leaves it holding its own copy of tens of
+thousands of small dicts.  The snapshot stores the same data column-wise in
+one file that every worker memory-maps, so opening it takes milliseconds and
+the pages are shared through the OS page cache:
+
+  - Scalar fields become contiguous ``int64`` / ``float64`` arrays.
+  - Strings are stored once each in a string table and referenced by index.
+  - Nested records (``win_probability_distribution``, the H2H ``team1`` /
+    ``team2`` sides) become child tables; lists of records (``players``)
+    become child tables plus a row-offset array.
+  - Per-team recaps (``summaries``) go into an offset-indexed blob read by
+    :class:`app.recaps.RecapStore`.
+  - The compiled H2H probability matrix is stored ready to use.
+
+Records are exposed as read-only :class:`RecordView` mappings, so existing
+code that indexes team dicts works unchanged.  Values are decoded from the
+mapped arrays on access.
+
+File layout::
+
+    MAGIC (8 bytes) | version (uint32) | header length (uint32) | header JSON
+    | padding to 8 bytes | section data (each section 8-byte aligned)
+
+The header records the format version and the size/mtime of the source files
+the snapshot was compiled from; a snapshot with another version or stale
+sources is rejected and recompiled.  Build one ahead of time with:
+
+    uv run python -m app.snapshot
+"""
+
+import json
+import logging
+import mmap
+import struct
+from array import array
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+import numpy as np
+
+from app.atomic import write_atomic
+from app.recaps import RecapStore
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+SNAPSHOT_FILENAME = "dataset.snap"
+
+# File signature and format version; bump the version on any layout change.
+MAGIC = b"MMSNAP\x00\x00"
+SNAPSHOT_VERSION = 1
+
+_PREAMBLE = struct.Struct("<8sII")
+_ALIGN = 8
+
+# Per-row value state, stored only for columns that have nulls or gaps.
+_VALUE, _NULL, _ABSENT = 0, 1, 2
+
+# Returned by _Column.value for a key the row does not have.
+_MISSING = object()
+
+# ---------------------------------------------------------------------------
+# Views
+# ---------------------------------------------------------------------------
+
+
+class _Strings:
+    """String table: offsets into a UTF-8 blob, decoded once on first use."""
+
+    __slots__ = ("_offsets", "_blob", "_cache")
+
+    def __init__(self, offsets: memoryview, blob: memoryview) -> None:
+        self._offsets = offsets
+        self._blob = blob
+        self._cache: list[Optional[str]] = [None] * (len(offsets) - 1)
+
+    def __getitem__(self, index: int) -> str:
+        value = self._cache[index]
+        if value is None:
+            start, end = self._offsets[index], self._offsets[index + 1]
+            value = self._cache[index] = str(self._blob[start:end], "utf-8")
+        return value
+
+
+class _Column:
+    """One field of a table; decodes the value at a row on demand."""
+
+    __slots__ = ("kind", "data", "states", "child", "offsets", "strings")
+
+    def __init__(
+        self,
+        kind: str,
+        data: Optional[memoryview],
+        states: Optional[memoryview],
+        child: Optional["_Table"],
+        offsets: Optional[memoryview],
+        strings: _Strings,
+    ) -> None:
+        self.kind = kind
+        self.data = data
+        self.states = states
+        self.child = child
+        self.offsets = offsets
+        self.strings = strings
+
+    def value(self, row: int) -> Any:
+        """Return the value at ``row``, ``None`` for null, or ``_MISSING``."""
+        if self.states is not None:
+            state = self.states[row]
+            if state == _NULL:
+                return None
+            if state == _ABSENT:
+                return _MISSING
+        kind = self.kind
+        if kind == "int" or kind == "float":
+            return self.data[row]
+        if kind == "str":
+            return self.strings[self.data[row]]
+        if kind == "record":
+            return RecordView(self.child, row)
+        if kind == "list":
+            return ListView(self.child, self.offsets[row], self.offsets[row + 1])
+        if kind == "json":
+            return json.loads(self.strings[self.data[row]])
+        return None  # "null": every row is null or absent
+
+
+class _Table:
+    """Columns of a compiled record list, keyed by field name."""
+
+    __slots__ = ("rows", "columns")
+
+    def __init__(self, rows: int, columns: dict[str, _Column]) -> None:
+        self.rows = rows
+        self.columns = columns
+
+
+class RecordView(Mapping):
+    """Read-only dict-like view of one compiled record.
+
+    Keys iterate in the order of the source JSON; a key the source record
+    did not have is absent here too.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: _Table, row: int) -> None:
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, key: str) -> Any:
+        column = self._table.columns.get(key)
+        if column is None:
+            raise KeyError(key)
+        value = column.value(self._row)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        row = self._row
+        for key, column in self._table.columns.items():
+            if column.states is None or column.states[row] != _ABSENT:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"RecordView({dict(self)!r})"
+
+
+class ListView(Sequence):
+    """Read-only list-like view of a run of rows in a child table."""
+
+    __slots__ = ("_table", "_start", "_stop")
+
+    def __init__(self, table: _Table, start: int, stop: int) -> None:
+        self._table = table
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ListView index out of range")
+        return RecordView(self._table, self._start + index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, ListView)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ListView({list(self)!r})"
+
+
+# ---------------------------------------------------------------------------
+# Writer
+# ---------------------------------------------------------------------------
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+class _SnapshotWriter:
+    """Accumulates sections and the string table while a snapshot is built."""
+
+    def __init__(self) -> None:
+        self.sections: list[bytes] = []
+        self._strings: dict[str, int] = {}
+
+    def section(self, data: bytes) -> int:
+        """Append a data section and return its index."""
+        self.sections.append(data)
+        return len(self.sections) - 1
+
+    def string(self, value: str) -> int:
+        """Return the string-table index of ``value``, adding it if new."""
+        index = self._strings.get(value)
+        if index is None:
+            index = self._strings[value] = len(self._strings)
+        return index
+
+    def table(self, rows: list[dict]) -> dict:
+        """Encode a list of dicts column-wise; return the table schema."""
+        keys: dict[str, None] = {}
+        for row in rows:
+            keys.update(dict.fromkeys(row))
+        return {
+            "rows": len(rows),
+            "columns": [self._column(key, rows) for key in keys],
+        }
+
+    def _column(self, key: str, rows: list[dict]) -> dict:
+        values = [row.get(key, _MISSING) for row in rows]
+        states = [
+            _ABSENT if v is _MISSING else _NULL if v is None else _VALUE
+            for v in values
+        ]
+        present = [v for v, s in zip(values, states) if s == _VALUE]
+        column: dict[str, Any] = {
+            "key": key,
+            "states": self.section(bytes(states)) if any(states) else None,
+        }
+
+        def filled(default: Any) -> list:
+            return [v if s == _VALUE else default for v, s in zip(values, states)]
+
+        if not present:
+            column["kind"] = "null"
+        elif all(_is_int(v) and -(2**63) <= v < 2**63 for v in present):
+            column["kind"] = "int"
+            column["data"] = self.section(array("q", filled(0)).tobytes())
+        elif all(isinstance(v, float) for v in present):
+            column["kind"] = "float"
+            column["data"] = self.section(array("d", filled(0.0)).tobytes())
+        elif all(isinstance(v, str) for v in present):
+            column["kind"] = "str"
+            column["data"] = self.section(
+                array("q", [self.string(v) for v in filled("")]).tobytes()
+            )
+        elif all(isinstance(v, dict) for v in present):
+            column["kind"] = "record"
+            column["child"] = self.table(filled({}))
+        elif all(
+            isinstance(v, list) and all(isinstance(item, dict) for item in v)
+            for v in present
+        ):
+            offsets = [0]
+            items: list[dict] = []
+            for value in filled([]):
+                items.extend(value)
+                offsets.append(len(items))
+            column["kind"] = "list"
+            column["offsets"] = self.section(array("q", offsets).tobytes())
+            column["child"] = self.table(items)
+        else:
+            column["kind"] = "json"
+            column["data"] = self.section(
+                array(
+                    "q",
+                    [self.string(json.dumps(v, ensure_ascii=False)) for v in filled(0)],
+                ).tobytes()
+            )
+        return column
+
+    def string_sections(self) -> tuple[int, int]:
+        """Write the string table; return its (offsets, blob) section indexes."""
+        encoded = [s.encode("utf-8") for s in self._strings]
+        offsets = [0]
+        for chunk in encoded:
+            offsets.append(offsets[-1] + len(chunk))
+        return (
+            self.section(array("q", offsets).tobytes()),
+            self.section(b"".join(encoded)),
+        )
+
+
+def _padding(length: int) -> bytes:
+    return b"\x00" * (-length % _ALIGN)
+
+
+def write_snapshot(
+    path: Path,
+    sources: dict[str, Optional[dict]],
+    teams: list[dict],
+    h2h_entries: Optional[list[dict]] = None,
+    h2h_names: Optional[list[str]] = None,
+    h2h_probs: Optional[np.ndarray] = None,
+) -> int:
+    """Compile the prediction data into a snapshot file at ``path``.
+
+    The input records are not modified.  The file is written to a temporary
+    name and atomically renamed, so readers never see a partial snapshot.
+
+    Args:
+        path: Destination file.
+        sources: Source file name → size/mtime signature (``None`` if the
+            file is absent), checked by :func:`open_snapshot`.
+        teams: Raw team dicts from ``predictions.json`` (with ``summaries``).
+        h2h_entries: Raw matchup dicts from ``h2h-predictions.json``.
+        h2h_names: Display names of the compiled H2H matrix, in index order.
+        h2h_probs: The compiled ``(n, n)`` H2H probability matrix.
+
+    Returns:
+        Size of the written snapshot in bytes.
+    """
+    writer = _SnapshotWriter()
+
+    # Recaps: one UTF-8 JSON array per team, back to back.
+    recap_chunks: list[bytes] = []
+    recaps: dict[str, list[int]] = {}
+    position = 0
+    for team in teams:
+        encoded = json.dumps(
+            team.get("summaries") or [], ensure_ascii=False
+        ).encode("utf-8")
+        recaps.setdefault(team["name"].casefold(), [position, len(encoded)])
+        recap_chunks.append(encoded)
+        position += len(encoded)
+
+    header: dict[str, Any] = {
+        "version": SNAPSHOT_VERSION,
+        "sources": sources,
+        "teams": writer.table(
+            [{k: v for k, v in t.items() if k != "summaries"} for t in teams]
+        ),
+        "recaps": {
+            "blob": writer.section(b"".join(recap_chunks)),
+            "teams": recaps,
+        },
+        "h2h": None,
+    }
+    if h2h_entries is not None:
+        probs = np.ascontiguousarray(h2h_probs, dtype="<f8")
+        header["h2h"] = {
+            "entries": writer.table(h2h_entries),
+            "names": list(h2h_names),
+            "probs": writer.section(probs.tobytes()),
+        }
+    header["strings"] = writer.string_sections()
+
+    # Section offsets are relative to the start of the data region.
+    spans: list[list[int]] = []
+    position = 0
+    for data in writer.sections:
+        spans.append([position, len(data)])
+        position += len(data) + len(_padding(len(data)))
+    header["sections"] = spans
+
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    preamble = _PREAMBLE.pack(MAGIC, SNAPSHOT_VERSION, len(header_bytes))
+    head = preamble + header_bytes
+    parts = [head, _padding(len(head))]
+    for data in writer.sections:
+        parts.extend((data, _padding(len(data))))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return write_atomic(path, parts)
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+
+class Snapshot:
+    """An opened, memory-mapped dataset snapshot.
+
+    Attributes:
+        path: File the snapshot was opened from.
+        sources: Source file signatures recorded at compile time.
+        teams: One :class:`RecordView` per team, in file order.
+        recaps: Recap store reading from the mapped recap blob.
+        h2h_entries: One :class:`RecordView` per H2H matchup, or ``None``.
+        h2h_names: Display names of the compiled H2H matrix, or ``None``.
+        h2h_probs: Read-only ``(n, n)`` float64 H2H matrix, or ``None``.
+    """
+
+    def __init__(self, path: Path, buffer: mmap.mmap) -> None:
+        self.path = path
+        self._buffer = buffer
+        magic, version, header_len = _PREAMBLE.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a dataset snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"{path} has snapshot version {version}, expected {SNAPSHOT_VERSION}"
+            )
+        start = _PREAMBLE.size
+        header = json.loads(buffer[start:start + header_len])
+        base = start + header_len
+        base += -base % _ALIGN
+
+        view = memoryview(buffer)
+        self._sections = [
+            view[base + offset:base + offset + length]
+            for offset, length in header["sections"]
+        ]
+        offsets_section, blob_section = header["strings"]
+        self._strings = _Strings(
+            self._sections[offsets_section].cast("q"), self._sections[blob_section]
+        )
+
+        self.sources: dict = header["sources"]
+        self.teams: list[RecordView] = self._records(header["teams"])
+
+        blob_offset = header["sections"][header["recaps"]["blob"]][0] + base
+        self.recaps = RecapStore(
+            buffer,
+            {
+                name: (blob_offset + offset, length)
+                for name, (offset, length) in header["recaps"]["teams"].items()
+            },
+        )
+
+        h2h = header["h2h"]
+        self.h2h_entries: Optional[list[RecordView]] = None
+        self.h2h_names: Optional[list[str]] = None
+        self.h2h_probs: Optional[np.ndarray] = None
+        if h2h is not None:
+            self.h2h_entries = self._records(h2h["entries"])
+            self.h2h_names = h2h["names"]
+            n = len(self.h2h_names)
+            # Backed by the read-only map, so the array is read-only too.
+            self.h2h_probs = np.frombuffer(
+                self._sections[h2h["probs"]], dtype="<f8"
+            ).reshape(n, n)
+
+    def _table(self, schema: dict) -> _Table:
+        columns: dict[str, _Column] = {}
+        for spec in schema["columns"]:
+            kind = spec["kind"]
+            data = None
+            if "data" in spec:
+                data = self._sections[spec["data"]].cast(
+                    "d" if kind == "float" else "q"
+                )
+            states = None
+            if spec["states"] is not None:
+                states = self._sections[spec["states"]]
+            offsets = None
+            if "offsets" in spec:
+                offsets = self._sections[spec["offsets"]].cast("q")
+            child = self._table(spec["child"]) if "child" in spec else None
+            columns[spec["key"]] = _Column(
+                kind, data, states, child, offsets, self._strings
+            )
+        return _Table(schema["rows"], columns)
+
+    def _records(self, schema: dict) -> list[RecordView]:
+        table = self._table(schema)
+        return [RecordView(table, row) for row in range(table.rows)]
+
+
+def open_snapshot(path: Path) -> Snapshot:
+    """Memory-map and open the snapshot at ``path``.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If it is not a snapshot or has another format version.
+    """
+    with open(path, "rb") as fh:
+        buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return Snapshot(path, buffer)
+    except (struct.error, KeyError, IndexError, TypeError) as exc:
+        raise ValueError(f"{path} is not a valid dataset snapshot: {exc}") from exc
+
+
+def source_signature(path: Path) -> Optional[dict]:
+    """Return the size/mtime signature of a source file (``None`` if absent)."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    """Compile the dataset snapshot for the configured prediction files."""
+    from app.services import compile_dataset_snapshot
+
+    logging.basicConfig(level=logging.INFO)
+    compile_dataset_snapshot()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Pool standings for many rosters against shared simulated tournaments.
+
+Every roster is scored in every simulated tournament at once.  The rosters
+form an ``(m, teams)`` incidence matrix (how many times each team is on each
+roster) and the tournaments an ``(n, teams)`` wins matrix (app/simulation.py).
+One matrix product gives each roster's total in each tournament.  A
+roster's rank is one plus the number of rosters in its pool with a strictly
+higher total in that tournament, so tied rosters share the better place.
+Ranks come from a histogram of each pool's totals per tournament or, when
+the pools are small, from comparing each pool's rosters pairwise.  Nothing
+loops over rosters in Python.
+
+Tournaments are processed in chunks sized so that the ``(m, chunk)`` score
+block and its histograms stay within :data:`CHUNK_CELLS` cells, which bounds
+memory for 100,000 rosters.  On one core, 100,000 rosters in pools of 50 are
+ranked against 10,000 tournaments in about 30 seconds.
+
+Usage:
+    python -m app.standings rosters.json [-o standings.json]
+        [--simulations 10000] [--places 3] [--live]
+
+The input file holds the same JSON body as ``POST /api/pools/standings``.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on roster-by-tournament score cells held at once (64 MB of
+# float32).
+CHUNK_CELLS = 16_000_000
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+
+def pool_standings(
+    incidence: np.ndarray,
+    pools: np.ndarray,
+    wins: np.ndarray,
+    places: int = 3,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute each roster's finishing-place probabilities within its pool.
+
+    Args:
+        incidence: ``(m, teams)`` count of each team on each roster.
+        pools: ``(m,)`` pool index (0-based) of each roster.
+        wins: ``(n, teams)`` wins per simulated tournament and team.
+        places: Finishing places to report (1st … ``places``-th).
+
+    Returns:
+        ``(place_probs, expected_rank)`` — ``(m, places)`` probability of
+        finishing in each of the first ``places`` places, and ``(m,)``
+        expected rank (1 = best).
+    """
+    m, n = len(incidence), len(wins)
+    pools = np.asarray(pools, dtype=np.int32)
+    incidence = np.asarray(incidence, dtype=np.float32)
+    place_counts = np.zeros((m, places), dtype=np.int64)
+    rank_sum = np.zeros(m, dtype=np.int64)
+    if not m or not n:
+        return place_counts / max(n, 1), 1.0 + rank_sum
+
+    sizes = np.bincount(pools)
+    n_pools, largest = len(sizes), int(sizes.max())
+    # One histogram bin per possible total, plus one.
+    top = int(incidence.sum(axis=1).max()) * 6 + 2
+
+    # Small pools compare their rosters pairwise rather than fill a mostly
+    # empty histogram each.  Rough costs in passes over an (m, chunk) block,
+    # as measured: 1 + largest / 10 (with padding) for pairwise, and
+    # 2.5 + histogram size / m for histograms.
+    pairwise = m + n_pools * largest * largest / 10 < 2.5 * m + n_pools * top
+    if pairwise:
+        order = np.argsort(pools, kind="stable")
+        starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        seat = np.empty(m, dtype=np.intp)
+        seat[order] = np.arange(m) - starts[pools[order]]
+        # Row of each roster in the padded (pool, seat) grid.
+        grid_row = pools * largest + seat
+        width = n_pools * largest
+    else:
+        width = max(m, n_pools * top)
+
+    chunk = max(1, min(n, CHUNK_CELLS // width))
+    base = None
+    for start in range(0, n, chunk):
+        block = wins[start:start + chunk].astype(np.float32)
+        c = len(block)
+        # Totals are small integers, exact in float32.
+        scores = (incidence @ block.T).astype(np.int32)
+        if pairwise:
+            ahead = _ahead_pairwise(scores, grid_row, n_pools, largest)
+        else:
+            if base is None or base.shape[1] != c:
+                # Bin of total 0 for each roster's (pool, tournament).
+                base = (pools[:, None] * c + np.arange(c, dtype=np.int32)) * top
+            ahead = _ahead_histogram(scores + base, n_pools * c, top)
+
+        rank_sum += ahead.sum(axis=1)
+        for place in range(places):
+            place_counts[:, place] += np.count_nonzero(ahead == place, axis=1)
+
+    return place_counts / n, 1.0 + rank_sum / n
+
+
+def _ahead_histogram(cells: np.ndarray, groups: int, top: int) -> np.ndarray:
+    """Count the rosters ahead of each roster from per-pool histograms.
+
+    ``cells`` holds each roster's total offset into its own ``top``-bin
+    histogram, one histogram per (pool, tournament) group.
+    """
+    hist = np.bincount(cells.ravel(), minlength=groups * top)
+    at_most = np.cumsum(hist.reshape(groups, top), axis=1, dtype=np.int32)
+    beaten_by = at_most[:, -1:] - at_most
+    return np.take(beaten_by, cells)
+
+
+def _ahead_pairwise(
+    scores: np.ndarray, grid_row: np.ndarray, n_pools: int, largest: int
+) -> np.ndarray:
+    """Count the rosters ahead of each roster by comparing within pools.
+
+    Rosters are laid out on a ``(pool, seat)`` grid padded with totals of -1,
+    which are never ahead of anyone.
+    """
+    c = scores.shape[1]
+    grid = np.full((n_pools * largest, c), -1, dtype=np.int16)
+    grid[grid_row] = scores
+    grid = grid.reshape(n_pools, largest, c)
+    ahead = np.zeros(grid.shape, dtype=np.int32)
+    for seat in range(largest):
+        ahead += grid[:, seat:seat + 1] > grid
+    return ahead.reshape(-1, c)[grid_row]
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("rosters", help="JSON file: {\"rosters\": [...]}")
+    parser.add_argument("-o", "--output", help="Write the standings JSON here")
+    parser.add_argument("--simulations", type=int, default=None,
+                        help="Tournaments to score against (default: request/all)")
+    parser.add_argument("--places", type=int, default=None)
+    parser.add_argument("--live", action="store_true",
+                        help="Condition on the completed games in results.json")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level="WARNING")
+
+    from app.models import StandingsRequest
+    from app.services import get_pool_standings
+
+    with open(args.rosters, encoding="utf-8") as fh:
+        request = StandingsRequest.model_validate(json.load(fh))
+    overrides = {
+        key: value for key, value in (
+            ("simulations", args.simulations), ("places", args.places),
+            ("live", args.live or None),
+        ) if value is not None
+    }
+    request = request.model_copy(update=overrides)
+
+    started = time.perf_counter()
+    response = get_pool_standings(request)
+    seconds = time.perf_counter() - started
+    body = response.model_dump_json(indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            fh.write(body)
+    else:
+        print(body)
+    print(f"{len(response.rosters):,} rosters × {response.simulations:,} "
+          f"tournaments in {seconds:.2f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""
+Tests for the admin router (app/routers/admin.py).
+
+The precomputation service is mocked so no vector store is needed.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from app.vector_store import VectorStoreUnavailable
+
+_URL = "/api/admin/similar-teams/refresh"
+
+
+@pytest.fixture
+async def client() -> AsyncClient:
+    """Yield an async HTTPX client wired directly to the FastAPI app."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as c:
+        yield c
+
+
+async def test_admin_disabled_without_token_configured(client: AsyncClient) -> None:
+    """With ADMIN_TOKEN unset every admin route is refused."""
+    with patch("app.routers.admin.ADMIN_TOKEN", ""):
+        response = await client.post(_URL, headers={"X-Admin-Token": ""})
+    assert response.status_code == 403
+
+
+async def test_admin_rejects_wrong_token(client: AsyncClient) -> None:
+    """A missing or wrong token is refused without running the job."""
+    with patch("app.routers.admin.ADMIN_TOKEN", "s3cret"), \
+         patch("app.routers.admin.precompute_similar_teams") as job:
+        missing = await client.post(_URL)
+        wrong = await client.post(_URL, headers={"X-Admin-Token": "nope"})
+    assert missing.status_code == wrong.status_code == 403
+    job.assert_not_called()
+
+
+async def test_refresh_reports_table(client: AsyncClient) -> None:
+    """A valid token runs the refresh and reports coverage and source."""
+    table = {"duke_2026": []}
+    field = [{"name": "Duke", "seed": 1}, {"name": "Iowa", "seed": 9}]
+    with patch("app.routers.admin.ADMIN_TOKEN", "s3cret"), \
+         patch("app.routers.admin.precompute_similar_teams",
+               return_value=(table, "chroma")), \
+         patch("app.routers.admin.get_all_teams", return_value=field):
+        response = await client.post(_URL, headers={"X-Admin-Token": "s3cret"})
+    assert response.status_code == 200
+    assert response.json() == {
+        "teams": 1, "missing": ["iowa_2026"], "source": "chroma",
+    }
+
+
+async def test_refresh_without_engine_returns_503(client: AsyncClient) -> None:
+    """If no similarity engine is reachable the refresh reports 503."""
+    with patch("app.routers.admin.ADMIN_TOKEN", "s3cret"), \
+         patch("app.routers.admin.precompute_similar_teams",
+               side_effect=VectorStoreUnavailable("down")):
+        response = await client.post(_URL, headers={"X-Admin-Token": "s3cret"})
+    assert response.status_code == 503
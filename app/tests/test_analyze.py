@@ -14,11 +14,15 @@ from app.main import app
 from app.services import (
     build_player_profile,
     build_team_stats,
+    build_team_store,
     build_win_distribution,
     calc_avg_per_game,
     calc_ft_pct,
+    find_team,
     format_height,
     format_position,
+    get_all_teams,
+    get_team_store,
     team_name_to_chroma_id,
 )
 
@@ -277,6 +281,79 @@ def test_build_team_stats_offensive_rebounds_per_game() -> None:
     assert stats.offensive_rebounds == 2.0
 
 
+# ---------------------------------------------------------------------------
+# TeamStore / find_team / get_all_teams
+# ---------------------------------------------------------------------------
+
+_STORE_TEAMS = [
+    {"name": "Duke", "team_id": "duke", "tournament_seed": 1},
+    {"name": "App State", "team_id": "appst", "tournament_seed": 12},
+    {"name": "Auburn", "team_id": "auburn", "tournament_seed": 1},
+    {"name": "No-Seed Team", "team_id": "noseed", "tournament_seed": None},
+]
+
+
+def test_find_team_is_case_insensitive() -> None:
+    """find_team resolves names regardless of case."""
+    with patch("app.services.load_predictions", return_value=_STORE_TEAMS):
+        assert find_team("dUKE")["team_id"] == "duke"
+
+
+def test_find_team_resolves_alias() -> None:
+    """An alternate spelling resolves to the team stored under its counterpart."""
+    with patch("app.services.load_predictions", return_value=_STORE_TEAMS):
+        assert find_team("Appalachian State")["name"] == "App State"
+        assert find_team("appalachian state")["name"] == "App State"
+
+
+async def test_most_similar_resolves_alias(client: AsyncClient) -> None:
+    """Similar teams are looked up under the canonical name, not the alias."""
+    with patch("app.services.load_predictions", return_value=_STORE_TEAMS), \
+         patch("app.routers.analyze.get_similar_teams",
+               return_value=[]) as similar:
+        response = await client.get("/api/analyze/most-similar/Appalachian State")
+    assert response.status_code == 200
+    assert response.json()["team"] == "App State"
+    similar.assert_awaited_once_with("App State")
+
+
+def test_find_team_unknown_returns_none() -> None:
+    """An unknown name returns None."""
+    with patch("app.services.load_predictions", return_value=_STORE_TEAMS):
+        assert find_team("Gonzaga") is None
+
+
+def test_team_store_indexes_team_id() -> None:
+    """Records are also reachable by team_id."""
+    store = build_team_store(_STORE_TEAMS)
+    assert store.get("auburn")["name"] == "Auburn"
+    assert store.get("missing") is None
+
+
+def test_team_store_indexes_are_read_only() -> None:
+    """The store's indexes cannot be mutated by callers."""
+    store = build_team_store(_STORE_TEAMS)
+    with pytest.raises(TypeError):
+        store.by_name["gonzaga"] = {}
+
+
+def test_get_all_teams_sorted_and_seeded_only() -> None:
+    """get_all_teams returns seeded teams sorted by seed then name."""
+    with patch("app.services.load_predictions", return_value=_STORE_TEAMS):
+        teams = get_all_teams()
+    assert teams == [
+        {"name": "Auburn", "seed": 1},
+        {"name": "Duke", "seed": 1},
+        {"name": "App State", "seed": 12},
+    ]
+
+
+def test_team_store_built_once_per_dataset() -> None:
+    """Repeated lookups against the same loaded predictions reuse one store."""
+    with patch("app.services.load_predictions", return_value=_STORE_TEAMS):
+        assert get_team_store() is get_team_store()
+
+
 # ---------------------------------------------------------------------------
 # GET /teams endpoint
 # ---------------------------------------------------------------------------
@@ -0,0 +1,418 @@
+"""
+Tests for the exact bracket DP engine (app/bracket.py),
+GET /api/projections/advancement and GET /api/projections/live.
+
+Brackets are synthetic 68-team fields built in the test, so no real data
+files are needed.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.bracket import (
+    BracketEngine,
+    BracketLayout,
+    LiveBracket,
+    fix_results,
+    layout_from_bracket,
+)
+from app.main import app
+
+# ---------------------------------------------------------------------------
+# Shared fixtures
+# ---------------------------------------------------------------------------
+
+# First Four games: the Round of 64 slot they feed and the two teams.
+_FIRST_FOUR = {5: ("T5", "T5b"), 21: ("T21", "T21b"), 40: ("T40", "T40b"),
+               63: ("T63", "T63b")}
+
+
+def _bracket_data() -> dict:
+    """A most-likely bracket whose games list the lower slot's team first.
+
+    Round of 64 games are listed out of slot order (as the real file lists
+    them by seed) so the layout must come from following winners.
+    """
+    def game(team1: str, team2: str) -> dict:
+        return {"team1": team1, "team2": team2, "winner": team1}
+
+    r64 = [game(f"T{2 * g}", f"T{2 * g + 1}") for g in range(32)]
+    rounds = [r64[::2] + r64[1::2]]
+    winners = [f"T{s}" for s in range(0, 64, 2)]
+    for size in (16, 8, 4, 2, 1):
+        games = [game(winners[2 * g], winners[2 * g + 1]) for g in range(size)]
+        rounds.append(games)
+        winners = winners[::2]
+    keys = ("round_of_64", "round_of_32", "sweet_16", "elite_8", "final_four")
+    data = dict(zip(keys, rounds))
+    data["championship"] = rounds[-1][0]
+    data["first_four"] = [game(*pair) for pair in _FIRST_FOUR.values()]
+    return data
+
+
+def _layout() -> BracketLayout:
+    return layout_from_bracket(_bracket_data())
+
+
+def _random_probs(n: int, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    upper = np.triu(rng.uniform(0.05, 0.95, (n, n)), 1)
+    probs = upper + np.tril(1.0 - upper.T, -1)
+    np.fill_diagonal(probs, np.nan)
+    return probs
+
+
+# ---------------------------------------------------------------------------
+# Layout
+# ---------------------------------------------------------------------------
+
+
+def test_layout_follows_winners_into_slot_order() -> None:
+    layout = _layout()
+    assert len(layout) == 68
+    slot_of = dict(zip(layout.names, layout.slots.tolist()))
+    assert [slot_of[f"T{s}"] for s in range(64)] == list(range(64))
+    for slot, (team1, team2) in _FIRST_FOUR.items():
+        assert slot_of[team1] == slot_of[team2] == slot
+
+
+def test_layout_rejects_inconsistent_bracket() -> None:
+    data = _bracket_data()
+    data["round_of_32"][0]["team1"] = "Nowhere"
+    with pytest.raises(ValueError, match="Nowhere"):
+        layout_from_bracket(data)
+
+
+def test_layout_rejects_orphan_first_four_game() -> None:
+    data = _bracket_data()
+    data["first_four"].append({"team1": "X", "team2": "Y", "winner": "X"})
+    with pytest.raises(ValueError, match="First Four"):
+        layout_from_bracket(data)
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+
+def test_advancement_conserves_teams_per_round() -> None:
+    """Exactly 64, 32, … 1 teams are expected to survive each round."""
+    engine = BracketEngine(_layout(), _random_probs(68))
+    levels = engine.advancement()
+    assert np.allclose(levels.sum(axis=1), [64, 32, 16, 8, 4, 2, 1])
+
+    dists = engine.win_distribution(levels)
+    assert np.allclose(dists.sum(axis=0), 1.0)
+    assert (dists >= -1e-12).all()
+
+
+def test_coin_flip_field_is_uniform() -> None:
+    layout = _layout()
+    probs = np.full((68, 68), 0.5)
+    levels = BracketEngine(layout, probs).advancement()
+
+    first_four = layout.slots[:, None] == np.array(list(_FIRST_FOUR))[None, :]
+    expected = np.where(first_four.any(axis=1), 1 / 128, 1 / 64)
+    assert np.allclose(levels[6], expected)
+
+
+def test_matches_hand_computed_first_rounds() -> None:
+    """Round of 32 odds mix both possible opponents, weighted by reach."""
+    layout = _layout()
+    probs = _random_probs(68)
+    engine = BracketEngine(layout, probs)
+    levels = engine.advancement()
+    p = engine.probs
+    t = {name: i for i, name in enumerate(layout.names)}
+    a, b, c, d = t["T0"], t["T1"], t["T2"], t["T3"]
+
+    assert levels[1, a] == pytest.approx(p[a, b])
+    assert levels[2, a] == pytest.approx(
+        p[a, b] * (p[c, d] * p[a, c] + p[d, c] * p[a, d])
+    )
+    e, f = t["T5"], t["T5b"]
+    assert levels[0, e] == pytest.approx(p[e, f])
+    assert levels[1, e] == pytest.approx(p[e, f] * p[e, t["T4"]])
+
+
+def test_batched_reach_matches_single_runs() -> None:
+    engine = BracketEngine(_layout(), _random_probs(68))
+    rng = np.random.default_rng(1)
+    reach = rng.uniform(0.5, 1.0, (68, 3))
+
+    batched = engine.advancement(reach)
+    for k in range(3):
+        assert np.allclose(batched[..., k], engine.advancement(reach[:, k]))
+
+
+def test_missing_probability_between_possible_opponents_is_rejected() -> None:
+    layout = _layout()
+    probs = _random_probs(68)
+    probs[0, 1] = probs[1, 0] = np.nan
+    with pytest.raises(ValueError, match="No head-to-head probability"):
+        BracketEngine(layout, probs)
+
+
+def test_favourite_that_always_wins_is_champion() -> None:
+    layout = _layout()
+    probs = _random_probs(68)
+    star = layout.names.index("T17")
+    probs[star, :], probs[:, star] = 1.0, 0.0
+    levels = BracketEngine(layout, probs).advancement()
+    assert levels[6, star] == pytest.approx(1.0)
+
+
+# ---------------------------------------------------------------------------
+# Completed games
+# ---------------------------------------------------------------------------
+
+
+def test_fix_results_credits_earlier_games_of_a_winner() -> None:
+    """A Round of 32 result alone implies both teams' Round of 64 wins."""
+    layout = _layout()
+    t = {name: i for i, name in enumerate(layout.names)}
+    winners = fix_results(layout, [(2, "T0", "T2", "T0")])
+
+    assert winners[2, 0] == winners[1, 0] == t["T0"]
+    assert winners[1, 1] == t["T2"]
+    wins, eliminated = BracketEngine(layout, _random_probs(68)).record(winners)
+    assert wins[t["T0"]] == 2 and wins[t["T2"]] == 1
+    assert eliminated[[t["T1"], t["T2"], t["T3"]]].all()
+    assert not eliminated[t["T0"]] and not eliminated[t["T4"]]
+
+
+@pytest.mark.parametrize("games, message", [
+    ([(1, "T0", "T2", "T0")], "not a possible Round of 64 game"),
+    ([(1, "T0", "T1", "Nowhere")], "not in the bracket"),
+    ([(1, "T0", "T1", "T1"), (2, "T0", "T2", "T0")], "cannot have won"),
+])
+def test_fix_results_rejects_impossible_results(games, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        fix_results(_layout(), games)
+
+
+def test_conditioning_matches_hand_computed_odds() -> None:
+    layout = _layout()
+    engine = BracketEngine(layout, _random_probs(68))
+    t = {name: i for i, name in enumerate(layout.names)}
+    a, b, c, d = t["T0"], t["T1"], t["T2"], t["T3"]
+    p = engine.probs
+
+    levels = engine.advancement(winners=fix_results(layout, [(1, "T0", "T1", "T0")]))
+    assert (levels[1, a], levels[1, b]) == (1.0, 0.0)
+    assert levels[2, a] == pytest.approx(p[c, d] * p[a, c] + p[d, c] * p[a, d])
+    assert np.allclose(levels.sum(axis=1), [64, 32, 16, 8, 4, 2, 1])
+
+
+def test_total_wins_of_one_team_is_its_distribution() -> None:
+    engine = BracketEngine(_layout(), _random_probs(68))
+    dists = engine.win_distribution(engine.advancement())
+    for i in (0, 5, 6, 67):
+        counts = np.zeros(68, dtype=int)
+        counts[i] = 1
+        assert np.allclose(engine.total_wins(counts), dists[:, i])
+
+
+def test_total_wins_respects_shared_bracket_paths() -> None:
+    """Two first-round opponents: exactly one of them wins each game they reach."""
+    layout = _layout()
+    engine = BracketEngine(layout, _random_probs(68))
+    levels = engine.advancement()
+    a, b = layout.names.index("T0"), layout.names.index("T1")
+    counts = np.zeros(68, dtype=int)
+    counts[[a, b]] = 1
+
+    total = engine.total_wins(counts)
+    at_least = np.cumsum(total[::-1])[::-1]
+    assert total[0] == pytest.approx(0.0)
+    assert np.allclose(at_least[1:7], levels[1:, a] + levels[1:, b])
+    assert np.allclose(total[7:], 0.0)
+
+    # The whole field always wins exactly 63 games.
+    everyone = engine.total_wins(np.ones(68, dtype=int))
+    assert everyone[63] == pytest.approx(1.0)
+
+
+def test_total_wins_conditions_on_results() -> None:
+    layout = _layout()
+    engine = BracketEngine(layout, _random_probs(68))
+    winners = fix_results(layout, [(1, "T0", "T1", "T1"), (1, "T2", "T3", "T2")])
+    levels = engine.advancement(winners=winners)
+    counts = np.zeros(68, dtype=int)
+    counts[layout.names.index("T1")] = 1
+
+    total = engine.total_wins(counts, winners)
+    assert total[0] == 0.0
+    assert np.allclose(total, engine.win_distribution(levels)[:, counts == 1][:, 0])
+
+
+def _played(layout: BracketLayout, rounds: int) -> list[tuple]:
+    """Games of the first ``rounds`` rounds, won by the lower-slot team."""
+    first = {}
+    for i, name in enumerate(layout.names):
+        first.setdefault(int(layout.slots[i]), []).append(name)
+    games = [(0, *pair, pair[0]) for pair in first.values() if len(pair) == 2]
+    alive = [teams[0] for _, teams in sorted(first.items())]
+    for r in range(1, rounds + 1):
+        games += [(r, alive[k], alive[k + 1], alive[k])
+                  for k in range(0, len(alive), 2)]
+        alive = alive[::2]
+    return games
+
+
+def test_live_bracket_updates_match_full_recompute() -> None:
+    """Adding games one at a time — or taking them back — stays exact."""
+    layout = _layout()
+    engine = BracketEngine(layout, _random_probs(68))
+    games = _played(layout, 3)
+    live = LiveBracket(engine)
+
+    for k in [1, 2, 30, 31, len(games), 5, 0]:
+        winners = fix_results(layout, games[:k])
+        assert np.allclose(live.update(winners), engine.advancement(winners=winners))
+
+
+def test_live_bracket_only_recomputes_affected_sub_brackets() -> None:
+    layout = _layout()
+    live = LiveBracket(BracketEngine(layout, _random_probs(68)))
+    games = _played(layout, 2)
+    previous = live.update(fix_results(layout, games[:-1]))
+
+    levels = live.update(fix_results(layout, games))
+    # The new Round of 32 game is decided, so only the sub-brackets above
+    # it are recomputed: its Sweet 16 pod up to the whole field.
+    slot = layout.slots[layout.names.index(games[-1][3])]
+    above = sum(int((layout.slots >> r == slot >> r).sum()) for r in range(3, 7))
+    assert above == 9 + 17 + 34 + 68
+    assert live.recomputed == above
+    assert levels is not previous
+    assert live.update(fix_results(layout, games)) is levels
+
+
+# ---------------------------------------------------------------------------
+# GET /api/projections/advancement
+# ---------------------------------------------------------------------------
+
+
+def _teams(layout: BracketLayout) -> list[dict]:
+    return [
+        {"name": name, "tournament_seed": 1 + i % 16, "region": "East",
+         "win_probability_distribution": {"0": 1.0}}
+        for i, name in enumerate(layout.names)
+    ]
+
+
+def _h2h(layout: BracketLayout, probs: np.ndarray) -> list[dict]:
+    names = layout.names
+    return [
+        {"team1": {"name": names[i], "win_probability": float(probs[i, j])},
+         "team2": {"name": names[j], "win_probability": float(probs[j, i])},
+         "year": 2026}
+        for i in range(len(names)) for j in range(i + 1, len(names))
+    ]
+
+
+@pytest.fixture
+async def client() -> AsyncClient:
+    """Yield an async HTTPX client wired directly to the FastAPI app."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as c:
+        yield c
+
+
+async def test_advancement_endpoint_returns_exact_projections(
+    client: AsyncClient,
+) -> None:
+    layout = _layout()
+    probs = _random_probs(68)
+    with patch("app.services.load_predictions", return_value=_teams(layout)), \
+         patch("app.services.load_h2h_predictions",
+               return_value=_h2h(layout, probs)), \
+         patch("app.services.load_bracket_data", return_value=_bracket_data()):
+        response = await client.get("/api/projections/advancement")
+
+    assert response.status_code == 200
+    teams = response.json()["teams"]
+    assert len(teams) == 68
+    champion = [t["advancement"]["champion"] for t in teams]
+    assert champion == sorted(champion, reverse=True)
+    assert sum(champion) == pytest.approx(1.0, abs=1e-4)
+
+    expected = BracketEngine(layout, probs).advancement()
+    top = teams[0]
+    i = layout.names.index(top["name"])
+    assert top["advancement"]["final_four"] == pytest.approx(expected[4, i], abs=1e-6)
+    dist = top["win_probability_distribution"]
+    assert dist["six_wins"] == top["advancement"]["champion"]
+    assert sum(dist.values()) == pytest.approx(1.0, abs=1e-4)
+
+
+async def test_advancement_without_bracket_returns_503(client: AsyncClient) -> None:
+    with patch("app.services.load_bracket_data",
+               side_effect=FileNotFoundError("most-likely-bracket.json")):
+        response = await client.get("/api/projections/advancement")
+    assert response.status_code == 503
+
+
+# ---------------------------------------------------------------------------
+# GET /api/projections/live
+# ---------------------------------------------------------------------------
+
+_ROUNDS = ("First Four", "Round of 64", "Round of 32", "Sweet Sixteen")
+
+
+def _results(games: list[tuple]) -> list[dict]:
+    rounds = [{"name": name, "games": []} for name in _ROUNDS]
+    for r, team1, team2, winner in games:
+        rounds[r]["games"].append({
+            "team1": {"name": team1, "seed": 1, "score": 70},
+            "team2": {"name": team2, "seed": 2, "score": 60},
+            "winner": winner, "correct": True,
+        })
+    return [{"year": 2026, "tournament_name": "2026 Tournament", "rounds": rounds}]
+
+
+async def test_live_projections_condition_on_results(client: AsyncClient) -> None:
+    layout = _layout()
+    probs = _random_probs(68)
+    games = _played(layout, 2)
+    with patch("app.services.load_predictions", return_value=_teams(layout)), \
+         patch("app.services.load_h2h_predictions",
+               return_value=_h2h(layout, probs)), \
+         patch("app.services.load_bracket_data", return_value=_bracket_data()), \
+         patch("app.services.load_results_data", return_value=_results(games)):
+        response = await client.get("/api/projections/live")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["year"] == 2026 and body["games_played"] == len(games) == 52
+    teams = {t["name"]: t for t in body["teams"]}
+    assert sum(not t["eliminated"] for t in teams.values()) == 16
+    assert sum(t["advancement"]["champion"] for t in teams.values()) == \
+        pytest.approx(1.0, abs=1e-4)
+
+    survivor, loser = teams["T0"], teams["T2"]
+    assert survivor["wins"] == 2 and not survivor["eliminated"]
+    assert survivor["win_probability_distribution"]["one_win"] == 0.0
+    assert survivor["expected_wins"] >= 2
+    assert loser["wins"] == 1 and loser["eliminated"]
+    assert loser["expected_wins"] == 1.0
+
+
+async def test_live_projections_reject_results_outside_bracket(
+    client: AsyncClient,
+) -> None:
+    layout = _layout()
+    with patch("app.services.load_predictions", return_value=_teams(layout)), \
+         patch("app.services.load_h2h_predictions",
+               return_value=_h2h(layout, _random_probs(68))), \
+         patch("app.services.load_bracket_data", return_value=_bracket_data()), \
+         patch("app.services.load_results_data",
+               return_value=_results([(1, "T0", "Nowhere", "T0")])):
+        response = await client.get("/api/projections/live")
+    assert response.status_code == 503
+    assert "Nowhere" in response.json()["detail"]
@@ -0,0 +1,304 @@
+"""
+Tests for the pre-serialized response cache and HTTP validators (app/cache.py).
+
+Cache tests use throwaway ResponseCache instances.  Endpoint tests patch the
+dataset loaders so the cached routes can be driven without any data files.
+"""
+
+import gzip
+from unittest.mock import patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.cache import (
+    RESULTS_CACHE_CONTROL,
+    STATIC_CACHE_CONTROL,
+    ResponseCache,
+    compress_variants,
+    etag_matches,
+    negotiate_encoding,
+    response_cache,
+)
+from app.main import app
+from app.models import SimilarTeam
+from app.services import dataset_fingerprint
+
+# ---------------------------------------------------------------------------
+# Shared fixtures
+# ---------------------------------------------------------------------------
+
+_DIST = {"0": 0.1, "1": 0.6, "2": 0.1, "3": 0.1, "4": 0.05, "5": 0.03, "6": 0.02}
+
+
+def _team(name: str) -> dict:
+    """Return a minimal seeded team record."""
+    return {
+        "name": name,
+        "tournament_seed": 1,
+        "tournament_region": "East",
+        "conference": "ACC",
+        "wins": 30,
+        "losses": 4,
+        "win_probability_distribution": _DIST,
+    }
+
+
+# Full team record accepted by build_team_analysis.
+_ANALYZE_TEAM = {
+    **_team("Duke"),
+    "avg_height": 78,
+    "players": [],
+    "profile_summary": "",
+}
+
+
+@pytest.fixture(autouse=True)
+def _reset_response_cache() -> None:
+    """Start every test with an empty process-wide response cache."""
+    response_cache.clear()
+
+
+@pytest.fixture
+async def client() -> AsyncClient:
+    """Yield an async HTTPX client wired directly to the FastAPI app."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as c:
+        yield c
+
+
+# ---------------------------------------------------------------------------
+# ResponseCache
+# ---------------------------------------------------------------------------
+
+
+def test_cache_serves_bytes_until_deps_change() -> None:
+    """The builder runs once per distinct dependency fingerprint."""
+    cache = ResponseCache()
+    data = [1, 2]
+    calls = []
+
+    def build() -> list:
+        calls.append(1)
+        return {"value": len(calls)}
+
+    first = cache.get("k", (data,), build)
+    second = cache.get("k", (data,), build)
+    assert first.body == second.body == b'{"value":1}'
+    assert len(calls) == 1
+
+    third = cache.get("k", ([1, 2, 3],), build)
+    assert third.body == b'{"value":2}'
+    assert cache.stats() == {"hits": 1, "misses": 2, "hit_ratio": 0.3333}
+
+
+def test_cache_keys_are_independent() -> None:
+    """Entries under different keys never serve each other's bytes."""
+    cache = ResponseCache()
+    assert cache.get("a", (), lambda: "a").body == b'"a"'
+    assert cache.get("b", (), lambda: "b").body == b'"b"'
+
+
+def test_cache_does_not_store_failed_builds() -> None:
+    """An exception from the builder propagates and leaves no entry behind."""
+    cache = ResponseCache()
+
+    def boom() -> None:
+        raise FileNotFoundError("gone")
+
+    with pytest.raises(FileNotFoundError):
+        cache.get("k", (), boom)
+    assert cache.get("k", (), lambda: 1).body == b"1"
+
+
+def test_cached_entry_etag_tracks_body() -> None:
+    """Equal bodies share an ETag; different bodies do not."""
+    cache = ResponseCache()
+    a = cache.get("a", (), lambda: {"x": 1})
+    b = cache.get("b", (), lambda: {"x": 1})
+    c = cache.get("c", (), lambda: {"x": 2})
+    assert a.etag == b.etag != c.etag
+    assert a.etag.startswith('"') and a.etag.endswith('"')
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"zzz", "abc"', True),
+        ("*", True),
+        ('"zzz"', False),
+    ],
+)
+def test_etag_matches(header: str, expected: bool) -> None:
+    """If-None-Match uses weak comparison and accepts lists and '*'."""
+    assert etag_matches(header, '"abc"') is expected
+
+
+def test_small_bodies_are_not_compressed() -> None:
+    """Bodies under the size threshold have no compressed variants."""
+    assert compress_variants(b'{"a":1}', '"e"') == {}
+
+
+def test_large_bodies_get_gzip_variant_with_own_etag() -> None:
+    """A large body gets a gzip variant that round-trips and has its own ETag."""
+    body = b'{"teams":[' + b'"Duke",' * 500 + b'"Iowa"]}'
+    variants = compress_variants(body, '"abc"')
+    encoded, etag = variants["gzip"]
+    assert gzip.decompress(encoded) == body
+    assert etag == '"abc-gzip"'
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, None),
+        ("gzip, deflate", "gzip"),
+        ("br;q=1.0, gzip;q=0.8", "gzip"),
+        ("gzip;q=0", None),
+        ("*", "gzip"),
+        ("identity", None),
+    ],
+)
+def test_negotiate_encoding(header: str, expected: str) -> None:
+    """Accept-Encoding q-values and '*' select among available codings."""
+    assert negotiate_encoding(header, ["gzip"]) == expected
+
+
+def test_dataset_fingerprint_missing_h2h_is_none() -> None:
+    """A missing H2H file is fingerprinted as None rather than raising."""
+    with patch(
+        "app.services.load_h2h_predictions", side_effect=FileNotFoundError
+    ):
+        assert dataset_fingerprint("h2h") == (None,)
+
+
+def test_dataset_fingerprint_unknown_name_raises() -> None:
+    """Unknown dataset names are rejected."""
+    with pytest.raises(KeyError):
+        dataset_fingerprint("bogus")
+
+
+# ---------------------------------------------------------------------------
+# Cached routes
+# ---------------------------------------------------------------------------
+
+
+async def test_projections_rebuilt_when_predictions_change(
+    client: AsyncClient,
+) -> None:
+    """GET /projections is served from cache until the predictions change."""
+    teams = [_team("Duke")]
+    with patch("app.services.load_predictions", return_value=teams):
+        first = await client.get("/api/projections")
+        hits_before = response_cache.hits
+        again = await client.get("/api/projections")
+    assert again.content == first.content
+    assert response_cache.hits == hits_before + 1
+
+    with patch("app.services.load_predictions", return_value=[_team("Kansas")]):
+        changed = await client.get("/api/projections")
+    assert changed.json()["one_win"][0]["name"] == "Kansas"
+
+
+async def test_cached_route_returns_304_for_matching_etag(
+    client: AsyncClient,
+) -> None:
+    """A matching If-None-Match yields 304 with no body and the same ETag."""
+    with patch("app.main.get_all_teams", return_value=[{"name": "Duke", "seed": 1}]):
+        first = await client.get("/api/teams")
+        etag = first.headers["etag"]
+        second = await client.get("/api/teams", headers={"If-None-Match": etag})
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == STATIC_CACHE_CONTROL
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+
+async def test_etag_changes_when_data_changes(client: AsyncClient) -> None:
+    """A stale ETag gets a full 200 response once the data has changed."""
+    with patch("app.main.get_all_teams", return_value=[{"name": "Duke", "seed": 1}]):
+        etag = (await client.get("/api/teams")).headers["etag"]
+    with patch("app.main.get_all_teams", return_value=[{"name": "Iowa", "seed": 2}]):
+        response = await client.get("/api/teams", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+async def test_results_route_uses_short_cache_policy(client: AsyncClient) -> None:
+    """Results-backed routes allow stale-while-revalidate instead of a long max-age."""
+    with patch("app.services.load_results_data", return_value=[]), \
+         patch("app.services.load_h2h_predictions", return_value=[]):
+        response = await client.get("/api/results")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == RESULTS_CACHE_CONTROL
+
+
+async def test_analyze_returns_304_for_matching_etag(client: AsyncClient) -> None:
+    """GET /analyze/{team} is cached per team and validated by ETag."""
+    similar = [SimilarTeam(name="Duke", year=2015, seed=1, tournament_wins=6,
+                           similarity=0.9)]
+    with patch("app.routers.analyze.find_team", return_value=_ANALYZE_TEAM), \
+         patch("app.routers.analyze.get_similar_teams", return_value=similar):
+        first = await client.get("/api/analyze/Duke")
+        second = await client.get(
+            "/api/analyze/Duke", headers={"If-None-Match": first.headers["etag"]}
+        )
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == STATIC_CACHE_CONTROL
+    assert second.status_code == 304
+
+
+async def test_analyze_without_similar_teams_is_no_cache(client: AsyncClient) -> None:
+    """A degraded profile (no similar teams) must be revalidated on every use."""
+    with patch("app.routers.analyze.find_team", return_value=_ANALYZE_TEAM), \
+         patch("app.routers.analyze.get_similar_teams", return_value=[]):
+        response = await client.get("/api/analyze/Duke")
+    assert response.headers["cache-control"] == "no-cache"
+
+
+async def test_large_response_served_gzip_encoded(client: AsyncClient) -> None:
+    """Clients accepting gzip get the pre-compressed variant and a distinct ETag."""
+    teams = [{"name": f"Team {i}", "seed": i % 16 + 1} for i in range(68)]
+    with patch("app.main.get_all_teams", return_value=teams):
+        zipped = await client.get("/api/teams", headers={"Accept-Encoding": "gzip"})
+        plain = await client.get(
+            "/api/teams", headers={"Accept-Encoding": "identity"}
+        )
+        etag = zipped.headers["etag"]
+        revalidated = await client.get(
+            "/api/teams", headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+        )
+    assert zipped.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in zipped.headers["vary"]
+    assert zipped.json() == plain.json()
+    assert "content-encoding" not in plain.headers
+    assert zipped.headers["etag"] != plain.headers["etag"]
+    assert revalidated.status_code == 304
+
+
+async def test_analyze_with_stale_similar_teams_is_no_cache(
+    client: AsyncClient,
+) -> None:
+    """A profile built from stale similar teams must be revalidated."""
+    similar = [SimilarTeam(name="Duke", year=2015, seed=1, tournament_wins=6,
+                           similarity=0.9, stale=True)]
+    with patch("app.routers.analyze.find_team", return_value=_ANALYZE_TEAM), \
+         patch("app.routers.analyze.get_similar_teams", return_value=similar):
+        response = await client.get("/api/analyze/Duke")
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.json()["similar_teams"][0]["stale"] is True
+
+
+async def test_metrics_reports_response_cache(client: AsyncClient) -> None:
+    """GET /api/metrics includes the response cache counters."""
+    with patch("app.main.get_all_teams", return_value=[{"name": "Duke", "seed": 1}]):
+        await client.get("/api/teams")
+        await client.get("/api/teams")
+    body = (await client.get("/api/metrics")).json()
+    assert body["response_cache"]["hits"] >= 1
+    assert body["response_cache"]["misses"] >= 1
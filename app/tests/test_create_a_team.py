@@ -4,13 +4,16 @@ Tests for the POST /pool endpoint and the build_pool_team_summary service.
 Service tests are fully isolated (no file I/O or network calls).
 Endpoint tests use the HTTPX async client wired directly to the FastAPI app,
 with the predictions-data loader mocked so no real JSON file is required.
+Roster total-wins tests run on a synthetic 68-team bracket.
 """
 
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 from httpx import ASGITransport, AsyncClient
 
+from app.bracket import BracketEngine, BracketLayout
 from app.main import app
 from app.services import build_pool_team_summary
 
@@ -214,3 +217,105 @@ async def test_pool_response_includes_conference(client: AsyncClient) -> None:
     with patch("app.routers.pool.find_team", return_value=_MOCK_TEAM):
         response = await client.post("/api/create-a-team", json={"teams": ["Duke"]})
     assert response.json()["teams"][0]["conference"] == "ACC"
+
+
+# ---------------------------------------------------------------------------
+# POST /pool — roster total wins
+# ---------------------------------------------------------------------------
+
+
+def _engine() -> BracketEngine:
+    """A 68-team bracket (First Four in slots 5, 21, 40, 63) with random odds."""
+    names, slots = [], []
+    for slot in range(64):
+        names.append(f"T{slot}")
+        slots.append(slot)
+        if slot in (5, 21, 40, 63):
+            names.append(f"T{slot}b")
+            slots.append(slot)
+    rng = np.random.default_rng(11)
+    upper = np.triu(rng.uniform(0.1, 0.9, (68, 68)), 1)
+    probs = upper + np.tril(1.0 - upper.T, -1)
+    return BracketEngine(BracketLayout(names, slots), probs)
+
+
+# Two pairs of teams that would meet in the Round of 32 and Sweet 16.
+_ROSTER = ["T0", "T2", "T8", "T12", "T33", "T47", "T50", "T63b"]
+
+
+@pytest.fixture
+def bracket():
+    """Serve the synthetic bracket and resolve every name to itself."""
+    engine = _engine()
+
+    def find(name: str):
+        return {"name": name} if name in engine.layout.names else None
+
+    with patch("app.services.get_bracket_engine", return_value=engine), \
+         patch("app.services.find_team", side_effect=find), \
+         patch("app.routers.pool.find_team", side_effect=find), \
+         patch("app.services.POOL_SIMULATIONS", 50_000), \
+         patch.dict("app.services._simulated_wins", clear=True):
+        yield engine
+
+
+async def test_pool_total_wins_is_omitted_by_default(client: AsyncClient) -> None:
+    with patch("app.routers.pool.find_team", return_value=_MOCK_TEAM):
+        response = await client.post("/api/create-a-team", json={"teams": ["Duke"]})
+    assert response.json()["total_wins"] is None
+
+
+async def test_pool_exact_total_wins(client: AsyncClient, bracket) -> None:
+    response = await client.post("/api/create-a-team", json={
+        "teams": _ROSTER + ["Unknown Team"], "total_wins": "exact", "target": 4,
+    })
+    assert response.status_code == 200
+    total = response.json()["total_wins"]
+    dist = np.array(total["distribution"])
+
+    assert total["method"] == "exact" and total["teams"] == 8
+    assert len(dist) == 49 and dist.sum() == pytest.approx(1.0, abs=1e-5)
+    # Expectations still add up; the spread does not.
+    engine = bracket
+    idx = [engine.layout.names.index(n) for n in _ROSTER]
+    per_team = engine.win_distribution(engine.advancement())[:, idx]
+    assert total["expected_wins"] == pytest.approx(
+        (np.arange(7) @ per_team).sum(), abs=1e-3
+    )
+    assert total["beat_target"] == pytest.approx(dist[5:].sum(), abs=1e-5)
+    quantiles = list(total["quantiles"].values())
+    assert quantiles == sorted(quantiles)
+    assert np.cumsum(dist)[total["quantiles"]["p50"]] >= 0.5
+
+
+async def test_pool_simulated_total_wins_matches_exact(
+    client: AsyncClient, bracket
+) -> None:
+    body = {"teams": _ROSTER, "target": 4}
+    exact = await client.post("/api/create-a-team",
+                              json={**body, "total_wins": "exact"})
+    simulated = await client.post("/api/create-a-team",
+                                  json={**body, "total_wins": "simulated"})
+
+    total = simulated.json()["total_wins"]
+    assert total["method"] == "simulated" and total["simulations"] == 50_000
+    gap = np.abs(np.array(total["distribution"])
+                 - np.array(exact.json()["total_wins"]["distribution"]))
+    assert gap.max() < 0.01
+    # The sample is drawn once and reused for the next roster.
+    with patch("app.services.simulation.run") as run:
+        await client.post("/api/create-a-team", json={
+            **body, "teams": _ROSTER[:3], "total_wins": "simulated",
+        })
+    run.assert_not_called()
+
+
+async def test_pool_total_wins_without_bracket_returns_503(
+    client: AsyncClient,
+) -> None:
+    with patch("app.services.load_bracket_data",
+               side_effect=FileNotFoundError("most-likely-bracket.json")):
+        response = await client.post(
+            "/api/create-a-team", json={"teams": ["Duke"], "total_wins": "exact"}
+        )
+    assert response.status_code == 503
@@ -0,0 +1,327 @@
+"""
+Tests for the versioned dataset registry (app/datasets.py), the dataset
+builder and validation in app/services.py, and the admin reload endpoint.
+
+Datasets are built from small prediction files written to a pytest
+``tmp_path``, so no real data files are touched.
+"""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app import recaps, services
+from app.datasets import (
+    VERSION_HEADER,
+    Dataset,
+    DatasetPinMiddleware,
+    DatasetRegistry,
+    dataset_version,
+    reload_datasets,
+)
+from app.main import app
+
+# ---------------------------------------------------------------------------
+# Shared fixtures
+# ---------------------------------------------------------------------------
+
+
+def _teams(wins: int = 30) -> list[dict]:
+    dist = {"0": 0.25, "1": 0.25, "2": 0.5}
+    return [
+        {"name": "Duke", "team_id": "duke", "wins": wins, "tournament_seed": 1,
+         "win_probability_distribution": dist, "summaries": ["Duke 80, Siena 60"]},
+        {"name": "Siena", "team_id": "siena", "wins": 20, "tournament_seed": 16,
+         "win_probability_distribution": dist},
+    ]
+
+
+def _entries() -> list[dict]:
+    return [{
+        "team1": {"name": "Duke", "win_probability": 0.9},
+        "team2": {"name": "Siena", "win_probability": 0.1},
+        "year": 2026,
+    }]
+
+
+def _write(path: Path, data) -> None:
+    """Write JSON and bump the mtime so the change is always detected."""
+    path.write_text(json.dumps(data), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path):
+    """Point the service loaders at temp prediction and compiled dirs."""
+    predictions = tmp_path / "predictions"
+    predictions.mkdir()
+    _write(predictions / "predictions.json", _teams())
+    _write(predictions / "h2h-predictions.json", _entries())
+    store = recaps.get_active_store()
+    with patch("app.services.PREDICTIONS_DIR", predictions), \
+         patch("app.services.COMPILED_DIR", tmp_path / "compiled"), \
+         patch(
+             "app.services.H2H_PREDICTIONS_FILE",
+             predictions / "h2h-predictions.json",
+         ), \
+         patch("app.services._active_snapshot", None):
+        yield predictions
+    recaps.set_active_store(store)
+
+
+@pytest.fixture
+def registry(data_dir: Path) -> DatasetRegistry:
+    """A fresh registry over the temp files."""
+    return DatasetRegistry(services.build_dataset, services._snapshot_sources)
+
+
+class _Builder:
+    """Builder stub returning datasets for a settable source signature."""
+
+    def __init__(self) -> None:
+        self.sources = {"predictions.json": {"size": 1, "mtime_ns": 1}}
+        self.error: Exception | None = None
+        self.calls = 0
+
+    def probe(self) -> dict:
+        return dict(self.sources)
+
+    def __call__(self) -> Dataset:
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return Dataset(self.probe(), [], None)
+
+
+# ---------------------------------------------------------------------------
+# DatasetRegistry
+# ---------------------------------------------------------------------------
+
+
+def test_version_is_stable_digest_of_sources() -> None:
+    sources = {"a.json": {"size": 1, "mtime_ns": 2}, "b.json": None}
+    assert dataset_version(sources) == dataset_version(dict(reversed(sources.items())))
+    assert dataset_version(sources) != dataset_version({**sources, "b.json": {}})
+    assert len(dataset_version(sources)) == 12
+
+
+def test_get_builds_once() -> None:
+    builder = _Builder()
+    registry = DatasetRegistry(builder, builder.probe)
+
+    first = registry.get()
+    assert registry.get() is first
+    assert builder.calls == 1
+
+
+def test_reload_skips_unchanged_files_unless_forced() -> None:
+    builder = _Builder()
+    registry = DatasetRegistry(builder, builder.probe)
+    first = registry.get()
+
+    assert registry.reload() == (first, first)
+    current, previous = registry.reload(force=True)
+    assert previous is first and current is not first
+    assert registry.current is current and registry.reloads == 1
+
+
+def test_reload_swaps_in_changed_files() -> None:
+    builder = _Builder()
+    registry = DatasetRegistry(builder, builder.probe)
+    first = registry.get()
+
+    builder.sources["predictions.json"] = {"size": 2, "mtime_ns": 2}
+    assert registry.stale()
+    current, previous = registry.reload()
+    assert previous is first
+    assert current.version != first.version
+    assert not registry.stale()
+
+
+def test_failed_reload_keeps_current_dataset() -> None:
+    """A build error leaves the old version current and is not retried."""
+    builder = _Builder()
+    registry = DatasetRegistry(builder, builder.probe)
+    first = registry.get()
+
+    builder.sources["predictions.json"] = {"size": 2, "mtime_ns": 2}
+    builder.error = ValueError("bad file")
+    with pytest.raises(ValueError):
+        registry.reload()
+    assert registry.current is first
+    assert registry.stats()["failures"] == 1
+    assert registry.stats()["last_error"] == "ValueError: bad file"
+    assert not registry.stale()
+
+    builder.sources["predictions.json"] = {"size": 3, "mtime_ns": 3}
+    builder.error = None
+    assert registry.stale()
+
+
+async def test_reload_datasets_swallows_build_errors() -> None:
+    builder = _Builder()
+    registry = DatasetRegistry(builder, builder.probe)
+    first = registry.get()
+    builder.sources["predictions.json"] = {"size": 2, "mtime_ns": 2}
+    builder.error = OSError("unreadable")
+
+    await reload_datasets(registry)
+    assert registry.current is first
+
+
+# ---------------------------------------------------------------------------
+# Request pinning
+# ---------------------------------------------------------------------------
+
+
+async def test_request_keeps_its_version_across_a_swap() -> None:
+    """A swap mid-request does not change what the request reads or reports."""
+    builder = _Builder()
+    registry = DatasetRegistry(builder, builder.probe)
+    first = registry.get()
+    seen: list[str] = []
+
+    demo = FastAPI()
+    demo.add_middleware(DatasetPinMiddleware, registry=registry)
+
+    @demo.get("/")
+    def read() -> dict:
+        seen.append(registry.peek().version)
+        builder.sources["predictions.json"] = {"size": len(seen) + 1}
+        registry.reload()
+        seen.append(registry.peek().version)
+        return {}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=demo), base_url="http://test"
+    ) as client:
+        response = await client.get("/")
+        after = await client.get("/")
+
+    assert seen[:2] == [first.version, first.version]
+    assert response.headers[VERSION_HEADER] == first.version
+    assert after.headers[VERSION_HEADER] == seen[2] != first.version
+
+
+async def test_app_responses_report_dataset_version() -> None:
+    version = services.dataset_registry.get().version
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/")
+    assert response.headers[VERSION_HEADER] == version
+
+
+# ---------------------------------------------------------------------------
+# build_dataset / validate_dataset
+# ---------------------------------------------------------------------------
+
+
+def test_build_dataset_bundles_records_and_indexes(registry: DatasetRegistry) -> None:
+    dataset = registry.get()
+
+    assert [t["name"] for t in dataset.teams] == ["Duke", "Siena"]
+    assert dataset.team_store.find("duke")["wins"] == 30
+    assert dataset.h2h_matrix.pair("Siena", "Duke") == (1, 0)
+    assert dataset.recaps.get("Duke") == ["Duke 80, Siena 60"]
+
+
+def test_reload_serves_edited_predictions(
+    registry: DatasetRegistry, data_dir: Path
+) -> None:
+    first = registry.get()
+    _write(data_dir / "predictions.json", _teams(wins=31))
+
+    current, previous = registry.reload()
+    assert previous is first
+    assert current.team_store.find("Duke")["wins"] == 31
+    assert first.team_store.find("Duke")["wins"] == 30
+
+
+@pytest.mark.parametrize("edit, message", [
+    (lambda teams: teams.clear(), "no teams"),
+    (lambda teams: teams.append(dict(teams[0])), "Duplicate"),
+    (lambda teams: teams[1].pop("name"), "name"),
+    (lambda teams: teams[1]["win_probability_distribution"].update({"2": 0.9}),
+     "sum to"),
+])
+def test_invalid_predictions_are_rejected(
+    registry: DatasetRegistry, data_dir: Path, edit, message: str
+) -> None:
+    first = registry.get()
+    teams = _teams()
+    edit(teams)
+    _write(data_dir / "predictions.json", teams)
+
+    with pytest.raises(ValueError, match=message):
+        registry.reload()
+    assert registry.current is first
+
+
+def test_h2h_with_unknown_team_is_rejected(
+    registry: DatasetRegistry, data_dir: Path
+) -> None:
+    entries = _entries()
+    entries[0]["team2"]["name"] = "Nowhere State"
+    _write(data_dir / "h2h-predictions.json", entries)
+
+    with pytest.raises(ValueError, match="Nowhere State"):
+        registry.get()
+
+
+# ---------------------------------------------------------------------------
+# POST /api/admin/datasets/reload
+# ---------------------------------------------------------------------------
+
+_URL = "/api/admin/datasets/reload"
+_AUTH = {"X-Admin-Token": "s3cret"}
+
+
+@pytest.fixture
+async def admin_client(registry: DatasetRegistry) -> AsyncClient:
+    with patch("app.routers.admin.ADMIN_TOKEN", "s3cret"), \
+         patch("app.routers.admin.dataset_registry", registry):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as c:
+            yield c
+
+
+async def test_reload_requires_admin_token(admin_client: AsyncClient) -> None:
+    response = await admin_client.post(_URL)
+    assert response.status_code == 403
+
+
+async def test_reload_endpoint_swaps_changed_files(
+    admin_client: AsyncClient, registry: DatasetRegistry, data_dir: Path
+) -> None:
+    first = registry.get()
+    unchanged = await admin_client.post(_URL, headers=_AUTH)
+    _write(data_dir / "predictions.json", _teams(wins=31))
+    changed = await admin_client.post(_URL, headers=_AUTH)
+
+    assert unchanged.json() == {
+        "version": first.version, "previous_version": None, "changed": False,
+        "teams": 2, "h2h_teams": 2,
+    }
+    assert changed.status_code == 200
+    assert changed.json()["changed"] is True
+    assert changed.json()["previous_version"] == first.version
+    assert changed.json()["version"] == registry.current.version
+
+
+async def test_reload_endpoint_reports_invalid_files(
+    admin_client: AsyncClient, registry: DatasetRegistry, data_dir: Path
+) -> None:
+    first = registry.get()
+    (data_dir / "predictions.json").write_text("[{", encoding="utf-8")
+
+    response = await admin_client.post(_URL, headers=_AUTH)
+    assert response.status_code == 422
+    assert registry.current is first
@@ -12,7 +12,7 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 
 from app.main import app
-from app.services import get_h2h_prediction
+from app.services import build_h2h_matrix, get_h2h_matrix, get_h2h_prediction
 
 # ---------------------------------------------------------------------------
 # Shared mock data
@@ -92,6 +92,59 @@ def test_returns_none_for_empty_predictions() -> None:
     assert result is None
 
 
+# ---------------------------------------------------------------------------
+# build_h2h_matrix / get_h2h_matrix — unit tests
+# ---------------------------------------------------------------------------
+
+
+def test_matrix_has_one_row_per_team() -> None:
+    """Every distinct team in the entries gets exactly one index."""
+    matrix = build_h2h_matrix(_MOCK_H2H)
+    assert matrix.names == ["Duke", "Kentucky", "North Carolina", "Kansas"]
+    assert matrix.probs.shape == (4, 4)
+
+
+def test_matrix_stores_both_directions() -> None:
+    """probs[i, j] and probs[j, i] hold each team's stored probability."""
+    matrix = build_h2h_matrix(_MOCK_H2H)
+    duke, kentucky = matrix.team_index("duke"), matrix.team_index("KENTUCKY")
+    assert matrix.probs[duke, kentucky] == pytest.approx(0.72)
+    assert matrix.probs[kentucky, duke] == pytest.approx(0.28)
+
+
+def test_matrix_missing_pairs_are_unresolved() -> None:
+    """Pairs with no stored entry (and self-pairs) resolve to None."""
+    matrix = build_h2h_matrix(_MOCK_H2H)
+    assert matrix.pair("Duke", "Kansas") is None
+    assert matrix.pair("Duke", "Duke") is None
+    assert matrix.pair("Duke", "Gonzaga") is None
+
+
+def test_matrix_keeps_first_duplicate_entry() -> None:
+    """A pair stored twice keeps the first entry, as the linear scan did."""
+    duplicate = {
+        "team1": {"name": "Kentucky", "win_probability": 0.9},
+        "team2": {"name": "Duke", "win_probability": 0.1},
+        "year": 2025,
+    }
+    matrix = build_h2h_matrix(_MOCK_H2H + [duplicate])
+    i, j = matrix.pair("Duke", "Kentucky")
+    assert matrix.probs[i, j] == pytest.approx(0.72)
+
+
+def test_matrix_is_read_only() -> None:
+    """The compiled matrix cannot be mutated by consumers."""
+    matrix = build_h2h_matrix(_MOCK_H2H)
+    with pytest.raises(ValueError):
+        matrix.probs[0, 1] = 0.5
+
+
+def test_matrix_compiled_once_per_dataset() -> None:
+    """Repeated lookups against the same loaded entries reuse one matrix."""
+    with patch("app.services.load_h2h_predictions", return_value=_MOCK_H2H):
+        assert get_h2h_matrix() is get_h2h_matrix()
+
+
 # ---------------------------------------------------------------------------
 # GET /head-to-head — endpoint tests
 # ---------------------------------------------------------------------------
@@ -152,3 +205,63 @@ async def test_h2h_missing_team2_returns_422(client: AsyncClient) -> None:
     with patch("app.services.load_h2h_predictions", return_value=_MOCK_H2H):
         response = await client.get("/api/head-to-head?team1=Duke")
     assert response.status_code == 422
+
+
+# ---------------------------------------------------------------------------
+# POST /head-to-head/batch — endpoint tests
+# ---------------------------------------------------------------------------
+
+
+async def test_h2h_batch_preserves_request_order_and_direction(
+    client: AsyncClient,
+) -> None:
+    """Each result maps team1 to the requested team1, in request order."""
+    body = {
+        "pairs": [
+            {"team1": "Kentucky", "team2": "Duke"},
+            {"team1": "north carolina", "team2": "Kansas"},
+        ]
+    }
+    with patch("app.services.load_h2h_predictions", return_value=_MOCK_H2H):
+        response = await client.post("/api/head-to-head/batch", json=body)
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["team1"] for r in results] == ["Kentucky", "north carolina"]
+    assert results[0]["prediction"]["team1"]["name"] == "Kentucky"
+    assert results[0]["prediction"]["team1"]["win_probability"] == pytest.approx(0.28)
+    assert results[1]["prediction"]["team1"]["name"] == "North Carolina"
+    assert results[1]["error"] is None
+
+
+async def test_h2h_batch_reports_missing_pairs_inline(client: AsyncClient) -> None:
+    """Unknown pairs and self-matchups get an error without failing the batch."""
+    body = {
+        "pairs": [
+            {"team1": "Alabama", "team2": "Oregon"},
+            {"team1": "Duke", "team2": "duke"},
+            {"team1": "Duke", "team2": "Kentucky"},
+        ]
+    }
+    with patch("app.services.load_h2h_predictions", return_value=_MOCK_H2H):
+        response = await client.post("/api/head-to-head/batch", json=body)
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0]["prediction"] is None
+    assert "No head-to-head prediction" in results[0]["error"]
+    assert results[1]["prediction"] is None
+    assert "different teams" in results[1]["error"]
+    assert results[2]["prediction"]["team2"]["win_probability"] == pytest.approx(0.28)
+
+
+async def test_h2h_batch_empty_list_returns_empty_results(client: AsyncClient) -> None:
+    """An empty pairs list yields an empty results list."""
+    with patch("app.services.load_h2h_predictions", return_value=_MOCK_H2H):
+        response = await client.post("/api/head-to-head/batch", json={"pairs": []})
+    assert response.status_code == 200
+    assert response.json() == {"results": []}
+
+
+async def test_h2h_batch_missing_body_returns_422(client: AsyncClient) -> None:
+    """POST /head-to-head/batch returns 422 when the pairs field is missing."""
+    response = await client.post("/api/head-to-head/batch", json={})
+    assert response.status_code == 422
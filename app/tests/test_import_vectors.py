@@ -0,0 +1,510 @@
+"""
+Tests for the vector import script (scripts/import_vectors.py): the adaptive
+batch sizer, the resume checkpoint, the parallel upsert loop, the
+content-hash diff import and the streaming export reader.
+
+The script is loaded from its file path; ChromaDB is replaced by an
+in-process fake collection and is never contacted.
+"""
+
+import importlib.util
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).parents[2] / "scripts" / "import_vectors.py"
+_spec = importlib.util.spec_from_file_location("import_vectors", _SCRIPT)
+import_vectors = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(import_vectors)
+
+
+# ---------------------------------------------------------------------------
+# Fakes
+# ---------------------------------------------------------------------------
+
+
+class FakeCollection:
+    """Thread-safe stand-in that stores upserted records by ID.
+
+    Args:
+        fail_on: IDs whose batch raises on every upsert attempt.
+    """
+
+    def __init__(self, fail_on: frozenset = frozenset()) -> None:
+        self.records: dict[str, dict] = {}
+        self.calls = 0
+        self.fail_on = fail_on
+        self._lock = threading.Lock()
+
+    def upsert(self, ids, embeddings, metadatas, documents) -> None:
+        with self._lock:
+            self.calls += 1
+        if self.fail_on.intersection(ids):
+            raise ConnectionError("chroma went away")
+        with self._lock:
+            for i, doc_id in enumerate(ids):
+                self.records[doc_id] = {
+                    "embedding": embeddings[i],
+                    "metadata": metadatas[i],
+                    "document": documents[i],
+                }
+
+    def get(self, include, limit, offset) -> dict:
+        with self._lock:
+            return {"ids": sorted(self.records)[offset : offset + limit]}
+
+    def delete(self, ids) -> None:
+        with self._lock:
+            for doc_id in ids:
+                self.records.pop(doc_id, None)
+
+
+class FakeClient:
+    """Stand-in for ``chromadb.HttpClient`` holding a single collection."""
+
+    def __init__(self, collection: FakeCollection) -> None:
+        self.collection = collection
+        self.deleted: list[str] = []
+
+    def delete_collection(self, name: str) -> None:
+        self.deleted.append(name)
+        self.collection.records.clear()
+
+    def get_or_create_collection(self, name: str, metadata: dict) -> FakeCollection:
+        return self.collection
+
+
+def _records(n: int) -> tuple[list, list, list, list]:
+    ids = [f"team_{i}" for i in range(n)]
+    return (
+        ids,
+        [[float(i), 1.0] for i in range(n)],
+        [{"year": 2020} for _ in range(n)],
+        [f"doc {i}" for i in range(n)],
+    )
+
+
+@pytest.fixture(autouse=True)
+def _no_retry_sleep(monkeypatch):
+    """Skip the exponential backoff between retries."""
+    monkeypatch.setattr(import_vectors.time, "sleep", lambda _: None)
+
+
+# ---------------------------------------------------------------------------
+# AdaptiveBatchSizer
+# ---------------------------------------------------------------------------
+
+
+class TestAdaptiveBatchSizer:
+    def test_grows_additively_when_fast(self):
+        sizer = import_vectors.AdaptiveBatchSizer(
+            initial=100, maximum=500, target_latency=1.0, step=50
+        )
+        sizer.record(0.2)
+        sizer.record(0.2)
+        assert sizer.size == 200
+
+    def test_halves_when_slow_or_failed(self):
+        sizer = import_vectors.AdaptiveBatchSizer(
+            initial=400, minimum=25, target_latency=1.0
+        )
+        sizer.record(3.0)
+        assert sizer.size == 200
+        sizer.record(None)
+        assert sizer.size == 100
+
+    def test_stays_within_bounds(self):
+        sizer = import_vectors.AdaptiveBatchSizer(
+            initial=1000, minimum=10, maximum=60, step=50
+        )
+        assert sizer.size == 60
+        sizer.record(0.0)
+        assert sizer.size == 60
+        for _ in range(10):
+            sizer.record(None)
+        assert sizer.size == 10
+
+
+# ---------------------------------------------------------------------------
+# Checkpoint
+# ---------------------------------------------------------------------------
+
+
+class TestCheckpoint:
+    def test_mark_merges_ranges_and_reports_gaps(self, tmp_path):
+        checkpoint = import_vectors.Checkpoint(tmp_path / "cp.json", "fp")
+        checkpoint.mark(20, 30)
+        checkpoint.mark(0, 10)
+        checkpoint.mark(10, 20)
+        checkpoint.mark(50, 60)
+        assert checkpoint.done == [[0, 30], [50, 60]]
+        assert checkpoint.confirmed == 40
+        assert checkpoint.pending(70) == [(30, 50), (60, 70)]
+
+    def test_round_trips_through_file(self, tmp_path):
+        path = tmp_path / "cp.json"
+        import_vectors.Checkpoint(path, "fp").mark(0, 5)
+        assert import_vectors.Checkpoint.load(path, "fp").done == [[0, 5]]
+
+    def test_ignores_checkpoint_for_other_export(self, tmp_path):
+        path = tmp_path / "cp.json"
+        import_vectors.Checkpoint(path, "old").mark(0, 5)
+        assert import_vectors.Checkpoint.load(path, "new").done == []
+
+    def test_save_stages_through_a_unique_temp_file(self, tmp_path, monkeypatch):
+        path = tmp_path / "cp.json"
+        staged = []
+
+        def replace(src, dst):
+            staged.append(Path(src).name)
+            raise OSError("disk full")
+
+        monkeypatch.setattr(import_vectors.os, "replace", replace)
+        checkpoint = import_vectors.Checkpoint(path, "fp")
+        for _ in range(2):
+            with pytest.raises(OSError):
+                checkpoint.save()
+        assert staged[0] != staged[1] and staged[0] != "cp.json.tmp"
+        assert list(tmp_path.iterdir()) == []
+
+    def test_fingerprint_depends_on_ids_collection_and_content(self):
+        fp = import_vectors.export_fingerprint
+        assert fp("c", ["a", "b"], "x") == fp("c", ["a", "b"], "x")
+        assert fp("c", ["a", "b"], "x") != fp("c", ["b", "a"], "x")
+        assert fp("c", ["a", "b"], "x") != fp("d", ["a", "b"], "x")
+        assert fp("c", ["a", "b"], "x") != fp("c", ["a", "b"], "y")
+
+
+# ---------------------------------------------------------------------------
+# import_vectors
+# ---------------------------------------------------------------------------
+
+
+class TestImportVectors:
+    def test_imports_every_record_in_parallel_batches(self, tmp_path):
+        collection = FakeCollection()
+        ids, embeddings, metadatas, documents = _records(237)
+        checkpoint = tmp_path / "cp.json"
+
+        import_vectors.import_vectors(
+            FakeClient(collection), "teams", ids, embeddings, metadatas, documents,
+            workers=3,
+            sizer=import_vectors.AdaptiveBatchSizer(initial=10, minimum=5),
+            checkpoint_path=checkpoint,
+        )
+
+        assert set(collection.records) == set(ids)
+        assert collection.records["team_7"]["document"] == "doc 7"
+        assert collection.calls > 1
+        assert not checkpoint.exists()
+
+    def test_failed_import_resumes_without_resending(self, tmp_path):
+        ids, embeddings, metadatas, documents = _records(100)
+        checkpoint = tmp_path / "cp.json"
+        collection = FakeCollection(fail_on=frozenset({"team_60"}))
+        client = FakeClient(collection)
+
+        with pytest.raises(ConnectionError):
+            import_vectors.import_vectors(
+                client, "teams", ids, embeddings, metadatas, documents,
+                workers=1,
+                sizer=import_vectors.AdaptiveBatchSizer(
+                    initial=20, minimum=20, maximum=20
+                ),
+                checkpoint_path=checkpoint,
+            )
+        assert checkpoint.exists()
+        assert len(collection.records) == 60
+
+        # Second run: the outage is over; --reset must not wipe the progress.
+        collection.fail_on = frozenset()
+        collection.calls = 0
+        import_vectors.import_vectors(
+            client, "teams", ids, embeddings, metadatas, documents,
+            reset=True,
+            workers=1,
+            sizer=import_vectors.AdaptiveBatchSizer(
+                initial=20, minimum=20, maximum=20
+            ),
+            checkpoint_path=checkpoint,
+        )
+        assert client.deleted == []
+        assert collection.calls == 2
+        assert set(collection.records) == set(ids)
+        assert not checkpoint.exists()
+
+    def test_reset_without_checkpoint_drops_collection(self, tmp_path):
+        collection = FakeCollection()
+        collection.records["stale"] = {}
+        client = FakeClient(collection)
+        ids, embeddings, metadatas, documents = _records(5)
+
+        import_vectors.import_vectors(
+            client, "teams", ids, embeddings, metadatas, documents,
+            reset=True, checkpoint_path=tmp_path / "cp.json",
+        )
+
+        assert client.deleted == ["teams"]
+        assert set(collection.records) == set(ids)
+
+
+# ---------------------------------------------------------------------------
+# Diff import
+# ---------------------------------------------------------------------------
+
+
+class TestDiffImport:
+    def _run(self, client, records, manifest):
+        return import_vectors.diff_import(
+            client, "teams", *records, manifest, checkpoint_path=None
+        )
+
+    def test_content_hash_ignores_key_order_but_not_values(self):
+        h = import_vectors.content_hash
+        assert h([0.1, 0.2], {"a": 1, "b": 2}, "d") == h(
+            [0.1, 0.2], {"b": 2, "a": 1}, "d"
+        )
+        assert h([0.1, 0.2], {"a": 1}, "d") != h([0.1, 0.3], {"a": 1}, "d")
+        assert h([0.1, 0.2], {"a": 1}, "d") != h([0.1, 0.2], {"a": 2}, "d")
+        assert h([0.1, 0.2], {"a": 1}, "d") != h([0.1, 0.2], {"a": 1}, "e")
+
+    def test_manifest_round_trips_without_a_fixed_temp_file(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        import_vectors.save_manifest(path, "teams", {"a": "h1"})
+        assert import_vectors.load_manifest(path, "teams") == {"a": "h1"}
+        assert import_vectors.load_manifest(path, "other") == {}
+        assert [p.name for p in tmp_path.iterdir()] == ["manifest.json"]
+
+    def test_first_run_upserts_everything(self, tmp_path):
+        collection = FakeCollection()
+        manifest = tmp_path / "manifest.json"
+
+        assert self._run(FakeClient(collection), _records(30), manifest) == (30, 0)
+        assert len(collection.records) == 30
+        assert manifest.exists()
+
+    def test_rerun_sends_only_changes_and_deletes_removed_ids(self, tmp_path):
+        collection = FakeCollection()
+        client = FakeClient(collection)
+        manifest = tmp_path / "manifest.json"
+        self._run(client, _records(30), manifest)
+
+        ids, embeddings, metadatas, documents = _records(30)
+        embeddings[3] = [9.0, 9.0]
+        documents[4] = "edited"
+        ids, embeddings = ids[:-2] + ["team_new"], embeddings[:-2] + [[1.0, 0.0]]
+        metadatas, documents = metadatas[:-1], documents[:-1]
+        collection.calls = 0
+
+        result = self._run(client, (ids, embeddings, metadatas, documents), manifest)
+
+        assert result == (3, 2)
+        assert collection.calls == 1
+        assert set(collection.records) == set(ids)
+        assert collection.records["team_3"]["embedding"] == [9.0, 9.0]
+        assert collection.records["team_4"]["document"] == "edited"
+
+    def test_unchanged_export_sends_nothing(self, tmp_path):
+        collection = FakeCollection()
+        client = FakeClient(collection)
+        manifest = tmp_path / "manifest.json"
+        self._run(client, _records(30), manifest)
+        collection.calls = 0
+
+        assert self._run(client, _records(30), manifest) == (0, 0)
+        assert collection.calls == 0
+
+    def test_ids_missing_from_collection_are_resent(self, tmp_path):
+        collection = FakeCollection()
+        client = FakeClient(collection)
+        manifest = tmp_path / "manifest.json"
+        self._run(client, _records(10), manifest)
+        del collection.records["team_2"]
+
+        assert self._run(client, _records(10), manifest) == (1, 0)
+        assert "team_2" in collection.records
+
+
+# ---------------------------------------------------------------------------
+# Streaming export reader
+# ---------------------------------------------------------------------------
+
+
+def _write_export(path: Path, n: int = 40, **overrides) -> Path:
+    """Write an export whose keys are deliberately not in record order."""
+    ids, embeddings, metadatas, documents = _records(n)
+    documents = [f'doc "{i}" [x] {{y}} \\ é' for i in range(n)]
+    data = {
+        "documents": documents,
+        "metadatas": metadatas,
+        "ids": ids,
+        "embeddings": embeddings,
+    }
+    data.update(overrides)
+    path.write_text(json.dumps(data, indent=1), encoding="utf-8")
+    return path
+
+
+class TestVectorExport:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+    def test_streams_records_in_lockstep(self, tmp_path, chunk_size):
+        path = _write_export(tmp_path / "v.json")
+        expected = json.loads(path.read_text(encoding="utf-8"))
+
+        records = list(import_vectors.VectorExport(path, chunk_size).records())
+
+        assert [r[0] for r in records] == expected["ids"]
+        assert [r[1] for r in records] == expected["embeddings"]
+        assert [r[2] for r in records] == expected["metadatas"]
+        assert [r[3] for r in records] == expected["documents"]
+
+    def test_fingerprint_covers_ids_and_content(self, tmp_path):
+        path = _write_export(tmp_path / "v.json", n=12)
+        export = import_vectors.VectorExport(path, 5)
+        count, fingerprint = export.fingerprint("teams")
+
+        assert count == 12
+        assert fingerprint == import_vectors.export_fingerprint(
+            "teams", _records(12)[0], export.content_digest()
+        )
+        # Same IDs, new vectors: a different fingerprint.
+        _write_export(path, n=12, embeddings=[[9.0, 9.0]] * 12)
+        assert export.fingerprint("teams") != (count, fingerprint)
+
+    def test_resume_after_export_change_resends_everything(self, tmp_path):
+        path = _write_export(tmp_path / "v.json", n=40)
+        checkpoint = tmp_path / "cp.json"
+        collection = FakeCollection(fail_on=frozenset({"team_30"}))
+        client = FakeClient(collection)
+        kwargs = dict(
+            workers=1,
+            sizer=import_vectors.AdaptiveBatchSizer(initial=10, minimum=10, maximum=10),
+            checkpoint_path=checkpoint,
+        )
+        with pytest.raises(ConnectionError):
+            import_vectors.import_file(client, "teams", path, **kwargs)
+        assert len(collection.records) == 30
+
+        # The export is regenerated with the same IDs and new embeddings.
+        _write_export(path, n=40, embeddings=[[9.0, 9.0]] * 40)
+        collection.fail_on = frozenset()
+        collection.calls = 0
+        import_vectors.import_file(client, "teams", path, **kwargs)
+
+        assert collection.calls == 4
+        assert all(r["embedding"] == [9.0, 9.0] for r in collection.records.values())
+
+    @pytest.mark.parametrize(
+        "overrides, message",
+        [
+            ({"documents": ["only one"]}, "Mismatched list lengths"),
+            ({"ids": ["a", "b"] + ["a"] * 38}, "Duplicate ID"),
+            ({"embeddings": [[0.0, 1.0]] * 39 + [[1.0]]}, "dimensions"),
+            ({"ids": list(range(40))}, "not a string"),
+        ],
+    )
+    def test_rejects_invalid_exports(self, tmp_path, overrides, message):
+        path = _write_export(tmp_path / "v.json", **overrides)
+
+        with pytest.raises(ValueError, match=message):
+            list(import_vectors.VectorExport(path).records())
+
+    def test_escaped_quote_at_chunk_boundary_in_skipped_column(self, tmp_path):
+        """A string cut right after ``\\"`` is rescanned, not taken as closed."""
+        path = tmp_path / "v.json"
+        marker = 'say "hi ]'
+
+        def export(pad: int) -> str:
+            ids, embeddings, metadatas, documents = _records(40)
+            metadatas[3] = {"note": "x" * pad + marker}
+            return json.dumps({
+                "documents": documents, "metadatas": metadatas,
+                "ids": ids, "embeddings": embeddings,
+            }, indent=1)
+
+        # Pad the note so its first escaped quote ends the first chunk.
+        text = export(0)
+        end = text.index('say \\"') + len('say \\"')
+        text = export(import_vectors.READ_CHUNK_SIZE - end)
+        assert text[: import_vectors.READ_CHUNK_SIZE].endswith('say \\"')
+        path.write_text(text, encoding="utf-8")
+
+        records = list(import_vectors.VectorExport(path).records())
+
+        assert [r[0] for r in records] == _records(40)[0]
+        assert records[3][2]["note"].endswith(marker)
+
+    def test_rejects_missing_key(self, tmp_path):
+        path = tmp_path / "v.json"
+        path.write_text(json.dumps({"ids": [], "embeddings": []}), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="missing required key"):
+            list(import_vectors.VectorExport(path).records())
+
+    def test_load_json_exits_on_invalid_export(self, tmp_path):
+        path = _write_export(tmp_path / "v.json", documents=["x"])
+
+        with pytest.raises(SystemExit):
+            import_vectors.load_json(path)
+
+    def test_import_file_streams_into_collection(self, tmp_path):
+        path = _write_export(tmp_path / "v.json", n=90)
+        collection = FakeCollection()
+        manifest = tmp_path / "manifest.json"
+
+        import_vectors.import_file(
+            FakeClient(collection), "teams", path,
+            manifest_path=manifest,
+            workers=2,
+            sizer=import_vectors.AdaptiveBatchSizer(initial=10, minimum=10),
+            checkpoint_path=tmp_path / "cp.json",
+        )
+
+        assert len(collection.records) == 90
+        assert collection.records["team_5"]["document"] == 'doc "5" [x] {y} \\ é'
+        assert len(json.loads(manifest.read_text())["hashes"]) == 90
+
+        # The manifest written by the full import makes a --diff run a no-op.
+        collection.calls = 0
+        import_vectors.import_file(
+            FakeClient(collection), "teams", path, diff=True, manifest_path=manifest,
+        )
+        assert collection.calls == 0
+
+    def test_diff_repairs_records_skipped_by_a_stale_resume(self, tmp_path):
+        """Only records sent by the run itself enter the manifest."""
+        path = _write_export(tmp_path / "v.json", n=40)
+        manifest = tmp_path / "manifest.json"
+        collection = FakeCollection(fail_on=frozenset({"team_30"}))
+        client = FakeClient(collection)
+        kwargs = dict(
+            manifest_path=manifest,
+            workers=1,
+            sizer=import_vectors.AdaptiveBatchSizer(initial=10, minimum=10, maximum=10),
+            checkpoint_path=tmp_path / "cp.json",
+        )
+        with pytest.raises(ConnectionError):
+            import_vectors.import_file(client, "teams", path, **kwargs)
+
+        # A checkpoint that survives a content change (as one keyed on IDs
+        # alone did) makes the resumed run skip the first 30 records.
+        _write_export(path, n=40, embeddings=[[9.0, 9.0]] * 40)
+        checkpoint = json.loads(kwargs["checkpoint_path"].read_text())
+        checkpoint["fingerprint"] = import_vectors.VectorExport(path).fingerprint(
+            "teams"
+        )[1]
+        kwargs["checkpoint_path"].write_text(json.dumps(checkpoint))
+        collection.fail_on = frozenset()
+        import_vectors.import_file(client, "teams", path, **kwargs)
+        assert len(json.loads(manifest.read_text())["hashes"]) == 10
+        assert collection.records["team_0"]["embedding"] != [9.0, 9.0]
+
+        collection.calls = 0
+        import_vectors.import_file(
+            client, "teams", path, diff=True, manifest_path=manifest,
+        )
+        assert collection.calls > 0
+        assert all(r["embedding"] == [9.0, 9.0] for r in collection.records.values())
+        assert len(json.loads(manifest.read_text())["hashes"]) == 40
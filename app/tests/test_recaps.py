@@ -0,0 +1,125 @@
+"""
+Tests for the recap sidecar store (app/recaps.py) and GET /analyze/{team}/recaps.
+
+Sidecar tests write to a pytest ``tmp_path`` so no real data files are touched.
+Endpoint tests mock the service layer so no predictions file is required.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app import recaps
+from app.main import app
+
+# ---------------------------------------------------------------------------
+# Shared fixtures
+# ---------------------------------------------------------------------------
+
+
+def _teams() -> list[dict]:
+    """Return fresh raw team records with recap lists attached."""
+    return [
+        {"name": "Duke", "wins": 32, "summaries": ["Duke 75, Texas 60", "Duke 80"]},
+        {"name": "Saint Mary's", "wins": 25, "summaries": ["Gaels — 70–65 ✓"]},
+        {"name": "Siena", "wins": 20},
+    ]
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    """Write a predictions.json with recaps into a temp directory."""
+    path = tmp_path / "predictions.json"
+    path.write_text(json.dumps(_teams()), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+async def client() -> AsyncClient:
+    """Yield an async HTTPX client wired directly to the FastAPI app."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as c:
+        yield c
+
+
+# ---------------------------------------------------------------------------
+# split_recaps / load_compiled_predictions
+# ---------------------------------------------------------------------------
+
+
+def test_split_removes_summaries_from_records(source: Path, tmp_path: Path) -> None:
+    """Team records no longer carry the summaries key after splitting."""
+    teams = recaps.split_recaps(_teams(), source, tmp_path / "compiled")
+    assert all("summaries" not in t for t in teams)
+    assert teams[0]["wins"] == 32
+
+
+def test_split_recaps_are_readable_per_team(source: Path, tmp_path: Path) -> None:
+    """Each team's recap list round-trips through the sidecar, case-insensitively."""
+    recaps.split_recaps(_teams(), source, tmp_path / "compiled")
+    store = recaps.get_active_store()
+    assert store.get("duke") == ["Duke 75, Texas 60", "Duke 80"]
+    assert store.get("Saint Mary's") == ["Gaels — 70–65 ✓"]
+    assert store.get("Siena") == []
+    assert store.get("Gonzaga") is None
+
+
+def test_load_compiled_returns_core_records(source: Path, tmp_path: Path) -> None:
+    """A fresh sidecar is loaded without re-parsing the full source file."""
+    out_dir = tmp_path / "compiled"
+    recaps.split_recaps(_teams(), source, out_dir)
+
+    teams = recaps.load_compiled_predictions(source, out_dir)
+    assert [t["name"] for t in teams] == ["Duke", "Saint Mary's", "Siena"]
+    assert all("summaries" not in t for t in teams)
+    assert recaps.get_active_store().get("Duke")[1] == "Duke 80"
+
+
+def test_load_compiled_detects_stale_sidecar(source: Path, tmp_path: Path) -> None:
+    """Changing the source file invalidates the compiled sidecar."""
+    out_dir = tmp_path / "compiled"
+    recaps.split_recaps(_teams(), source, out_dir)
+
+    source.write_text(json.dumps(_teams() + [{"name": "New"}]), encoding="utf-8")
+    assert recaps.load_compiled_predictions(source, out_dir) is None
+
+
+def test_load_compiled_missing_sidecar_returns_none(
+    source: Path, tmp_path: Path
+) -> None:
+    """No sidecar on disk means the caller must parse the full file."""
+    assert recaps.load_compiled_predictions(source, tmp_path / "absent") is None
+
+
+def test_split_falls_back_to_memory_on_write_error(
+    source: Path, tmp_path: Path
+) -> None:
+    """A failed sidecar write keeps recaps readable from memory."""
+    with patch("app.recaps.write_atomic", side_effect=OSError("read-only")):
+        recaps.split_recaps(_teams(), source, tmp_path / "compiled")
+    assert recaps.get_active_store().get("Duke")[0] == "Duke 75, Texas 60"
+
+
+# ---------------------------------------------------------------------------
+# GET /analyze/{team}/recaps
+# ---------------------------------------------------------------------------
+
+
+async def test_recaps_endpoint_returns_recaps(client: AsyncClient) -> None:
+    """GET /analyze/{team}/recaps returns the canonical name and recap list."""
+    with patch("app.routers.analyze.find_team", return_value={"name": "Duke"}), \
+         patch("app.routers.analyze.get_team_recaps", return_value=["Recap"]):
+        response = await client.get("/api/analyze/duke/recaps")
+    assert response.status_code == 200
+    assert response.json() == {"team": "Duke", "recaps": ["Recap"]}
+
+
+async def test_recaps_endpoint_unknown_team_returns_404(client: AsyncClient) -> None:
+    """GET /analyze/{team}/recaps returns 404 for an unknown team."""
+    with patch("app.routers.analyze.find_team", return_value=None):
+        response = await client.get("/api/analyze/Nobody/recaps")
+    assert response.status_code == 404
@@ -15,7 +15,12 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 
 from app.main import app
-from app.services import _get_game_predicted_probability, get_results, load_results_data
+from app.services import (
+    FileCache,
+    _get_game_predicted_probability,
+    get_results,
+    load_results_data,
+)
 
 # ---------------------------------------------------------------------------
 # Shared test fixtures
@@ -116,6 +121,66 @@ def test_load_results_data_raises_when_file_missing() -> None:
             load_results_data()
 
 
+# ---------------------------------------------------------------------------
+# FileCache — unit tests
+# ---------------------------------------------------------------------------
+
+
+def test_file_cache_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    """An unchanged file is parsed once; a rewrite triggers exactly one re-parse."""
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps([{"year": 2026}]))
+    cache = FileCache()
+
+    first = cache.get(path)
+    assert cache.get(path) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Different size guarantees a new signature even on coarse-mtime filesystems.
+    path.write_text(json.dumps([{"year": 2026}, {"year": 2027}]))
+    second = cache.get(path)
+    assert second == [{"year": 2026}, {"year": 2027}]
+    assert cache.get(path) is second
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_file_cache_detects_atomic_replace(tmp_path: Path) -> None:
+    """Replacing the file via rename (new inode) is detected."""
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps([1]))
+    cache = FileCache()
+    cache.get(path)
+
+    staged = tmp_path / "staged.json"
+    staged.write_text(json.dumps([2]))
+    staged.replace(path)
+    assert cache.get(path) == [2]
+
+
+def test_file_cache_stats_report_hit_ratio(tmp_path: Path) -> None:
+    """stats() reports hits, misses, and the hit ratio."""
+    path = tmp_path / "results.json"
+    path.write_text("[]")
+    cache = FileCache()
+    assert cache.stats() == {"hits": 0, "misses": 0, "hit_ratio": 0.0}
+    for _ in range(4):
+        cache.get(path)
+    assert cache.stats() == {"hits": 3, "misses": 1, "hit_ratio": 0.75}
+
+
+def test_file_cache_missing_file_raises(tmp_path: Path) -> None:
+    """A missing file raises FileNotFoundError rather than serving stale data."""
+    with pytest.raises(FileNotFoundError):
+        FileCache().get(tmp_path / "absent.json")
+
+
+async def test_metrics_exposes_results_cache(client: AsyncClient) -> None:
+    """GET /api/metrics reports the results cache counters."""
+    response = await client.get("/api/metrics")
+    assert response.status_code == 200
+    assert set(response.json()["results_cache"]) == {"hits", "misses", "hit_ratio"}
+
+
 # ---------------------------------------------------------------------------
 # get_results — unit tests (model building)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,162 @@
+"""
+Tests for the preloading multi-worker launcher (app/serve.py), the dataset
+preload in app/services.py, and the GET /ready readiness endpoint.
+"""
+
+import gc
+import os
+import signal
+import socket
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app import serve, services
+from app.main import app
+
+
+@pytest.fixture
+async def client() -> AsyncClient:
+    """Yield an async HTTPX client wired directly to the FastAPI app (no network)."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as c:
+        yield c
+
+
+# ---------------------------------------------------------------------------
+# preload_datasets
+# ---------------------------------------------------------------------------
+
+
+def test_preload_datasets_reports_loaded_sizes() -> None:
+    store = SimpleNamespace(by_id={1: {}, 2: {}})
+    matrix = SimpleNamespace(names=("duke", "siena", "uconn"))
+    with patch("app.services.get_team_store", return_value=store), \
+         patch("app.services.get_h2h_matrix", return_value=matrix), \
+         patch("app.services.load_results_data", return_value=[{"year": 2026}]):
+        counts = services.preload_datasets()
+
+    assert counts == {"teams": 2, "h2h_teams": 3, "tournaments": 1}
+
+
+def test_preload_datasets_tolerates_missing_optional_files() -> None:
+    """Missing H2H and results files count as empty, not as a failure."""
+    store = SimpleNamespace(by_id={1: {}})
+    missing = FileNotFoundError("missing")
+    with patch("app.services.get_team_store", return_value=store), \
+         patch("app.services.get_h2h_matrix", side_effect=missing), \
+         patch("app.services.load_results_data", side_effect=missing):
+        counts = services.preload_datasets()
+
+    assert counts == {"teams": 1, "h2h_teams": 0, "tournaments": 0}
+
+
+def test_preload_datasets_requires_predictions() -> None:
+    with patch("app.services.get_team_store",
+               side_effect=FileNotFoundError("predictions.json")):
+        with pytest.raises(FileNotFoundError):
+            services.preload_datasets()
+
+
+# ---------------------------------------------------------------------------
+# GET /ready
+# ---------------------------------------------------------------------------
+
+
+async def test_ready_is_503_until_datasets_are_loaded(client: AsyncClient) -> None:
+    with patch.object(app.state, "datasets", None, create=True):
+        response = await client.get("/ready")
+    assert response.status_code == 503
+
+
+async def test_ready_reports_worker_and_dataset_sizes(client: AsyncClient) -> None:
+    datasets = {"teams": 68, "h2h_teams": 68, "tournaments": 1}
+    with patch.object(app.state, "datasets", datasets, create=True):
+        response = await client.get("/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready", "pid": os.getpid(), **datasets}
+
+
+# ---------------------------------------------------------------------------
+# Launcher
+# ---------------------------------------------------------------------------
+
+
+def test_bind_socket_listens_and_is_inheritable() -> None:
+    sock = serve.bind_socket("127.0.0.1", 0)
+    try:
+        assert sock.get_inheritable()
+        with socket.create_connection(sock.getsockname(), timeout=1):
+            pass
+    finally:
+        sock.close()
+
+
+def test_freeze_heap_moves_objects_to_permanent_generation() -> None:
+    try:
+        serve.freeze_heap()
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_reload_workers_compiles_once_before_signalling() -> None:
+    """Workers are signalled only after the parent compiled the snapshot."""
+    calls = []
+    with patch("app.services.load_dataset_snapshot",
+               side_effect=lambda: calls.append("compile")), \
+         patch("app.serve.os.kill", side_effect=lambda *a: calls.append(a)):
+        serve.reload_workers([11, 12])
+
+    assert calls == ["compile", (11, signal.SIGHUP), (12, signal.SIGHUP)]
+
+
+def test_reload_workers_signals_even_if_compiling_fails() -> None:
+    kill = []
+    with patch("app.services.load_dataset_snapshot",
+               side_effect=RuntimeError("boom")), \
+         patch("app.serve.os.kill", side_effect=lambda *a: kill.append(a)):
+        serve.reload_workers([11])
+
+    assert kill == [(11, signal.SIGHUP)]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_sighup_does_not_kill_a_starting_worker() -> None:
+    """A reload signalled before the worker's lifespan runs is ignored."""
+    sock = serve.bind_socket("127.0.0.1", 0)
+    try:
+        with patch("app.serve._run_worker", lambda *_: time.sleep(1)):
+            pid = serve._spawn(sock, "warning")
+        time.sleep(0.2)
+        os.kill(pid, signal.SIGHUP)
+        _, status = os.waitpid(pid, 0)
+    finally:
+        sock.close()
+    assert os.waitstatus_to_exitcode(status) == 0
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_supervise_stops_all_workers_on_sigterm() -> None:
+    """SIGTERM to the parent is forwarded and every worker is reaped."""
+    sock = serve.bind_socket("127.0.0.1", 0)
+    previous = {s: signal.getsignal(s) for s in (signal.SIGTERM, signal.SIGINT)}
+    stop = threading.Timer(0.5, os.kill, (os.getpid(), signal.SIGTERM))
+    try:
+        with patch("app.serve._run_worker", lambda *_: time.sleep(30)):
+            stop.start()
+            started = time.monotonic()
+            assert serve.supervise(sock, 2, "warning") == 0
+        assert time.monotonic() - started < 10
+        with pytest.raises(ChildProcessError):
+            os.wait()
+    finally:
+        stop.cancel()
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+        sock.close()
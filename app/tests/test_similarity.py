@@ -0,0 +1,315 @@
+"""
+Tests for the in-process cosine-similarity index (app/similarity.py) and its
+use as a primary or fallback engine in get_similar_teams, the non-blocking
+executor/deadline wrapper around the lookup, and the precomputed table for
+the whole tournament field.
+
+Indexes are built from small hand-written vectors; ChromaDB is never contacted.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from app import similarity
+from app.services import (
+    get_similar_teams,
+    load_similar_table,
+    precompute_similar_teams,
+)
+from app.similarity import SimilarityIndex, load_similarity_index
+from app.vector_store import CircuitBreaker, VectorStoreUnavailable
+
+# ---------------------------------------------------------------------------
+# Shared fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def _fresh_breaker():
+    """Give each test a closed breaker and no last known good results."""
+    with patch("app.services.chroma_breaker", CircuitBreaker("test")), \
+         patch.dict("app.services._last_good_similar", clear=True), \
+         patch("app.services._similar_table", {}):
+        yield
+
+
+def _meta(name: str, year: int, wins: int = 0) -> dict:
+    """Return vector-store metadata for one team season."""
+    return {"name": name, "year": year, "tournament_seed": 1, "tournament_wins": wins}
+
+
+_IDS = ["duke_2026", "kansas_2026", "uconn_2024", "baylor_2021", "iowa_2019"]
+_EMBEDDINGS = [
+    [1.0, 0.0, 0.0],
+    [0.99, 0.1, 0.0],  # Current season — must never be returned
+    [2.0, 0.2, 0.0],   # Unnormalised on purpose
+    [0.5, 0.5, 0.0],
+    [0.0, 0.0, 1.0],
+]
+_METADATAS = [
+    _meta("Duke", 2026),
+    _meta("Kansas", 2026),
+    _meta("UConn", 2024, 6),
+    _meta("Baylor", 2021, 6),
+    _meta("Iowa", 2019, 1),
+]
+
+
+@pytest.fixture
+def index() -> SimilarityIndex:
+    """Return an index over the five sample vectors."""
+    return SimilarityIndex(_IDS, _EMBEDDINGS, _METADATAS)
+
+
+# ---------------------------------------------------------------------------
+# SimilarityIndex
+# ---------------------------------------------------------------------------
+
+
+def test_rows_are_unit_length_and_read_only(index: SimilarityIndex) -> None:
+    """Vectors are normalised once and cannot be modified."""
+    assert np.allclose(np.linalg.norm(index.vectors, axis=1), 1.0)
+    assert not index.vectors.flags.writeable
+
+
+def test_most_similar_orders_and_excludes_current_year(
+    index: SimilarityIndex,
+) -> None:
+    """Neighbours are ordered by cosine and skip the excluded season."""
+    matches = index.most_similar("duke_2026", 3, exclude_year=2026)
+    assert [m["name"] for m, _ in matches] == ["UConn", "Baylor", "Iowa"]
+    assert matches[0][1] == pytest.approx(2.0 / np.hypot(2.0, 0.2))
+    assert matches[2][1] == pytest.approx(0.0)
+
+
+def test_most_similar_never_returns_query_row(index: SimilarityIndex) -> None:
+    """The query row is excluded even without a year filter."""
+    matches = index.most_similar("uconn_2024", 10)
+    assert len(matches) == 4
+    assert "UConn" not in [m["name"] for m, _ in matches]
+
+
+def test_most_similar_unknown_id_returns_none(index: SimilarityIndex) -> None:
+    """An ID that is not indexed yields None."""
+    assert index.most_similar("nobody_2026", 3) is None
+
+
+def test_mismatched_lengths_rejected() -> None:
+    """ids, embeddings and metadatas must line up."""
+    with pytest.raises(ValueError):
+        SimilarityIndex(["a"], [[1.0], [2.0]], [{}])
+
+
+def test_from_json_reads_export(tmp_path: Path) -> None:
+    """The chroma_vectors.json export loads directly into an index."""
+    path = tmp_path / "chroma_vectors.json"
+    path.write_text(json.dumps({
+        "ids": _IDS, "embeddings": _EMBEDDINGS, "metadatas": _METADATAS,
+        "documents": [""] * len(_IDS),
+    }))
+    index = SimilarityIndex.from_json(path)
+    assert len(index) == 5
+    assert index.index["iowa_2019"] == 4
+
+
+def test_failed_load_is_not_retried_until_the_window_ends(tmp_path: Path) -> None:
+    """A missing export is looked up once per retry window, not per call."""
+    path = tmp_path / "chroma_vectors.json"
+    now = [1000.0]
+    with patch.object(similarity, "_similarity_index", None), \
+         patch.object(similarity, "_similarity_retry_at", 0.0), \
+         patch("app.similarity.SIMILARITY_RETRY_SECONDS", 60.0), \
+         patch("app.similarity.time.monotonic", side_effect=lambda: now[0]):
+        assert load_similarity_index(path) is None
+        path.write_text(json.dumps({
+            "ids": _IDS, "embeddings": _EMBEDDINGS, "metadatas": _METADATAS,
+        }))
+        with patch.object(Path, "exists") as exists:
+            assert load_similarity_index(path) is None
+        exists.assert_not_called()
+
+        now[0] += 61.0
+        index = load_similarity_index(path)
+        assert index is not None and len(index) == 5
+        assert load_similarity_index(path) is index
+
+
+def test_from_collection_pages_until_empty() -> None:
+    """Vectors are pulled from ChromaDB page by page."""
+    collection = MagicMock()
+    collection.get.side_effect = [
+        {"ids": _IDS[:3], "embeddings": _EMBEDDINGS[:3], "metadatas": _METADATAS[:3]},
+        {"ids": _IDS[3:], "embeddings": _EMBEDDINGS[3:], "metadatas": _METADATAS[3:]},
+        {"ids": [], "embeddings": [], "metadatas": []},
+    ]
+    index = SimilarityIndex.from_collection(collection)
+    assert index.ids == _IDS
+    assert collection.get.call_args_list[1].kwargs["offset"] == 3
+
+
+# ---------------------------------------------------------------------------
+# get_similar_teams engine selection
+# ---------------------------------------------------------------------------
+
+
+async def test_numpy_engine_skips_chroma(index: SimilarityIndex) -> None:
+    """With SIMILARITY_ENGINE=numpy ChromaDB is never queried."""
+    with patch("app.services.SIMILARITY_ENGINE", "numpy"), \
+         patch("app.services.get_similarity_index", return_value=index), \
+         patch("app.services.vector_store.collection") as collection:
+        similar = await get_similar_teams("Duke")
+    assert [t.name for t in similar] == ["UConn", "Baylor", "Iowa"]
+    assert similar[2].similarity == 0.0
+    collection.assert_not_called()
+
+
+async def test_fallback_serves_index_when_chroma_down(index: SimilarityIndex) -> None:
+    """The index answers when ChromaDB is unreachable and fallback is on."""
+    with patch("app.services.SIMILARITY_FALLBACK", True), \
+         patch("app.services.get_similarity_index", return_value=index), \
+         patch("app.services.vector_store.collection",
+               side_effect=VectorStoreUnavailable("down")):
+        similar = await get_similar_teams("Duke")
+    assert [t.name for t in similar] == ["UConn", "Baylor", "Iowa"]
+
+
+async def test_fallback_disabled_returns_empty(index: SimilarityIndex) -> None:
+    """Without fallback, a ChromaDB outage still degrades to an empty list."""
+    with patch("app.services.SIMILARITY_FALLBACK", False), \
+         patch("app.services.get_similarity_index", return_value=index), \
+         patch("app.services.vector_store.collection",
+               side_effect=VectorStoreUnavailable("down")):
+        assert await get_similar_teams("Duke") == []
+
+
+# ---------------------------------------------------------------------------
+# Non-blocking lookup
+# ---------------------------------------------------------------------------
+
+
+async def test_slow_lookup_times_out_with_empty_list() -> None:
+    """A lookup that misses the deadline returns [] without waiting for it."""
+    release = threading.Event()
+
+    def slow(team_name: str) -> list:
+        release.wait(5)
+        return ["late"]
+
+    with patch("app.services._find_similar_teams", side_effect=slow), \
+         patch("app.services.SIMILARITY_TIMEOUT", 0.05):
+        start = time.monotonic()
+        assert await get_similar_teams("Duke") == []
+    release.set()
+    assert time.monotonic() - start < 1.0
+
+
+async def test_slow_lookup_does_not_block_event_loop() -> None:
+    """Other coroutines keep running while a lookup blocks in its thread."""
+    release = threading.Event()
+
+    def slow(team_name: str) -> list:
+        release.wait(5)
+        return []
+
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+            ticks += 1
+        release.set()
+
+    with patch("app.services._find_similar_teams", side_effect=slow):
+        await asyncio.gather(get_similar_teams("Duke"), ticker())
+    assert ticks == 5
+
+
+# ---------------------------------------------------------------------------
+# Precomputed table
+# ---------------------------------------------------------------------------
+
+_FIELD = [{"name": "Duke", "seed": 1}, {"name": "Kansas", "seed": 1},
+          {"name": "Nobody", "seed": 16}]
+
+
+def _batch_collection() -> MagicMock:
+    """Return a collection mock answering a batch get + query for two teams."""
+    collection = MagicMock()
+    collection.get.return_value = {
+        "ids": ["duke_2026", "kansas_2026"], "embeddings": [[1.0], [0.9]],
+    }
+    row = [_meta("UConn", 2024, 6), _meta("Kansas", 2026), _meta("Iowa", 2019, 1)]
+    collection.query.return_value = {
+        "metadatas": [row, row], "distances": [[0.1, 0.2, 0.3], [0.2, 0.0, 0.4]],
+    }
+    return collection
+
+
+def test_precompute_batches_chroma_and_persists(tmp_path: Path) -> None:
+    """The whole field is resolved in one get + one query and written to disk."""
+    collection = _batch_collection()
+    path = tmp_path / "similar-teams.json"
+    with patch("app.services.get_all_teams", return_value=_FIELD), \
+         patch("app.services.vector_store.collection", return_value=collection):
+        table, source = precompute_similar_teams(path)
+
+    assert source == "chroma"
+    assert collection.get.call_count == 1
+    assert collection.query.call_count == 1
+    assert collection.query.call_args.kwargs["query_embeddings"] == [[1.0], [0.9]]
+    assert [t.name for t in table["duke_2026"]] == ["UConn", "Iowa"]
+    assert "nobody_2026" not in table
+    assert json.loads(path.read_text())["year"] == 2026
+
+
+def test_precompute_falls_back_to_index(index: SimilarityIndex, tmp_path: Path) -> None:
+    """With ChromaDB down, the fallback index computes the table."""
+    with patch("app.services.get_all_teams", return_value=_FIELD), \
+         patch("app.services.vector_store.collection",
+               side_effect=VectorStoreUnavailable("down")), \
+         patch("app.services.SIMILARITY_FALLBACK", True), \
+         patch("app.services.get_similarity_index", return_value=index):
+        table, source = precompute_similar_teams(tmp_path / "t.json")
+    assert source == "numpy"
+    assert [t.name for t in table["kansas_2026"]][0] == "UConn"
+
+
+def test_precompute_without_any_engine_raises(tmp_path: Path) -> None:
+    """No engine at all is reported instead of publishing an empty table."""
+    with patch("app.services.get_all_teams", return_value=_FIELD), \
+         patch("app.services.vector_store.collection",
+               side_effect=VectorStoreUnavailable("down")), \
+         patch("app.services.SIMILARITY_FALLBACK", False):
+        with pytest.raises(VectorStoreUnavailable):
+            precompute_similar_teams(tmp_path / "t.json")
+
+
+async def test_table_is_served_without_chroma(tmp_path: Path) -> None:
+    """A persisted table is reloaded and answers lookups with no vector store."""
+    path = tmp_path / "similar-teams.json"
+    with patch("app.services.get_all_teams", return_value=_FIELD), \
+         patch("app.services.vector_store.collection",
+               return_value=_batch_collection()):
+        precompute_similar_teams(path)
+
+    with patch("app.services._similar_table", {}):
+        assert load_similar_table(path) == 2
+        with patch("app.services._find_similar_teams") as find:
+            similar = await get_similar_teams("DUKE")
+        find.assert_not_called()
+    assert [t.name for t in similar] == ["UConn", "Iowa"]
+
+
+def test_table_from_other_season_is_ignored(tmp_path: Path) -> None:
+    """A table computed for another season is not loaded."""
+    path = tmp_path / "similar-teams.json"
+    path.write_text(json.dumps({"year": 2020, "teams": {"duke_2020": []}}))
+    assert load_similar_table(path) == 0
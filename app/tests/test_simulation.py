@@ -0,0 +1,144 @@
+"""
+Tests for the Monte Carlo tournament simulator (app/simulation.py).
+
+Runs on a synthetic 68-team bracket built in the test, so no real data files
+are needed.  Sampled frequencies are compared with the exact DP in
+app/bracket.py.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app import simulation
+from app.bracket import BracketEngine, BracketLayout, fix_results
+from app.main import app
+from app.simulation import TournamentSimulator
+
+# ---------------------------------------------------------------------------
+# Shared fixtures
+# ---------------------------------------------------------------------------
+
+# Round of 64 slots fed by a First Four game.
+_FIRST_FOUR = (5, 21, 40, 63)
+
+
+def _engine(seed: int = 3) -> BracketEngine:
+    names, slots = [], []
+    for slot in range(64):
+        names.append(f"T{slot}")
+        slots.append(slot)
+        if slot in _FIRST_FOUR:
+            names.append(f"T{slot}b")
+            slots.append(slot)
+    rng = np.random.default_rng(seed)
+    upper = np.triu(rng.uniform(0.1, 0.9, (68, 68)), 1)
+    probs = upper + np.tril(1.0 - upper.T, -1)
+    return BracketEngine(BracketLayout(names, slots), probs)
+
+
+# ---------------------------------------------------------------------------
+# TournamentSimulator
+# ---------------------------------------------------------------------------
+
+
+def test_sampled_tournaments_are_valid_brackets() -> None:
+    """Every game is won by one of the two winners that feed into it."""
+    engine = _engine()
+    simulator = TournamentSimulator(engine)
+    outcomes = simulator.sample(500, np.random.default_rng(0))
+
+    assert outcomes.shape == (500, 67) and outcomes.dtype == np.uint8
+    column = {game: k for k, game in enumerate(simulator.games)}
+    slots = engine.layout.slots
+    for (r, node), k in column.items():
+        if r == 0:
+            assert set(outcomes[:, k]) <= set(np.flatnonzero(slots == node))
+        elif r == 1:
+            assert (slots[outcomes[:, k]] >> 1 == node).all()
+        else:
+            feeders = outcomes[:, [column[(r - 1, 2 * node)],
+                                   column[(r - 1, 2 * node + 1)]]]
+            assert (feeders == outcomes[:, [k]]).any(axis=1).all()
+
+    wins = simulator.wins(outcomes)
+    assert (wins.sum(axis=1) == 63).all()
+    assert wins.max() <= 6
+
+
+def test_frequencies_match_exact_advancement() -> None:
+    engine = _engine()
+    simulator = TournamentSimulator(engine)
+    n = 200_000
+    wins = simulator.wins(simulator.sample(n, np.random.default_rng(1)))
+
+    exact = engine.win_distribution(engine.advancement())
+    sampled = np.stack([(wins == k).mean(axis=0) for k in range(7)])
+    # Five standard errors of the largest cell.
+    assert np.abs(sampled - exact).max() < 5 * np.sqrt(0.25 / n)
+
+
+def test_completed_games_are_pinned() -> None:
+    engine = _engine()
+    games = [(0, "T5", "T5b", "T5b"), (1, "T4", "T5b", "T5b"),
+             (1, "T6", "T7", "T7"), (2, "T5b", "T7", "T7")]
+    winners = fix_results(engine.layout, games)
+    simulator = TournamentSimulator(engine, winners)
+    n = 100_000
+    wins = simulator.wins(simulator.sample(n, np.random.default_rng(2)))
+
+    t7 = engine.layout.names.index("T7")
+    t5b = engine.layout.names.index("T5b")
+    assert (wins[:, t5b] == 1).all()
+    assert (wins[:, t7] >= 2).all()
+    exact = engine.advancement(winners=winners)
+    assert (wins[:, t7] >= 3).mean() == pytest.approx(exact[3, t7], abs=0.01)
+
+
+# ---------------------------------------------------------------------------
+# run
+# ---------------------------------------------------------------------------
+
+
+def test_seeded_runs_do_not_depend_on_worker_count() -> None:
+    engine = _engine()
+    serial = simulation.run(engine, 2_500, seed=7, workers=1, shard_size=1_000)
+    pooled = simulation.run(engine, 2_500, seed=7, workers=2, shard_size=1_000)
+
+    assert serial.shape == (2_500, 67)
+    assert np.array_equal(serial, pooled)
+    other = simulation.run(engine, 2_500, seed=8, workers=1, shard_size=1_000)
+    assert not np.array_equal(serial, other)
+
+
+def test_runs_are_metered() -> None:
+    meter = simulation.ThroughputMeter()
+    with patch("app.simulation.meter", meter):
+        simulation.run(_engine(), 1_000, seed=0)
+        simulation.run(_engine(), 500, seed=0)
+
+    stats = meter.stats()
+    assert stats["runs"] == 2 and stats["simulations"] == 1_500
+    assert stats["sims_per_second"] > 0 and stats["last_sims_per_second"] > 0
+
+
+def test_command_line_reports_throughput(capsys) -> None:
+    with patch("app.services.get_bracket_engine", return_value=_engine()):
+        assert simulation.main(["-n", "2000", "--seed", "1", "--top", "3"]) == 0
+
+    out = capsys.readouterr().out
+    assert "2,000 tournaments" in out and "per second" in out
+    assert len(out.strip().splitlines()) == 5
+
+
+async def test_metrics_report_simulation_throughput() -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/api/metrics")
+    assert response.status_code == 200
+    assert set(response.json()["simulation"]) == {
+        "runs", "simulations", "seconds", "sims_per_second", "last_sims_per_second",
+    }
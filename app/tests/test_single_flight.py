@@ -0,0 +1,163 @@
+"""
+Tests for request coalescing (SingleFlight in app/services.py) and its use on
+the similar-teams lookup and the /analyze/{team} endpoint.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from app.services import SingleFlight, analysis_flight, get_similar_teams
+
+# ---------------------------------------------------------------------------
+# Shared fixtures
+# ---------------------------------------------------------------------------
+
+_TEAM = {
+    "name": "Duke",
+    "tournament_seed": 1,
+    "conference": "ACC",
+    "wins": 30,
+    "losses": 4,
+    "avg_height": 78,
+    "players": [],
+    "profile_summary": "",
+    "win_probability_distribution": {
+        "0": 0.1, "1": 0.2, "2": 0.2, "3": 0.2, "4": 0.1, "5": 0.1, "6": 0.1,
+    },
+}
+
+
+@pytest.fixture
+async def client() -> AsyncClient:
+    """Yield an async HTTPX client wired directly to the FastAPI app."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as c:
+        yield c
+
+
+# ---------------------------------------------------------------------------
+# SingleFlight
+# ---------------------------------------------------------------------------
+
+
+async def test_concurrent_calls_share_one_computation() -> None:
+    """Callers with the same key all get the lead's result; fn runs once."""
+    flight = SingleFlight("test-share")
+    calls = 0
+
+    async def work() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "done"
+
+    results = await asyncio.gather(*(flight.do("k", work) for _ in range(10)))
+    assert results == ["done"] * 10
+    assert calls == 1
+    assert flight.stats() == {
+        "name": "test-share", "leads": 1, "followers": 9, "in_flight": 0,
+    }
+
+
+async def test_different_keys_run_independently() -> None:
+    """Only equal keys are coalesced."""
+    flight = SingleFlight("test-keys")
+
+    async def work() -> int:
+        await asyncio.sleep(0)
+        return 1
+
+    await asyncio.gather(flight.do("a", work), flight.do("b", work))
+    assert flight.leads == 2
+    assert flight.followers == 0
+
+
+async def test_key_is_released_after_completion() -> None:
+    """A later call after completion computes afresh."""
+    flight = SingleFlight("test-release")
+    work = AsyncMock(side_effect=[1, 2])
+    assert await flight.do("k", work) == 1
+    assert await flight.do("k", work) == 2
+    assert flight.leads == 2
+
+
+async def test_exception_is_shared_by_all_waiters() -> None:
+    """Every waiter sees the shared failure, and the key is released."""
+    flight = SingleFlight("test-error")
+
+    async def boom() -> None:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("down")
+
+    results = await asyncio.gather(
+        *(flight.do("k", boom) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert flight.stats()["in_flight"] == 0
+
+
+async def test_cancelled_lead_does_not_cancel_followers() -> None:
+    """A follower still gets the result when the lead is cancelled."""
+    flight = SingleFlight("test-cancel")
+    release = asyncio.Event()
+
+    async def work() -> str:
+        await release.wait()
+        return "ok"
+
+    lead = asyncio.ensure_future(flight.do("k", work))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flight.do("k", work))
+    await asyncio.sleep(0)
+    lead.cancel()
+    release.set()
+    assert await follower == "ok"
+
+
+# ---------------------------------------------------------------------------
+# Applied to lookups
+# ---------------------------------------------------------------------------
+
+
+async def test_similar_team_lookups_are_coalesced() -> None:
+    """Concurrent lookups for one team run the blocking lookup once."""
+    with patch("app.services._similar_table", {}), \
+         patch("app.services._find_similar_teams", return_value=[]) as find:
+        await asyncio.gather(*(get_similar_teams("Duke") for _ in range(5)))
+    assert find.call_count == 1
+
+
+async def test_analyze_requests_are_coalesced(client: AsyncClient) -> None:
+    """Concurrent /analyze requests for one team share one lookup."""
+    release = asyncio.Event()
+
+    async def slow_similar(name: str) -> list:
+        await release.wait()
+        return []
+
+    followers = analysis_flight.followers
+    with patch("app.routers.analyze.find_team", return_value=_TEAM), \
+         patch("app.routers.analyze.get_similar_teams",
+               side_effect=slow_similar) as similar:
+        requests = [
+            asyncio.ensure_future(client.get("/api/analyze/Duke")) for _ in range(4)
+        ]
+        await asyncio.sleep(0.05)
+        release.set()
+        responses = await asyncio.gather(*requests)
+
+    assert all(r.status_code == 200 for r in responses)
+    assert similar.await_count == 1
+    assert analysis_flight.followers == followers + 3
+
+
+async def test_metrics_reports_single_flight(client: AsyncClient) -> None:
+    """GET /api/metrics lists each coalescing group."""
+    body = (await client.get("/api/metrics")).json()
+    names = {f["name"] for f in body["single_flight"]}
+    assert {"similar-teams", "team-analysis"} <= names
@@ -0,0 +1,287 @@
+"""
+Tests for the binary dataset snapshot (app/snapshot.py) and the loaders in
+app/services.py that serve records from it.
+
+Snapshots are written to a pytest ``tmp_path`` from small hand-written
+records, so no real data files are touched.
+"""
+
+import json
+import multiprocessing
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app import recaps, services, snapshot
+
+# ---------------------------------------------------------------------------
+# Shared fixtures
+# ---------------------------------------------------------------------------
+
+
+def _teams() -> list[dict]:
+    """Return raw team records covering every column kind."""
+    return [
+        {
+            "name": "Duke",
+            "wins": 32,
+            "avg_height": 79.25,
+            "tournament_seed": 1,
+            "ranked_wins": None,
+            "conference": "ACC",
+            "players": [
+                {"name": "Caleb Foster", "minutes": 788.0, "position": 0},
+                {"name": "Cooper Flagg", "minutes": 900.5, "position": 2},
+            ],
+            "win_probability_distribution": {"0": 0.1, "6": 0.3},
+            "tags": ["blue", 1],
+            "summaries": ["Duke 75, Texas 60"],
+        },
+        {
+            "name": "Saint Mary's",
+            "wins": 25,
+            "avg_height": 78.0,
+            "tournament_seed": None,
+            "ranked_wins": None,
+            "conference": "WCC — West",
+            "players": [],
+            "win_probability_distribution": {"0": 0.5, "6": 0.0},
+            "tags": None,
+            "summaries": ["Gaels — 70–65 ✓"],
+        },
+        {
+            "name": "Siena",
+            "wins": 20,
+            "avg_height": 77.5,
+            "ranked_wins": None,
+            "conference": "ACC",
+            "players": None,
+            "win_probability_distribution": {"0": 0.9, "6": 0.0},
+            "tags": {"mixed": True},
+        },
+    ]
+
+
+def _entries() -> list[dict]:
+    return [
+        {
+            "team1": {"name": "Duke", "win_probability": 0.8},
+            "team2": {"name": "Siena", "win_probability": 0.2},
+            "year": 2026,
+        },
+    ]
+
+
+def _plain(value):
+    """Convert snapshot views back into plain dicts and lists."""
+    if isinstance(value, Mapping):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, snapshot.ListView)):
+        return [_plain(v) for v in value]
+    return value
+
+
+def _strip(teams: list[dict]) -> list[dict]:
+    return [{k: v for k, v in t.items() if k != "summaries"} for t in teams]
+
+
+@pytest.fixture
+def snap(tmp_path: Path) -> snapshot.Snapshot:
+    """Write and open a snapshot of the fixture records."""
+    entries = _entries()
+    matrix = services.build_h2h_matrix(entries)
+    path = tmp_path / "dataset.snap"
+    snapshot.write_snapshot(
+        path, {"predictions.json": {"size": 1, "mtime_ns": 2}}, _teams(),
+        entries, matrix.names, matrix.probs,
+    )
+    return snapshot.open_snapshot(path)
+
+
+# ---------------------------------------------------------------------------
+# Format round trip
+# ---------------------------------------------------------------------------
+
+
+def test_records_round_trip_exactly(snap: snapshot.Snapshot) -> None:
+    """Every value, null, nested record and list comes back unchanged."""
+    assert [_plain(t) for t in snap.teams] == _strip(_teams())
+    assert [_plain(e) for e in snap.h2h_entries] == _entries()
+
+
+def test_views_behave_like_the_raw_dicts(snap: snapshot.Snapshot) -> None:
+    """Key order, absent keys, .get and list access match the source dicts."""
+    duke, _, siena = snap.teams
+    assert list(duke) == list(_strip(_teams())[0])
+    assert "tournament_seed" not in siena
+    assert siena.get("tournament_seed") is None
+    with pytest.raises(KeyError):
+        siena["tournament_seed"]
+    assert siena["players"] is None
+    assert duke["players"][-1]["minutes"] == 900.5
+    assert isinstance(duke["wins"], int) and isinstance(duke["avg_height"], float)
+    assert sorted(duke["players"], key=lambda p: p["minutes"])[0]["name"] == (
+        "Caleb Foster"
+    )
+
+
+def test_recaps_are_read_from_the_snapshot(snap: snapshot.Snapshot) -> None:
+    """Summaries are moved out of the records into the recap blob."""
+    assert "summaries" not in snap.teams[0]
+    assert snap.recaps.get("saint mary's") == ["Gaels — 70–65 ✓"]
+    assert snap.recaps.get("Siena") == []
+
+
+def test_h2h_matrix_is_mapped_read_only(snap: snapshot.Snapshot) -> None:
+    """The stored matrix matches a freshly built one and cannot be written."""
+    built = services.build_h2h_matrix(_entries())
+    assert snap.h2h_names == built.names
+    assert np.array_equal(snap.h2h_probs, built.probs, equal_nan=True)
+    assert not snap.h2h_probs.flags.writeable
+
+
+def test_other_version_is_rejected(tmp_path: Path) -> None:
+    """A snapshot written by another format version is refused."""
+    path = tmp_path / "dataset.snap"
+    snapshot.write_snapshot(path, {}, _teams())
+    data = bytearray(path.read_bytes())
+    data[8:12] = (snapshot.SNAPSHOT_VERSION + 1).to_bytes(4, "little")
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError, match="version"):
+        snapshot.open_snapshot(path)
+
+
+def test_non_snapshot_file_is_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "dataset.snap"
+    path.write_bytes(b"{}" * 16)
+
+    with pytest.raises(ValueError):
+        snapshot.open_snapshot(path)
+
+
+# ---------------------------------------------------------------------------
+# Service loaders
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def data_dirs(tmp_path: Path):
+    """Point the service loaders at temp prediction and compiled dirs."""
+    predictions = tmp_path / "predictions"
+    predictions.mkdir()
+    (predictions / "predictions.json").write_text(
+        json.dumps(_teams()), encoding="utf-8"
+    )
+    (predictions / "h2h-predictions.json").write_text(
+        json.dumps(_entries()), encoding="utf-8"
+    )
+    compiled = tmp_path / "compiled"
+    store = recaps.get_active_store()
+    with patch("app.services.PREDICTIONS_DIR", predictions), \
+         patch("app.services.COMPILED_DIR", compiled), \
+         patch(
+             "app.services.H2H_PREDICTIONS_FILE",
+             predictions / "h2h-predictions.json",
+         ), \
+         patch("app.services._active_snapshot", None), \
+         patch("app.services._h2h_matrix_cache", None):
+        yield predictions, compiled
+    recaps.set_active_store(store)
+
+
+def test_loader_compiles_and_serves_snapshot(data_dirs) -> None:
+    """The first load compiles the snapshot; records and matrix come from it."""
+    _, compiled = data_dirs
+    snap = services.load_dataset_snapshot()
+
+    assert (compiled / snapshot.SNAPSHOT_FILENAME).exists()
+    assert services.load_dataset_snapshot() is snap
+    assert recaps.get_active_store() is snap.recaps
+
+    with patch("app.services.load_h2h_predictions", return_value=snap.h2h_entries):
+        matrix = services.get_h2h_matrix()
+    assert matrix.probs is snap.h2h_probs
+    assert matrix.pair("duke", "SIENA") == (0, 1)
+
+
+def test_loader_recompiles_when_source_changes(data_dirs) -> None:
+    """Editing predictions.json makes the mapped snapshot stale."""
+    predictions, _ = data_dirs
+    first = services.load_dataset_snapshot()
+
+    teams = _teams()
+    teams[0]["wins"] = 33
+    source = predictions / "predictions.json"
+    source.write_text(json.dumps(teams), encoding="utf-8")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = services.load_dataset_snapshot()
+    assert second is not first
+    assert second.teams[0]["wins"] == 33
+
+
+def test_loader_falls_back_when_snapshot_cannot_be_written(data_dirs) -> None:
+    """An unwritable compiled dir yields None so callers parse the JSON."""
+    with patch("app.snapshot.write_snapshot", side_effect=OSError("read-only")):
+        assert services.load_dataset_snapshot() is None
+
+
+# ---------------------------------------------------------------------------
+# Concurrent compiles
+# ---------------------------------------------------------------------------
+
+
+def _compile_concurrently(
+    predictions: Path, compiled: Path, barrier, log: Path
+) -> None:
+    """Worker process body for test_concurrent_processes_compile_safely."""
+    services.PREDICTIONS_DIR = predictions
+    services.COMPILED_DIR = compiled
+    services.H2H_PREDICTIONS_FILE = predictions / "h2h-predictions.json"
+    compile_snapshot = services.compile_dataset_snapshot
+
+    def logged(path):
+        with open(log, "a", encoding="utf-8") as fh:
+            fh.write(f"{os.getpid()}\n")
+        return compile_snapshot(path)
+
+    services.compile_dataset_snapshot = logged
+    barrier.wait()
+    assert len(services.load_dataset_snapshot().teams) == 3
+
+    # Both processes keep rewriting and reopening the same file.
+    teams = _teams() * 500
+    path = compiled / "stress.snap"
+    for _ in range(40):
+        snapshot.write_snapshot(path, {}, teams)
+        snap = snapshot.open_snapshot(path)
+        assert len(snap.teams) == len(teams)
+        assert snap.teams[-1]["name"] == "Siena"
+
+
+def test_concurrent_processes_compile_safely(data_dirs, tmp_path: Path) -> None:
+    """Two processes loading at once compile once and never see a torn file."""
+    predictions, compiled = data_dirs
+    log = tmp_path / "compiles.log"
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(2)
+    workers = [
+        context.Process(
+            target=_compile_concurrently, args=(predictions, compiled, barrier, log)
+        )
+        for _ in range(2)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(60)
+
+    assert [worker.exitcode for worker in workers] == [0, 0]
+    assert len(log.read_text().splitlines()) == 1
+    assert not list(compiled.glob("*.tmp"))
@@ -0,0 +1,230 @@
+"""
+Tests for the pool standings engine (app/standings.py) and POST /pools/standings.
+
+The engine is compared with a brute-force ranking of random rosters.  Service,
+endpoint and command-line tests run on a synthetic 68-team bracket, so no
+real data files are needed.
+"""
+
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app import standings
+from app.bracket import BracketEngine, BracketLayout
+from app.main import app
+from app.services import get_simulated_wins
+from app.simulation import TournamentSimulator
+from app.standings import pool_standings
+
+# ---------------------------------------------------------------------------
+# Shared fixtures
+# ---------------------------------------------------------------------------
+
+
+def _engine() -> BracketEngine:
+    """A 68-team bracket (First Four in slots 5, 21, 40, 63) with random odds."""
+    names, slots = [], []
+    for slot in range(64):
+        names.append(f"T{slot}")
+        slots.append(slot)
+        if slot in (5, 21, 40, 63):
+            names.append(f"T{slot}b")
+            slots.append(slot)
+    rng = np.random.default_rng(5)
+    upper = np.triu(rng.uniform(0.1, 0.9, (68, 68)), 1)
+    probs = upper + np.tril(1.0 - upper.T, -1)
+    return BracketEngine(BracketLayout(names, slots), probs)
+
+
+def _wins(n: int = 2_000) -> np.ndarray:
+    simulator = TournamentSimulator(_engine())
+    return simulator.wins(simulator.sample(n, np.random.default_rng(0)))
+
+
+def _rosters(m: int, seed: int = 0) -> np.ndarray:
+    """Random 8-team rosters as an (m, 68) incidence matrix."""
+    rng = np.random.default_rng(seed)
+    incidence = np.zeros((m, 68))
+    for row in incidence:
+        row[rng.choice(68, 8, replace=False)] = 1
+    return incidence
+
+
+def _brute_force(incidence, pools, wins, places):
+    scores = incidence @ wins.T
+    ranks = np.empty_like(scores)
+    for i in range(len(scores)):
+        rivals = scores[pools == pools[i]]
+        ranks[i] = 1 + (rivals > scores[i]).sum(axis=0)
+    probs = np.stack([(ranks == p).mean(axis=1) for p in range(1, places + 1)], 1)
+    return probs, ranks.mean(axis=1)
+
+
+@pytest.fixture
+async def client() -> AsyncClient:
+    """Yield an async HTTPX client wired directly to the FastAPI app."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as c:
+        yield c
+
+
+@pytest.fixture
+def bracket():
+    """Serve the synthetic bracket and resolve every name to itself."""
+    engine = _engine()
+
+    def find(name: str):
+        return {"name": name} if name in engine.layout.names else None
+
+    with patch("app.services.get_bracket_engine", return_value=engine), \
+         patch("app.services.find_team", side_effect=find), \
+         patch("app.services.POOL_SIMULATIONS", 5_000), \
+         patch.dict("app.services._simulated_wins", clear=True):
+        yield engine
+
+
+# ---------------------------------------------------------------------------
+# pool_standings
+# ---------------------------------------------------------------------------
+
+
+def test_histogram_ranks_match_brute_force() -> None:
+    incidence, wins = _rosters(60), _wins()
+    pools = np.random.default_rng(1).integers(0, 2, 60)
+    # Several chunks of tournaments.
+    with patch("app.standings.CHUNK_CELLS", 60 * 150 * 3), \
+         patch("app.standings._ahead_pairwise") as pairwise:
+        probs, rank = pool_standings(incidence, pools, wins, places=4)
+    pairwise.assert_not_called()
+
+    expected_probs, expected_rank = _brute_force(incidence, pools, wins, 4)
+    assert np.allclose(probs, expected_probs)
+    assert np.allclose(rank, expected_rank)
+
+
+def test_pairwise_ranks_match_brute_force() -> None:
+    """Many small (and uneven) pools take the pairwise path."""
+    incidence, wins = _rosters(60, seed=2), _wins()
+    pools = np.random.default_rng(3).integers(0, 25, 60)
+    with patch("app.standings.CHUNK_CELLS", 25 * 5 * 100), \
+         patch("app.standings._ahead_histogram") as histogram:
+        probs, rank = pool_standings(incidence, pools, wins, places=3)
+    histogram.assert_not_called()
+
+    expected_probs, expected_rank = _brute_force(incidence, pools, wins, 3)
+    assert np.allclose(probs, expected_probs)
+    assert np.allclose(rank, expected_rank)
+
+
+def test_tied_rosters_share_the_better_place() -> None:
+    incidence = _rosters(3)
+    incidence[1] = incidence[0]
+    probs, rank = pool_standings(incidence, np.zeros(3), _wins(), places=3)
+
+    assert np.array_equal(probs[0], probs[1]) and rank[0] == rank[1]
+    # A tie for first leaves nobody in second.
+    assert probs[0, 0] + probs[2, 0] >= 1.0
+    assert probs[:, 0].sum() > 1.0
+
+
+def test_pools_are_ranked_separately() -> None:
+    incidence, wins = _rosters(8), _wins()
+    alone, _ = pool_standings(incidence[:4], np.zeros(4), wins)
+    together, _ = pool_standings(incidence, np.repeat([0, 1], 4), wins)
+    assert np.array_equal(alone, together[:4])
+
+
+# ---------------------------------------------------------------------------
+# POST /pools/standings
+# ---------------------------------------------------------------------------
+
+
+def _roster(pool: str, manager: str, seed: int) -> dict:
+    teams = np.random.default_rng(seed).choice(_engine().layout.names, 8, False)
+    return {"pool": pool, "manager": manager, "teams": teams.tolist()}
+
+
+async def test_standings_endpoint(client: AsyncClient, bracket) -> None:
+    rosters = [_roster("office", f"m{i}", i) for i in range(5)]
+    rosters += [_roster("family", f"f{i}", 10 + i) for i in range(3)]
+    rosters[2]["teams"][0] = "Unknown Team"
+    response = await client.post("/api/pools/standings", json={
+        "rosters": rosters, "places": 2, "simulations": 4_000,
+    })
+    assert response.status_code == 200
+    body = response.json()
+
+    assert body["simulations"] == 4_000
+    assert body["unresolved_teams"] == ["Unknown Team"]
+    entries = body["rosters"]
+    assert [e["manager"] for e in entries] == [r["manager"] for r in rosters]
+    assert [e["pool_size"] for e in entries] == [5] * 5 + [3] * 3
+    assert entries[2]["teams"] == 7 and entries[0]["teams"] == 8
+    for pool in ("office", "family"):
+        rows = [e for e in entries if e["pool"] == pool]
+        assert all(len(e["place_probabilities"]) == 2 for e in rows)
+        # Someone finishes first in every tournament.
+        assert sum(e["place_probabilities"][0] for e in rows) >= 1.0 - 1e-5
+        assert sum(e["expected_rank"] for e in rows) <= sum(
+            range(1, len(rows) + 1)
+        ) + 1e-3
+
+
+async def test_standings_match_the_engine(client: AsyncClient, bracket) -> None:
+    rosters = [_roster("default", f"m{i}", i) for i in range(4)]
+    response = await client.post("/api/pools/standings", json={"rosters": rosters})
+
+    wins = get_simulated_wins()
+    names = bracket.layout.names
+    incidence = np.zeros((4, 68))
+    for i, roster in enumerate(rosters):
+        incidence[i, [names.index(t) for t in roster["teams"]]] = 1
+    probs, rank = pool_standings(incidence, np.zeros(4), wins)
+
+    entries = response.json()["rosters"]
+    assert response.json()["simulations"] == 5_000
+    assert np.allclose([e["place_probabilities"] for e in entries], probs, atol=1e-6)
+    assert np.allclose([e["expected_rank"] for e in entries], rank, atol=1e-4)
+
+
+async def test_standings_validate_places(client: AsyncClient) -> None:
+    response = await client.post("/api/pools/standings", json={
+        "rosters": [{"manager": "a", "teams": []}], "places": 0,
+    })
+    assert response.status_code == 422
+
+
+async def test_standings_without_bracket_returns_503(client: AsyncClient) -> None:
+    with patch("app.services.load_bracket_data",
+               side_effect=FileNotFoundError("most-likely-bracket.json")), \
+         patch.dict("app.services._simulated_wins", clear=True):
+        response = await client.post("/api/pools/standings", json={
+            "rosters": [{"manager": "a", "teams": ["Duke"]}],
+        })
+    assert response.status_code == 503
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+def test_command_line_writes_standings(tmp_path, capsys, bracket) -> None:
+    source = tmp_path / "rosters.json"
+    source.write_text(json.dumps(
+        {"rosters": [_roster("default", f"m{i}", i) for i in range(3)]}
+    ))
+    output = tmp_path / "standings.json"
+    assert standings.main(
+        [str(source), "-o", str(output), "--simulations", "1000", "--places", "2"]
+    ) == 0
+
+    body = json.loads(output.read_text())
+    assert body["simulations"] == 1_000 and len(body["rosters"]) == 3
+    assert len(body["rosters"][0]["place_probabilities"]) == 2
+    assert "3 rosters × 1,000 tournaments" in capsys.readouterr().err
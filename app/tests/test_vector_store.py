@@ -0,0 +1,268 @@
+"""
+Tests for the shared ChromaDB handle and circuit breaker (app/vector_store.py)
+and their use in get_similar_teams.
+
+``chromadb.HttpClient`` is patched throughout, so no ChromaDB server is needed.
+A fake clock drives the reconnect backoff deterministically.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from app.services import get_similar_teams
+from app.vector_store import CircuitBreaker, VectorStore, VectorStoreUnavailable
+
+# ---------------------------------------------------------------------------
+# Shared fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def _fresh_breaker():
+    """Give each test a closed breaker and no last known good results."""
+    with patch("app.services.chroma_breaker", CircuitBreaker("test")), \
+         patch.dict("app.services._last_good_similar", clear=True), \
+         patch("app.services._similar_table", {}):
+        yield
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    """Return a fresh fake clock."""
+    return _Clock()
+
+
+@pytest.fixture
+def store(clock: _Clock) -> VectorStore:
+    """Return a VectorStore with a 1s initial / 4s max backoff."""
+    return VectorStore("chroma", 8000, "teams", backoff_initial=1.0,
+                       backoff_max=4.0, clock=clock)
+
+
+def _neighbours() -> dict:
+    """Return a ChromaDB query result with one current and three past teams."""
+    metas = [
+        {"name": "Duke", "year": 2026, "tournament_seed": 1, "tournament_wins": 0},
+        {"name": "UConn", "year": 2024, "tournament_seed": 1, "tournament_wins": 6},
+        {"name": "Baylor", "year": 2021, "tournament_seed": 1, "tournament_wins": 6},
+        {"name": "Iowa", "year": 2019, "tournament_seed": 10, "tournament_wins": 1},
+    ]
+    return {"metadatas": [metas], "distances": [[0.0, 0.1, 0.2, 0.3]]}
+
+
+# ---------------------------------------------------------------------------
+# VectorStore
+# ---------------------------------------------------------------------------
+
+
+def test_collection_is_opened_once_and_reused(store: VectorStore) -> None:
+    """Repeated calls share one client and one collection handle."""
+    with patch("app.vector_store.chromadb.HttpClient") as http_client:
+        first = store.collection()
+        second = store.collection()
+    assert first is second
+    http_client.assert_called_once_with(host="chroma", port=8000)
+    http_client.return_value.get_collection.assert_called_once_with(name="teams")
+
+
+def test_failed_connect_backs_off(store: VectorStore, clock: _Clock) -> None:
+    """During the backoff window calls fail without touching the network."""
+    with patch("app.vector_store.chromadb.HttpClient",
+               side_effect=ConnectionError) as http_client:
+        with pytest.raises(VectorStoreUnavailable):
+            store.collection()
+        with pytest.raises(VectorStoreUnavailable):
+            store.collection()
+        assert http_client.call_count == 1
+
+        clock.now += 1.0
+        with pytest.raises(VectorStoreUnavailable):
+            store.collection()
+        assert http_client.call_count == 2
+
+
+def test_backoff_doubles_up_to_max(store: VectorStore, clock: _Clock) -> None:
+    """Each failed reconnect doubles the wait, capped at backoff_max."""
+    with patch("app.vector_store.chromadb.HttpClient", side_effect=ConnectionError):
+        waits = []
+        for _ in range(4):
+            store.connect()
+            waits.append(store._retry_at - clock.now)
+    assert waits == [1.0, 2.0, 4.0, 4.0]
+
+
+def test_reconnects_after_backoff(store: VectorStore, clock: _Clock) -> None:
+    """Once ChromaDB is back, the next call after the window reconnects."""
+    with patch("app.vector_store.chromadb.HttpClient", side_effect=ConnectionError):
+        assert store.connect() is False
+    clock.now += 1.0
+    with patch("app.vector_store.chromadb.HttpClient"):
+        assert store.collection() is not None
+    assert store.connected
+
+
+def test_invalidate_forces_reconnect(store: VectorStore) -> None:
+    """invalidate() closes the client; the next call opens a new one."""
+    with patch("app.vector_store.chromadb.HttpClient") as http_client:
+        store.collection()
+        store.invalidate()
+        assert not store.connected
+        http_client.return_value.close.assert_called_once()
+        store.collection()
+    assert http_client.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# CircuitBreaker
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def breaker(clock: _Clock) -> CircuitBreaker:
+    """Return a breaker that opens after 2 failures for 10 seconds."""
+    return CircuitBreaker("test", failure_threshold=2, reset_timeout=10.0,
+                          clock=clock)
+
+
+def test_breaker_opens_after_threshold(breaker: CircuitBreaker) -> None:
+    """Consecutive failures up to the threshold open the breaker."""
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.allow() is False
+    assert breaker.rejected == 1
+
+
+def test_breaker_success_resets_failure_count(breaker: CircuitBreaker) -> None:
+    """Only consecutive failures count towards the threshold."""
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_breaker_half_open_allows_one_trial(
+    breaker: CircuitBreaker, clock: _Clock
+) -> None:
+    """After the reset timeout exactly one trial call is let through."""
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now += 10.0
+    assert breaker.state == "half_open"
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow() is True
+
+
+def test_breaker_failed_trial_reopens(
+    breaker: CircuitBreaker, clock: _Clock
+) -> None:
+    """A failed half-open trial re-opens the breaker for another timeout."""
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now += 10.0
+    assert breaker.allow() is True
+    breaker.record_failure()
+    assert breaker.state == "open"
+    transitions = [(t["from_state"], t["to_state"]) for t in breaker.transitions]
+    assert transitions == [
+        ("closed", "open"), ("open", "half_open"), ("half_open", "open"),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# get_similar_teams
+# ---------------------------------------------------------------------------
+
+
+async def test_similar_teams_uses_shared_handle_without_count() -> None:
+    """The request path issues only get + query on the shared collection."""
+    collection = MagicMock()
+    collection.get.return_value = {"ids": ["duke_2026"], "embeddings": [[0.1, 0.2]]}
+    collection.query.return_value = _neighbours()
+    with patch("app.services.vector_store.collection", return_value=collection):
+        similar = await get_similar_teams("Duke")
+
+    assert [t.name for t in similar] == ["UConn", "Baylor", "Iowa"]
+    assert similar[0].similarity == 0.9
+    collection.count.assert_not_called()
+
+
+async def test_similar_teams_unavailable_returns_empty() -> None:
+    """An unavailable store degrades to an empty list."""
+    with patch("app.services.vector_store.collection",
+               side_effect=VectorStoreUnavailable("down")), \
+         patch("app.services.SIMILARITY_FALLBACK", False):
+        assert await get_similar_teams("Duke") == []
+
+
+async def test_similar_teams_query_error_invalidates_handle() -> None:
+    """A failed query drops the shared handle so the next call reconnects."""
+    collection = MagicMock()
+    collection.get.side_effect = ConnectionError
+    with patch("app.services.vector_store.collection", return_value=collection), \
+         patch("app.services.vector_store.invalidate") as invalidate, \
+         patch("app.services.SIMILARITY_FALLBACK", False):
+        assert await get_similar_teams("Duke") == []
+    invalidate.assert_called_once()
+
+
+async def test_open_breaker_skips_chroma_and_serves_stale() -> None:
+    """With the breaker open the last good result is served, flagged stale."""
+    collection = MagicMock()
+    collection.get.return_value = {"ids": ["duke_2026"], "embeddings": [[0.1, 0.2]]}
+    collection.query.return_value = _neighbours()
+    with patch("app.services.vector_store.collection", return_value=collection), \
+         patch("app.services.SIMILARITY_FALLBACK", False):
+        fresh = await get_similar_teams("Duke")
+
+    breaker = CircuitBreaker("test", failure_threshold=1)
+    breaker.record_failure()
+    with patch("app.services.chroma_breaker", breaker), \
+         patch("app.services.vector_store.collection") as handle, \
+         patch("app.services.SIMILARITY_FALLBACK", False):
+        stale = await get_similar_teams("Duke")
+
+    handle.assert_not_called()
+    assert [t.name for t in stale] == [t.name for t in fresh]
+    assert all(t.stale for t in stale)
+    assert not any(t.stale for t in fresh)
+
+
+async def test_failures_are_recorded_by_breaker() -> None:
+    """Each failed lookup counts towards opening the breaker."""
+    breaker = CircuitBreaker("test", failure_threshold=2)
+    with patch("app.services.chroma_breaker", breaker), \
+         patch("app.services.vector_store.collection",
+               side_effect=VectorStoreUnavailable("down")) as handle, \
+         patch("app.services.SIMILARITY_FALLBACK", False):
+        for _ in range(3):
+            assert await get_similar_teams("Duke") == []
+    assert breaker.state == "open"
+    assert handle.call_count == 2
+
+
+async def test_metrics_reports_breaker_state() -> None:
+    """GET /api/metrics exposes the breaker state and transitions."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        body = (await client.get("/api/metrics")).json()
+    assert body["chroma_breaker"]["state"] in ("closed", "open", "half_open")
+    assert isinstance(body["chroma_breaker"]["transitions"], list)
@@ -0,0 +1,303 @@
+"""
+Long-lived ChromaDB connection shared by every similar-team lookup.
+
+Creating a ``chromadb.HttpClient`` validates the tenant and database with the
+server, and ``get_collection`` is another round-trip, so doing both per
+request roughly triples the cost of a similarity query.  :class:`VectorStore`
+holds one client (whose HTTP session keeps its connections alive) and one
+collection handle for the life of the process.
+
+The handle is opened in the FastAPI ``lifespan`` and re-opened lazily: when a
+query fails, the caller drops the handle with :meth:`VectorStore.invalidate`
+and the next request reconnects.  Failed reconnects back off exponentially,
+so while ChromaDB is down requests fail immediately instead of each paying
+for a connection attempt.
+
+Queries are additionally guarded by a :class:`CircuitBreaker`: after a run of
+consecutive failures it opens and callers skip ChromaDB entirely (serving a
+fallback) until a single trial query succeeds again.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+import chromadb
+
+from app.config import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_TIMEOUT,
+    CHROMA_BACKOFF_INITIAL,
+    CHROMA_BACKOFF_MAX,
+    CHROMA_COLLECTION,
+    CHROMA_HOST,
+    CHROMA_PORT,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class VectorStoreUnavailable(RuntimeError):
+    """Raised when ChromaDB cannot be reached (or is in a reconnect backoff)."""
+
+
+class VectorStore:
+    """Process-wide ChromaDB client and collection handle with lazy reconnect.
+
+    Args:
+        host: ChromaDB hostname.
+        port: ChromaDB HTTP port.
+        collection_name: Collection holding the team vectors.
+        backoff_initial: Seconds to wait after the first failed connect.
+        backoff_max: Upper bound on the wait between connect attempts.
+        clock: Monotonic time source (overridable in tests).
+    """
+
+    def __init__(
+        self,
+        host: str = CHROMA_HOST,
+        port: int = CHROMA_PORT,
+        collection_name: str = CHROMA_COLLECTION,
+        backoff_initial: float = CHROMA_BACKOFF_INITIAL,
+        backoff_max: float = CHROMA_BACKOFF_MAX,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.collection_name = collection_name
+        self._backoff_initial = backoff_initial
+        self._backoff_max = backoff_max
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._client: Optional[Any] = None
+        self._collection: Optional[Any] = None
+        self._delay = 0.0
+        self._retry_at = 0.0
+
+    @property
+    def connected(self) -> bool:
+        """True while a collection handle is held."""
+        return self._collection is not None
+
+    def connect(self) -> bool:
+        """Open the client and collection now, ignoring any backoff window.
+
+        Returns:
+            True if the collection handle is ready, False if ChromaDB could
+            not be reached (a backoff window is then started).
+        """
+        with self._lock:
+            return self._connect_locked()
+
+    def collection(self) -> Any:
+        """Return the shared collection handle, reconnecting if necessary.
+
+        Returns:
+            The ChromaDB collection object.
+
+        Raises:
+            VectorStoreUnavailable: If ChromaDB is unreachable, or a previous
+                connect failed and its backoff window has not yet elapsed.
+        """
+        collection = self._collection
+        if collection is not None:
+            return collection
+
+        with self._lock:
+            # Another thread may have reconnected while we waited for the lock.
+            if self._collection is not None:
+                return self._collection
+            if self._clock() < self._retry_at:
+                raise VectorStoreUnavailable(
+                    f"ChromaDB at {self.host}:{self.port} unavailable — "
+                    f"next reconnect in {self._retry_at - self._clock():.1f}s"
+                )
+            if not self._connect_locked():
+                raise VectorStoreUnavailable(
+                    f"Could not connect to ChromaDB at {self.host}:{self.port}"
+                )
+            return self._collection
+
+    def invalidate(self) -> None:
+        """Drop the current handle so the next call reconnects.
+
+        Called after a query fails, since the server may have restarted and
+        the collection (or its ID) may no longer be valid.
+        """
+        with self._lock:
+            if self._collection is not None:
+                logger.warning("Dropping ChromaDB handle — will reconnect lazily")
+            self._close_locked()
+
+    def close(self) -> None:
+        """Release the client and its pooled connections."""
+        with self._lock:
+            self._close_locked()
+            self._delay = 0.0
+            self._retry_at = 0.0
+
+    # -- internals ------------------------------------------------------------
+
+    def _connect_locked(self) -> bool:
+        """Open client and collection; caller must hold ``_lock``."""
+        self._close_locked()
+        try:
+            client = chromadb.HttpClient(host=self.host, port=self.port)
+            collection = client.get_collection(name=self.collection_name)
+        except Exception:
+            self._delay = min(
+                self._backoff_max, self._delay * 2 or self._backoff_initial
+            )
+            self._retry_at = self._clock() + self._delay
+            logger.warning(
+                "ChromaDB connect to %s:%s failed — retrying in %.1fs",
+                self.host, self.port, self._delay, exc_info=True,
+            )
+            return False
+
+        self._client = client
+        self._collection = collection
+        self._delay = 0.0
+        self._retry_at = 0.0
+        logger.info(
+            "ChromaDB connected at %s:%s — collection '%s'",
+            self.host, self.port, self.collection_name,
+        )
+        return True
+
+    def _close_locked(self) -> None:
+        """Forget the current handles; caller must hold ``_lock``."""
+        client, self._client, self._collection = self._client, None, None
+        if client is not None:
+            try:
+                client.close()
+            except Exception:
+                logger.debug("Ignoring error closing ChromaDB client", exc_info=True)
+
+
+class CircuitBreaker:
+    """Closed / open / half-open circuit breaker for a flaky dependency.
+
+    * **closed** — calls are allowed; consecutive failures are counted and
+      reaching ``failure_threshold`` opens the breaker.
+    * **open** — calls are rejected without being attempted until
+      ``reset_timeout`` seconds have passed.
+    * **half-open** — one trial call is allowed; its success closes the
+      breaker and its failure re-opens it.
+
+    Callers ask :meth:`allow` before each call and report the outcome with
+    :meth:`record_success` or :meth:`record_failure`.
+
+    Args:
+        name: Name used in logs and metrics.
+        failure_threshold: Consecutive failures that open the breaker.
+        reset_timeout: Seconds to stay open before allowing a trial call.
+        clock: Monotonic time source (overridable in tests).
+
+    Attributes:
+        rejected: Calls refused while open (or while a trial was in flight).
+        transitions: The most recent state changes, oldest first.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.rejected = 0
+        self.transitions: deque[dict] = deque(maxlen=20)
+
+    @property
+    def state(self) -> str:
+        """Current state, moving open → half-open once the timeout elapses."""
+        with self._lock:
+            self._refresh_locked()
+            return self._state
+
+    def allow(self) -> bool:
+        """Return True if a call may be attempted now."""
+        with self._lock:
+            self._refresh_locked()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        """Report a successful call; closes a half-open breaker."""
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            if self._state != self.CLOSED:
+                self._transition_locked(self.CLOSED)
+
+    def record_failure(self) -> None:
+        """Report a failed call; may open the breaker."""
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED
+                and self._failures >= self.failure_threshold
+            ):
+                self._opened_at = self._clock()
+                self._transition_locked(self.OPEN)
+
+    def stats(self) -> dict:
+        """Return the state, counters and recent transitions for metrics."""
+        with self._lock:
+            self._refresh_locked()
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "rejected": self.rejected,
+                "transitions": list(self.transitions),
+            }
+
+    # -- internals ------------------------------------------------------------
+
+    def _refresh_locked(self) -> None:
+        """Move open → half-open once the reset timeout has elapsed."""
+        if (
+            self._state == self.OPEN
+            and self._clock() - self._opened_at >= self.reset_timeout
+        ):
+            self._transition_locked(self.HALF_OPEN)
+
+    def _transition_locked(self, new_state: str) -> None:
+        """Record and log a state change; caller must hold ``_lock``."""
+        old_state, self._state = self._state, new_state
+        self.transitions.append(
+            {"at": time.time(), "from_state": old_state, "to_state": new_state}
+        )
+        logger.warning(
+            "Circuit breaker '%s': %s → %s (consecutive failures: %d)",
+            self.name, old_state, new_state, self._failures,
+        )
+
+
+# Process-wide store used by app.services.get_similar_teams.
+vector_store = VectorStore()
+
+# Breaker guarding every ChromaDB similarity query.
+chroma_breaker = CircuitBreaker("chromadb")
@@ -84,6 +84,28 @@ export async function fetchH2H(team1Name, team2Name) {
   return data;
 }
 
+// Fetches head-to-head win probabilities for many matchups in one request.
+// Accepts an array of [team1Name, team2Name] pairs and returns an array of
+// H2HBatchResult objects in the same order.  Each result has either a
+// `prediction` (an H2HResponse whose team1 is the pair's first name) or an
+// `error` string when the pair could not be resolved.
+// Throws only if the request itself fails.
+export async function fetchH2HBatch(pairs) {
+  const res = await fetch(`${API_BASE}/head-to-head/batch`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ pairs: pairs.map(([team1, team2]) => ({ team1, team2 })) }),
+  });
+  if (!res.ok) {
+    console.error(`[API] fetchH2HBatch failed: HTTP ${res.status}`);
+    throw new Error(`Failed to fetch H2H batch: ${res.status}`);
+  }
+  const data = await res.json();
+  const missing = data.results.filter(r => r.prediction === null).length;
+  console.log(`[API] fetchH2HBatch — ${data.results.length} pair(s), ${missing} unresolved`);
+  return data.results;
+}
+
 // Fetches the wins model evaluation from the backend.
 // Returns a WinsEvaluationResponse with per-team expected vs actual wins grouped
 // by region and aggregate summary metrics (MAE, bias, within-one percentage).
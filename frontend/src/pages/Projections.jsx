@@ -8,7 +8,7 @@
 import { useState, useEffect } from 'react';
 import NavBar from '../components/NavBar';
 import TeamPopup from '../components/TeamPopup';
-import { fetchProjections, fetchH2H } from '../api/teamApi';
+import { fetchProjections, fetchH2HBatch } from '../api/teamApi';
 import { BRACKET_2026, FIRST_FOUR_2026 } from '../data/bracketData';
 import { probColor } from '../utils/colors';
 import './Projections.css';
@@ -235,30 +235,29 @@ export default function Projections() {
 
     const candidates = buildUpsetCandidates(teamMap);
 
-    // Fetch h2h win probabilities for all candidates in parallel.
-    // fetchH2H(team1, team2) always returns team1 = the first argument.
-    Promise.allSettled(
-      candidates.map(c =>
-        fetchH2H(c.teamName, c.opponentName).then(data => ({
-          team: teamMap[c.teamName],
-          opponentName: c.opponentName,
-          region: c.region,
-          winProb: data.team1.win_probability,
-        }))
-      )
-    ).then(results => {
-      // Keep only teams with >= 40% win probability, sorted descending.
-      const upsetList = results
-        .filter(r => r.status === 'fulfilled' && r.value.winProb >= 0.4)
-        .map(r => r.value)
-        .sort((a, b) => b.winProb - a.winProb);
-
-      setUpsets(upsetList);
-    }).catch(() => {
-      // Fallback: if the .then() callback itself throws, ensure upsets is
-      // set to an empty array so the section stops showing "Loading…".
-      setUpsets([]);
-    });
+    // Fetch h2h win probabilities for all candidates in a single batch request.
+    // Each result's prediction.team1 is always the pair's first name.
+    fetchH2HBatch(candidates.map(c => [c.teamName, c.opponentName]))
+      .then(results => {
+        // Keep only teams with >= 40% win probability, sorted descending.
+        const upsetList = results
+          .map((r, i) => ({ result: r, candidate: candidates[i] }))
+          .filter(({ result }) => result.prediction && result.prediction.team1.win_probability >= 0.4)
+          .map(({ result, candidate }) => ({
+            team: teamMap[candidate.teamName],
+            opponentName: candidate.opponentName,
+            region: candidate.region,
+            winProb: result.prediction.team1.win_probability,
+          }))
+          .sort((a, b) => b.winProb - a.winProb);
+
+        setUpsets(upsetList);
+      })
+      .catch(() => {
+        // Fallback: if the batch request fails, set upsets to an empty array
+        // so the section stops showing "Loading…".
+        setUpsets([]);
+      });
   }, [rankings]);
 
   return (
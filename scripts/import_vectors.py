@@ -18,24 +18,88 @@ Usage
     # Delete all existing vectors first, then import fresh:
     uv run scripts/import_vectors.py --reset
 
+    # Tune concurrency and the latency the batch sizer aims for:
+    uv run scripts/import_vectors.py --workers 8 --target-latency 0.5
+
+    # Send only added/changed records and delete IDs no longer in the export:
+    uv run scripts/import_vectors.py --diff
+
 The script is idempotent by default: re-running it will upsert records that
 already exist rather than duplicating them.  Pass --reset to drop the entire
 collection before importing so that stale records from previous runs are removed.
+
+Batches are upserted by a bounded pool of worker threads.  The batch size
+adapts to observed latency (grows additively while batches finish under
+--target-latency, halves when they are slow or fail).  Every confirmed batch
+is recorded in a checkpoint file, so re-running after a failure — even one
+that followed --reset — skips the records already imported instead of
+starting over.  The checkpoint is deleted once the import completes.
+
+After every successful import a manifest of per-record content hashes
+(embedding, metadata and document) is written next to the checkpoint.  With
+--diff, the export is compared against that manifest and the IDs actually in
+the collection: only added or changed records are upserted and IDs missing
+from the export are deleted, so a re-import after touching one season sends
+a few dozen records instead of the whole history — no --reset needed.
+
+The export is never loaded whole: its four parallel arrays are streamed
+through separate file handles and validated record by record (array lengths,
+duplicate IDs, embedding dimensions), so peak memory is bounded by the
+batches in flight rather than by the size of the file.
 """
 
 import argparse
+import hashlib
 import json
+import os
+import re
 import sys
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
 
 import chromadb
 
 # ── Constants ─────────────────────────────────────────────────────────────────
 
-# Number of documents sent to ChromaDB per HTTP request.  Keeping this below
-# ~500 avoids hitting ChromaDB's default request-size limits.
+# Initial number of documents sent to ChromaDB per HTTP request.  Keeping this
+# below ~500 avoids hitting ChromaDB's default request-size limits.
 BATCH_SIZE = 200
 
+# Bounds for the adaptive batch size.
+MIN_BATCH_SIZE = 25
+MAX_BATCH_SIZE = 500
+
+# Records added to the batch size after each batch that beats the target latency.
+BATCH_SIZE_STEP = 50
+
+# Per-batch latency (seconds) the adaptive batch sizer aims for.
+TARGET_LATENCY = 1.0
+
+# Concurrent upsert requests.
+WORKERS = 4
+
+# Attempts per batch before the import gives up (the checkpoint is kept).
+MAX_ATTEMPTS = 4
+
+# Default checkpoint file (relative to project root).
+DEFAULT_CHECKPOINT_FILE = "data/vector_db/import_checkpoint.json"
+
+# Default content-hash manifest used by --diff (relative to project root).
+DEFAULT_MANIFEST_FILE = "data/vector_db/import_manifest.json"
+
+# Page size for listing IDs already in the collection, and batch size for
+# deleting IDs that are no longer in the export.
+ID_PAGE_SIZE = 1000
+
+# Characters read from the export per chunk by the streaming reader.
+READ_CHUNK_SIZE = 1 << 16
+
+# Keys every export must contain, in the order records are assembled.
+EXPORT_KEYS = ("ids", "embeddings", "metadatas", "documents")
+
 # Default ChromaDB collection name used by the backend.
 DEFAULT_COLLECTION = "ncaa_teams"
 
@@ -46,13 +110,278 @@ DEFAULT_JSON_FILE = (
 )
 
 
+# ── Streaming export reader ───────────────────────────────────────────────────
+
+# One (id, embedding, metadata, document) row of an export.
+Record = tuple[str, list[float], dict, str]
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Tokens that matter when skipping over a value without decoding it: strings
+# (so brackets inside them are ignored) and container brackets.
+_SKIP_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"?|[\[\]{}]')
+
+
+class _JsonStream:
+    """Incremental JSON tokenizer over a text file handle.
+
+    Holds at most one chunk plus the value being decoded, so walking an
+    array of a million vectors never materialises the array itself.
+
+    Args:
+        fh:         Text-mode file handle positioned at the start of the JSON.
+        chunk_size: Characters read per refill.
+    """
+
+    def __init__(self, fh, chunk_size: int = READ_CHUNK_SIZE) -> None:
+        self._fh = fh
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, size: int = 0) -> bool:
+        """Append at least a chunk to the buffer; False at end of file."""
+        data = self._fh.read(max(size, self._chunk_size))
+        if not data:
+            return False
+        self._buf = self._buf[self._pos :] + data
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of ``chars``."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(
+                f"Malformed export: expected one of {chars!r}, found {char!r}"
+            )
+        self._pos += 1
+        return char
+
+    def value(self):
+        """Decode and return the next complete JSON value."""
+        self.peek()
+        while True:
+            # Each retry at least doubles the pending text, so a value longer
+            # than a chunk is re-decoded O(log n) times rather than O(n).
+            pending = len(self._buf) - self._pos
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill(pending):
+                    continue
+                raise
+            # A number that ends exactly at the buffer edge may continue in
+            # the next chunk; re-decode once more data is available.
+            if end == len(self._buf) and self._fill(pending):
+                continue
+            self._pos = end
+            return obj
+
+    def skip(self) -> None:
+        """Consume the next value without decoding it."""
+        if self.peek() not in "[{":
+            self.value()
+            return
+        depth = 0
+        while True:
+            match = _SKIP_TOKEN.search(self._buf, self._pos)
+            if match is None:
+                self._pos = len(self._buf)
+                if not self._fill():
+                    raise ValueError("Malformed export: unexpected end of file")
+                continue
+            token = match.group()
+            if token[0] == '"' and (
+                len(token) < 2 or token[-1] != '"' or match.end() == len(self._buf)
+            ):
+                # String cut off by the chunk boundary: refill and rescan it.
+                # A string that reaches the end of the buffer may look closed
+                # when it ends in an escaped quote (``\"``), so it is
+                # rescanned too.
+                self._pos = match.start()
+                if not self._fill():
+                    raise ValueError("Malformed export: unterminated string")
+                continue
+            self._pos = match.end()
+            if token in "[{":
+                depth += 1
+            elif token in "]}":
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def array(self) -> Iterator:
+        """Yield the elements of the JSON array starting at the cursor."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+
+def iter_json_array(
+    file_path: Path, key: str, chunk_size: int = READ_CHUNK_SIZE
+) -> Iterator:
+    """Yield the elements of the top-level array ``key`` one at a time.
+
+    Other top-level values are skipped without being decoded, so each key can
+    be read through its own file handle in a single forward pass.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a JSON object or ``key`` is missing.
+    """
+    with open(file_path, "r", encoding="utf-8") as fh:
+        stream = _JsonStream(fh, chunk_size)
+        stream.expect("{")
+        if stream.peek() == "}":
+            raise ValueError(f"JSON is missing required key: {key!r}")
+        while True:
+            name = stream.value()
+            stream.expect(":")
+            if name == key:
+                yield from stream.array()
+                return
+            stream.skip()
+            if stream.expect(",}") == "}":
+                raise ValueError(f"JSON is missing required key: {key!r}")
+
+
+# Sentinel marking an exhausted column in VectorExport.records.
+_END = object()
+
+
+def _id_digest(doc_id: str) -> int:
+    """Return a 64-bit digest of an ID for compact duplicate detection."""
+    return int.from_bytes(
+        hashlib.blake2b(doc_id.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+
+
+class VectorExport:
+    """Streaming view of a ``chroma_vectors.json`` export.
+
+    The four parallel arrays are read through separate file handles in
+    lockstep, so only the record being assembled is ever in memory.  Records
+    are validated as they stream past: the arrays must be the same length,
+    IDs must be unique strings and every embedding must have the same
+    dimension as the first.
+
+    Args:
+        file_path:  Path to the export.
+        chunk_size: Characters read per refill on each handle.
+    """
+
+    def __init__(self, file_path: Path, chunk_size: int = READ_CHUNK_SIZE) -> None:
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.dimension: Optional[int] = None
+
+    def ids(self) -> Iterator[str]:
+        """Yield the record IDs only (reads just the ``ids`` array)."""
+        return iter_json_array(self.file_path, "ids", self.chunk_size)
+
+    def content_digest(self) -> str:
+        """Return the SHA-256 of the export file's bytes."""
+        digest = hashlib.sha256()
+        with open(self.file_path, "rb") as fh:
+            while chunk := fh.read(1 << 20):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def fingerprint(self, collection_name: str) -> tuple[int, str]:
+        """Return ``(record count, export_fingerprint)``.
+
+        Streams the ``ids`` array once and hashes the file's bytes, so an
+        export regenerated with the same IDs but new content gets a new
+        fingerprint.
+        """
+        count = 0
+
+        def counted() -> Iterator[str]:
+            nonlocal count
+            for doc_id in self.ids():
+                count += 1
+                yield doc_id
+
+        digest = export_fingerprint(collection_name, counted(), self.content_digest())
+        return count, digest
+
+    def records(self) -> Iterator[Record]:
+        """Yield validated ``(id, embedding, metadata, document)`` records.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: On malformed JSON, a missing key, mismatched array
+                lengths, a duplicate or non-string ID, or an embedding whose
+                dimension differs from the first one.
+        """
+        columns = [
+            iter_json_array(self.file_path, key, self.chunk_size)
+            for key in EXPORT_KEYS
+        ]
+        seen: set[int] = set()
+        count = 0
+        try:
+            while True:
+                row = [next(column, _END) for column in columns]
+                if all(value is _END for value in row):
+                    return
+                if any(value is _END for value in row):
+                    lengths = [
+                        count + (value is not _END) + sum(1 for _ in column)
+                        for value, column in zip(row, columns)
+                    ]
+                    raise ValueError(
+                        "Mismatched list lengths — "
+                        + ", ".join(f"{k}: {n}" for k, n in zip(EXPORT_KEYS, lengths))
+                    )
+                doc_id, embedding, metadata, document = row
+                if not isinstance(doc_id, str):
+                    raise ValueError(f"Record {count}: ID {doc_id!r} is not a string")
+                digest = _id_digest(doc_id)
+                if digest in seen:
+                    raise ValueError(f"Duplicate ID found in the JSON file: {doc_id!r}")
+                seen.add(digest)
+                if self.dimension is None:
+                    self.dimension = len(embedding)
+                elif len(embedding) != self.dimension:
+                    raise ValueError(
+                        f"Record {doc_id!r}: embedding has {len(embedding)} "
+                        f"dimensions, expected {self.dimension}"
+                    )
+                count += 1
+                yield doc_id, embedding, metadata, document
+        finally:
+            for column in columns:
+                column.close()
+
+
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 
 def load_json(
     file_path: Path,
 ) -> tuple[list[str], list[list[float]], list[dict], list[str]]:
-    """Load and validate the exported vectors JSON file.
+    """Load and validate the exported vectors JSON file into memory.
+
+    Reads through :class:`VectorExport`, so validation is identical to the
+    streaming path used by :func:`import_file`; use that instead when the
+    export is large.
 
     Expected JSON shape::
 
@@ -71,52 +400,397 @@ def load_json(
 
     Raises:
         SystemExit: If the file cannot be read, is missing required keys, has
-            mismatched list lengths, or contains duplicate IDs.
+            mismatched list lengths, duplicate IDs or inconsistent embedding
+            dimensions.
     """
-    # Read and parse the JSON file
+    ids: list[str] = []
+    embeddings: list[list[float]] = []
+    metadatas: list[dict] = []
+    documents: list[str] = []
     try:
-        with open(file_path, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
+        for doc_id, embedding, metadata, document in VectorExport(file_path).records():
+            ids.append(doc_id)
+            embeddings.append(embedding)
+            metadatas.append(metadata)
+            documents.append(document)
     except FileNotFoundError:
         print(f"[ERROR] File not found: {file_path}", file=sys.stderr)
         sys.exit(1)
     except json.JSONDecodeError as exc:
         print(f"[ERROR] Failed to parse JSON: {exc}", file=sys.stderr)
         sys.exit(1)
-
-    # Validate all required keys are present
-    required_keys = {"ids", "embeddings", "metadatas", "documents"}
-    missing = required_keys - data.keys()
-    if missing:
-        print(f"[ERROR] JSON is missing required keys: {missing}", file=sys.stderr)
+    except ValueError as exc:
+        print(f"[ERROR] {exc}", file=sys.stderr)
         sys.exit(1)
 
-    ids: list[str] = data["ids"]
-    embeddings: list[list[float]] = data["embeddings"]
-    metadatas: list[dict] = data["metadatas"]
-    documents: list[str] = data["documents"]
+    return ids, embeddings, metadatas, documents
 
-    # Validate all four lists are the same length
-    lengths = {len(ids), len(embeddings), len(metadatas), len(documents)}
-    if len(lengths) != 1:
-        print(
-            f"[ERROR] Mismatched list lengths — "
-            f"ids: {len(ids)}, embeddings: {len(embeddings)}, "
-            f"metadatas: {len(metadatas)}, documents: {len(documents)}",
-            file=sys.stderr,
+
+class AdaptiveBatchSizer:
+    """Additive-increase / multiplicative-decrease batch size controller.
+
+    Grows the batch size by ``step`` after each batch that finishes within
+    ``target_latency`` and halves it after a slow or failed batch, keeping it
+    within ``[minimum, maximum]``.
+
+    Args:
+        initial:        Starting batch size.
+        minimum:        Smallest batch size ever used.
+        maximum:        Largest batch size ever used.
+        target_latency: Per-batch latency (seconds) to aim for.
+        step:           Records added after each fast batch.
+    """
+
+    def __init__(
+        self,
+        initial: int = BATCH_SIZE,
+        minimum: int = MIN_BATCH_SIZE,
+        maximum: int = MAX_BATCH_SIZE,
+        target_latency: float = TARGET_LATENCY,
+        step: int = BATCH_SIZE_STEP,
+    ) -> None:
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.step = step
+        self.size = max(minimum, min(maximum, initial))
+
+    def record(self, latency: Optional[float]) -> None:
+        """Adjust the size after a batch; ``latency=None`` means it failed."""
+        if latency is not None and latency <= self.target_latency:
+            self.size = min(self.maximum, self.size + self.step)
+        else:
+            self.size = max(self.minimum, self.size // 2)
+
+
+def write_json_atomic(path: Path, data: object) -> None:
+    """Write ``data`` as JSON to ``path`` through a unique temp file.
+
+    Each write is staged in its own temp file in the destination directory
+    and moved into place with ``os.replace`` (as ``app/atomic.py`` does), so
+    two imports writing the same file never publish a torn one.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(data, fh)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class Checkpoint:
+    """Record of which ``[start, end)`` record ranges are confirmed imported.
+
+    The checkpoint is tied to a fingerprint of the source file and target
+    collection; a checkpoint with a different fingerprint is ignored.
+
+    Args:
+        path:        Checkpoint file location (``None`` disables persistence).
+        fingerprint: Identifies the export + collection being imported.
+        done:        Confirmed ranges, as ``[start, end]`` pairs.
+    """
+
+    def __init__(
+        self, path: Optional[Path], fingerprint: str, done: Optional[list] = None
+    ) -> None:
+        self.path = path
+        self.fingerprint = fingerprint
+        self.done: list[list[int]] = done or []
+
+    @classmethod
+    def load(cls, path: Optional[Path], fingerprint: str) -> "Checkpoint":
+        """Load the checkpoint at ``path`` if it matches ``fingerprint``."""
+        if path is None or not path.exists():
+            return cls(path, fingerprint)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            print(f"[WARN] Ignoring unreadable checkpoint {path}", file=sys.stderr)
+            return cls(path, fingerprint)
+        if data.get("fingerprint") != fingerprint:
+            print(f"[INFO] Checkpoint {path} is for a different export; ignoring it")
+            return cls(path, fingerprint)
+        return cls(path, fingerprint, [list(r) for r in data.get("done", [])])
+
+    @property
+    def confirmed(self) -> int:
+        """Number of records covered by confirmed ranges."""
+        return sum(end - start for start, end in self.done)
+
+    def mark(self, start: int, end: int) -> None:
+        """Record ``[start, end)`` as imported and persist the checkpoint."""
+        merged: list[list[int]] = []
+        for lo, hi in sorted(self.done + [[start, end]]):
+            if merged and lo <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], hi)
+            else:
+                merged.append([lo, hi])
+        self.done = merged
+        self.save()
+
+    def pending(self, total: int) -> list[tuple[int, int]]:
+        """Return the ``[start, end)`` ranges of ``range(total)`` not yet done."""
+        gaps: list[tuple[int, int]] = []
+        position = 0
+        for start, end in self.done:
+            if start > position:
+                gaps.append((position, min(start, total)))
+            position = max(position, end)
+        if position < total:
+            gaps.append((position, total))
+        return [(lo, hi) for lo, hi in gaps if lo < hi]
+
+    def save(self) -> None:
+        """Write the checkpoint atomically (no-op without a path)."""
+        if self.path is None:
+            return
+        write_json_atomic(
+            self.path, {"fingerprint": self.fingerprint, "done": self.done}
         )
-        sys.exit(1)
 
-    # Confirm IDs are unique (guard against re-introduced generation bugs)
-    if len(set(ids)) != len(ids):
-        duplicates = len(ids) - len(set(ids))
+    def remove(self) -> None:
+        """Delete the checkpoint file once the import is complete."""
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+
+def export_fingerprint(collection_name: str, ids: Iterable[str], content: str) -> str:
+    """Fingerprint an import by target collection, ordered record IDs and content.
+
+    Args:
+        collection_name: Name of the target collection.
+        ids:             Record IDs, in import order.
+        content:         Digest of the records' content (see
+                         :func:`records_digest` and
+                         :meth:`VectorExport.content_digest`), so a checkpoint
+                         never outlives a change to the vectors it confirmed.
+    """
+    digest = hashlib.sha256(collection_name.encode("utf-8"))
+    for doc_id in ids:
+        digest.update(b"\0" + doc_id.encode("utf-8"))
+    digest.update(b"\1" + content.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def records_digest(hashes: Iterable[str]) -> str:
+    """Combine per-record :func:`content_hash` values into one digest."""
+    digest = hashlib.sha256()
+    for record_hash in hashes:
+        digest.update(record_hash.encode("ascii"))
+    return digest.hexdigest()
+
+
+def _upsert_with_retry(collection, batch: dict, attempts: int = MAX_ATTEMPTS) -> float:
+    """Upsert one batch, retrying with exponential backoff.
+
+    Returns:
+        Latency of the successful attempt, in seconds.
+
+    Raises:
+        Exception: The last error if every attempt failed.
+    """
+    for attempt in range(1, attempts + 1):
+        started = time.perf_counter()
+        try:
+            collection.upsert(**batch)
+            return time.perf_counter() - started
+        except Exception as exc:
+            if attempt == attempts:
+                raise
+            delay = 0.5 * 2 ** (attempt - 1)
+            print(
+                f"[WARN] Upsert of {len(batch['ids'])} records failed "
+                f"({exc}); retry {attempt}/{attempts - 1} in {delay:.1f}s",
+                file=sys.stderr,
+            )
+            time.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+def _batches(
+    records: Iterable[Record],
+    pending: list[tuple[int, int]],
+    sizer: AdaptiveBatchSizer,
+) -> Iterator[tuple[int, int, dict]]:
+    """Group the records at ``pending`` positions into upsert batches.
+
+    Batches never straddle a pending range, so each one maps to a single
+    ``[start, end)`` checkpoint entry.  Each batch is cut at the sizer's
+    current size, read lazily so adaptation applies to the very next batch.
+    Records outside ``pending`` are still consumed (and so validated) but
+    never buffered.
+
+    Yields:
+        ``(start, end, batch)`` where ``batch`` holds the ``upsert`` keyword
+        arguments.
+    """
+    ranges = iter(pending)
+    lo, hi = next(ranges, (None, None))
+    rows: list[Record] = []
+    start = 0
+    for position, record in enumerate(records):
+        while hi is not None and position >= hi:
+            lo, hi = next(ranges, (None, None))
+        if lo is None or position < lo:
+            continue
+        if not rows:
+            start = position
+        rows.append(record)
+        if len(rows) >= sizer.size or position + 1 == hi:
+            yield start, position + 1, _columns(rows)
+            rows = []
+    if rows:
+        yield start, start + len(rows), _columns(rows)
+
+
+def _columns(rows: list[Record]) -> dict:
+    """Transpose records into ``upsert`` keyword arguments."""
+    ids, embeddings, metadatas, documents = zip(*rows)
+    return {
+        "ids": list(ids),
+        "embeddings": list(embeddings),
+        "metadatas": list(metadatas),
+        "documents": list(documents),
+    }
+
+
+def _import_records(
+    client: chromadb.HttpClient,
+    collection_name: str,
+    records: Callable[[], Iterable[Record]],
+    total: int,
+    fingerprint: str,
+    reset: bool = False,
+    workers: int = WORKERS,
+    sizer: Optional[AdaptiveBatchSizer] = None,
+    checkpoint_path: Optional[Path] = None,
+) -> list[tuple[int, int]]:
+    """Upsert a stream of records with parallel, checkpointed batches.
+
+    Args:
+        client:          An authenticated ChromaDB HTTP client.
+        collection_name: Name of the target collection.
+        records:         Returns a fresh iterator over the records.
+        total:           Number of records ``records()`` yields.
+        fingerprint:     Identifies the record sequence for the checkpoint.
+        reset:           When True, drop and recreate the collection first.
+        workers:         Maximum concurrent upsert requests.
+        sizer:           Batch size controller (default: AdaptiveBatchSizer()).
+        checkpoint_path: Where to record confirmed batches (None disables it).
+
+    Returns:
+        The ``[start, end)`` record ranges upserted by this run.  Ranges a
+        resumed run skipped because an earlier run confirmed them are not
+        included.
+
+    Raises:
+        Exception: The error of a batch that failed every retry, or a
+            validation error from ``records()``.  Confirmed batches stay
+            recorded in the checkpoint for the next run.
+    """
+    sizer = sizer or AdaptiveBatchSizer()
+    checkpoint = Checkpoint.load(checkpoint_path, fingerprint)
+    resuming = checkpoint.confirmed > 0
+
+    # Delete the existing collection so stale records are fully removed.
+    if reset and resuming:
         print(
-            f"[ERROR] {duplicates} duplicate IDs found in the JSON file.",
-            file=sys.stderr,
+            f"[INFO] Resuming: {checkpoint.confirmed}/{total} records already "
+            f"confirmed — keeping collection '{collection_name}'"
+        )
+    elif reset:
+        try:
+            client.delete_collection(name=collection_name)
+            print(f"[INFO] Deleted existing collection '{collection_name}'")
+        except Exception:
+            # Collection did not exist — nothing to delete.
+            print(
+                f"[INFO] Collection '{collection_name}' did not exist; skipping delete"
+            )
+    elif resuming:
+        print(
+            f"[INFO] Resuming: {checkpoint.confirmed}/{total} records already confirmed"
         )
-        sys.exit(1)
 
-    return ids, embeddings, metadatas, documents
+    # Get or create the collection with cosine distance so that the returned
+    # distances are in [0, 1] and similarity = 1 - distance.
+    collection = client.get_or_create_collection(
+        name=collection_name,
+        metadata={"hnsw:space": "cosine"},
+    )
+    print(
+        f"[INFO] Using collection '{collection_name}' (cosine distance, "
+        f"{workers} workers)"
+    )
+
+    batches = _batches(records(), checkpoint.pending(total), sizer)
+    imported = checkpoint.confirmed
+    sent = 0
+    sent_ranges: list[tuple[int, int]] = []
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        in_flight: dict[Future, tuple[int, int]] = {}
+        try:
+            while True:
+                # Keep every worker busy while there is work left.  At most
+                # ``workers`` batches are buffered at any time.
+                while len(in_flight) < workers:
+                    item = next(batches, None)
+                    if item is None:
+                        break
+                    start, end, batch = item
+                    future = pool.submit(_upsert_with_retry, collection, batch)
+                    in_flight[future] = (start, end)
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    start, end = in_flight.pop(future)
+                    try:
+                        latency = future.result()
+                    except Exception:
+                        sizer.record(None)
+                        raise
+                    sizer.record(latency)
+                    checkpoint.mark(start, end)
+                    sent_ranges.append((start, end))
+                    imported += end - start
+                    sent += end - start
+                    rate = sent / max(time.perf_counter() - started, 1e-9)
+                    print(
+                        f"[INFO] Upserted {imported}/{total} records … "
+                        f"({rate:,.0f} records/s, batch size {sizer.size})"
+                    )
+        except BaseException:
+            # Stop scheduling: drop queued batches and let running ones finish.
+            # Their records are not checkpointed, so the next run re-upserts
+            # them (harmless — upsert is idempotent).
+            for future in in_flight:
+                future.cancel()
+            batches.close()
+            print(
+                f"[ERROR] Import stopped at {imported}/{total} records; "
+                f"re-run to resume from the checkpoint.",
+                file=sys.stderr,
+            )
+            raise
+
+    checkpoint.remove()
+    elapsed = time.perf_counter() - started
+    print(
+        f"[OK]   Import complete — {total} records in '{collection_name}' "
+        f"({sent} sent in {elapsed:.1f}s, {sent / max(elapsed, 1e-9):,.0f} records/s)."
+    )
+    return sorted(sent_ranges)
 
 
 def import_vectors(
@@ -127,13 +801,18 @@ def import_vectors(
     metadatas: list[dict],
     documents: list[str],
     reset: bool = False,
+    workers: int = WORKERS,
+    sizer: Optional[AdaptiveBatchSizer] = None,
+    checkpoint_path: Optional[Path] = None,
 ) -> None:
-    """Upsert all vectors into a ChromaDB collection in batches.
+    """Upsert all vectors into a ChromaDB collection with parallel batches.
 
     Creates the collection if it does not already exist.  Uses ``upsert`` so
     the script can be re-run safely without creating duplicate documents.
     When ``reset`` is ``True``, the collection is deleted and recreated first
-    so that any stale vectors not present in the new JSON are removed.
+    so that any stale vectors not present in the new JSON are removed —
+    unless a matching checkpoint shows this is a resumed run, in which case
+    the collection already holds the confirmed records and is kept.
 
     Args:
         client:          An authenticated ChromaDB HTTP client.
@@ -143,50 +822,280 @@ def import_vectors(
         metadatas:       Metadata dicts (one per record).
         documents:       Raw document strings (one per record).
         reset:           When True, drop and recreate the collection first.
+        workers:         Maximum concurrent upsert requests.
+        sizer:           Batch size controller (default: AdaptiveBatchSizer()).
+        checkpoint_path: Where to record confirmed batches (None disables it).
+
+    Raises:
+        Exception: The error of a batch that failed every retry.  Confirmed
+            batches stay recorded in the checkpoint for the next run.
     """
-    # Delete the existing collection so stale records are fully removed.
-    if reset:
-        try:
-            client.delete_collection(name=collection_name)
-            print(f"[INFO] Deleted existing collection '{collection_name}'")
-        except Exception:
-            # Collection did not exist — nothing to delete.
-            print(
-                f"[INFO] Collection '{collection_name}' did not exist; skipping delete"
-            )
+    _import_records(
+        client,
+        collection_name,
+        lambda: zip(ids, embeddings, metadatas, documents),
+        len(ids),
+        export_fingerprint(
+            collection_name, ids,
+            records_digest(map(content_hash, embeddings, metadatas, documents)),
+        ),
+        reset=reset,
+        workers=workers,
+        sizer=sizer,
+        checkpoint_path=checkpoint_path,
+    )
 
-    # Get or create the collection with cosine distance so that the returned
-    # distances are in [0, 1] and similarity = 1 - distance.
+
+# ── Diff import ───────────────────────────────────────────────────────────────
+
+
+def content_hash(embedding: list[float], metadata: dict, document: str) -> str:
+    """Return a stable hash of one record's embedding, metadata and document.
+
+    Floats are hashed through their JSON ``repr``, which round-trips exactly,
+    and metadata keys are sorted so dict ordering does not matter.
+    """
+    payload = json.dumps(
+        [embedding, metadata, document],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def load_manifest(path: Optional[Path], collection_name: str) -> dict[str, str]:
+    """Return the ID → content hash map last written for ``collection_name``.
+
+    A missing, unreadable or other-collection manifest yields ``{}``, which
+    makes every record that is already in the collection count as changed.
+    """
+    if path is None or not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        print(f"[WARN] Ignoring unreadable manifest {path}", file=sys.stderr)
+        return {}
+    if data.get("collection") != collection_name:
+        return {}
+    return data.get("hashes", {})
+
+
+def save_manifest(
+    path: Optional[Path], collection_name: str, hashes: dict[str, str]
+) -> None:
+    """Atomically write the ID → content hash map for ``collection_name``."""
+    if path is None:
+        return
+    write_json_atomic(path, {"collection": collection_name, "hashes": hashes})
+
+
+def collection_ids(collection) -> set[str]:
+    """Page through ``collection`` and return every stored ID."""
+    found: set[str] = set()
+    offset = 0
+    while True:
+        page = collection.get(include=[], limit=ID_PAGE_SIZE, offset=offset)
+        if not page["ids"]:
+            return found
+        found.update(page["ids"])
+        offset += len(page["ids"])
+
+
+def plan_diff(
+    ids: list[str],
+    hashes: list[str],
+    manifest: dict[str, str],
+    existing: set[str],
+) -> tuple[list[int], list[str]]:
+    """Work out which records to upsert and which IDs to delete.
+
+    A record is upserted when its ID is not in the collection yet, or when its
+    content hash differs from the manifest (including having no manifest
+    entry).  IDs in the collection but not in the export are deleted.
+
+    Args:
+        ids:      Export IDs.
+        hashes:   Content hash of each export record.
+        manifest: ID → hash recorded by the last successful import.
+        existing: IDs currently stored in the collection.
+
+    Returns:
+        ``(indices of records to upsert, IDs to delete)``.
+    """
+    upsert = [
+        i for i, (doc_id, digest) in enumerate(zip(ids, hashes))
+        if doc_id not in existing or manifest.get(doc_id) != digest
+    ]
+    delete = sorted(existing.difference(ids))
+    return upsert, delete
+
+
+def _diff_records(
+    client: chromadb.HttpClient,
+    collection_name: str,
+    records: Callable[[], Iterable[Record]],
+    manifest_path: Optional[Path],
+    **import_kwargs,
+) -> tuple[int, int]:
+    """Diff a record stream against the collection and send only the changes.
+
+    Makes two passes over ``records()``: one to hash every record, and one
+    to upsert the added/changed ones.  Only the IDs and their hashes are
+    kept between passes.
+    """
+    hashes: dict[str, str] = {
+        doc_id: content_hash(embedding, metadata, document)
+        for doc_id, embedding, metadata, document in records()
+    }
+    ids = list(hashes)
     collection = client.get_or_create_collection(
         name=collection_name,
         metadata={"hnsw:space": "cosine"},
     )
-    print(f"[INFO] Using collection '{collection_name}' (cosine distance)")
-
-    total = len(ids)
-    imported = 0
-
-    # Process records in fixed-size batches to respect HTTP request limits
-    for start in range(0, total, BATCH_SIZE):
-        end = min(start + BATCH_SIZE, total)
-
-        # Slice each list to the current batch window
-        batch_ids = ids[start:end]
-        batch_embeddings = embeddings[start:end]
-        batch_metadatas = metadatas[start:end]
-        batch_documents = documents[start:end]
-
-        collection.upsert(
-            ids=batch_ids,
-            embeddings=batch_embeddings,
-            metadatas=batch_metadatas,
-            documents=batch_documents,
+    upsert, delete = plan_diff(
+        ids, list(hashes.values()), load_manifest(manifest_path, collection_name),
+        collection_ids(collection),
+    )
+    print(
+        f"[INFO] Diff: {len(upsert)} added/changed, {len(delete)} removed, "
+        f"{len(ids) - len(upsert)} unchanged"
+    )
+
+    for start in range(0, len(delete), ID_PAGE_SIZE):
+        collection.delete(ids=delete[start : start + ID_PAGE_SIZE])
+    if delete:
+        print(f"[INFO] Deleted {len(delete)} records no longer in the export")
+
+    if upsert:
+        wanted = set(upsert)
+        sent = _import_records(
+            client,
+            collection_name,
+            lambda: (r for i, r in enumerate(records()) if i in wanted),
+            len(upsert),
+            export_fingerprint(
+                collection_name,
+                (ids[i] for i in upsert),
+                records_digest(hashes[ids[i]] for i in upsert),
+            ),
+            **import_kwargs,
         )
+        # Records a resumed run skipped get no manifest entry, so a later
+        # --diff re-sends them rather than trusting an earlier run.  Positions
+        # in ``sent`` index into ``upsert``.
+        confirmed = {j for start, end in sent for j in range(start, end)}
+        for j, i in enumerate(upsert):
+            if j not in confirmed:
+                del hashes[ids[i]]
+    else:
+        print(f"[OK]   Collection '{collection_name}' is already up to date.")
 
-        imported += len(batch_ids)
-        print(f"[INFO] Upserted {imported}/{total} records …")
+    save_manifest(manifest_path, collection_name, hashes)
+    return len(upsert), len(delete)
 
-    print(f"[OK]   Import complete — {total} records in '{collection_name}'.")
+
+def diff_import(
+    client: chromadb.HttpClient,
+    collection_name: str,
+    ids: list[str],
+    embeddings: list[list[float]],
+    metadatas: list[dict],
+    documents: list[str],
+    manifest_path: Optional[Path],
+    **import_kwargs,
+) -> tuple[int, int]:
+    """Bring the collection in line with the export, sending only the changes.
+
+    Args:
+        client:          An authenticated ChromaDB HTTP client.
+        collection_name: Name of the target collection.
+        ids:             Unique document IDs (one per record).
+        embeddings:      Pre-computed embedding vectors (one per record).
+        metadatas:       Metadata dicts (one per record).
+        documents:       Raw document strings (one per record).
+        manifest_path:   Content-hash manifest to compare against and update.
+        **import_kwargs: Passed to :func:`import_vectors` (workers, sizer,
+                         checkpoint_path).
+
+    Returns:
+        ``(records upserted, IDs deleted)``.
+    """
+    return _diff_records(
+        client,
+        collection_name,
+        lambda: zip(ids, embeddings, metadatas, documents),
+        manifest_path,
+        **import_kwargs,
+    )
+
+
+# ── Streaming import ──────────────────────────────────────────────────────────
+
+
+def import_file(
+    client: chromadb.HttpClient,
+    collection_name: str,
+    file_path: Path,
+    reset: bool = False,
+    diff: bool = False,
+    manifest_path: Optional[Path] = None,
+    **import_kwargs,
+) -> None:
+    """Import an export file without loading it into memory.
+
+    The file is streamed through :class:`VectorExport`; peak memory is
+    bounded by the batches in flight (``workers`` × batch size) plus the
+    per-ID manifest hashes, not by the size of the export.  A full import
+    first streams the ``ids`` array and hashes the file's bytes to
+    fingerprint the checkpoint, then streams the records once.  Validation
+    errors surface as the offending record is reached; batches confirmed
+    before it stay checkpointed.
+
+    Args:
+        client:          An authenticated ChromaDB HTTP client.
+        collection_name: Name of the target collection.
+        file_path:       Path to the ``chroma_vectors.json`` export.
+        reset:           When True, drop and recreate the collection first.
+        diff:            Send only added/changed records (see
+                         :func:`diff_import`); excludes ``reset``.
+        manifest_path:   Content-hash manifest to compare against and update.
+        **import_kwargs: Passed to the batch importer (workers, sizer,
+                         checkpoint_path).
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the export is malformed or fails validation.
+    """
+    export = VectorExport(file_path)
+    if diff:
+        _diff_records(
+            client, collection_name, export.records, manifest_path, **import_kwargs
+        )
+        return
+
+    total, fingerprint = export.fingerprint(collection_name)
+    print(f"[INFO] Export holds {total} records")
+    hashes: list[tuple[str, str]] = []
+
+    def hashed() -> Iterator[Record]:
+        for record in export.records():
+            hashes.append((record[0], content_hash(*record[1:])))
+            yield record
+
+    sent = _import_records(
+        client, collection_name, hashed, total, fingerprint, reset=reset,
+        **import_kwargs,
+    )
+    # Record what this run wrote so the next --diff run has a baseline.
+    # Records a resumed run skipped are left out: --diff re-sends them
+    # rather than trusting content it never sent.
+    save_manifest(manifest_path, collection_name, {
+        doc_id: digest
+        for start, end in sent
+        for doc_id, digest in hashes[start:end]
+    })
 
 
 # ── CLI ───────────────────────────────────────────────────────────────────────
@@ -228,7 +1137,50 @@ def parse_args() -> argparse.Namespace:
         default=False,
         help="Delete the existing collection before importing (removes stale vectors)",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=WORKERS,
+        help=f"Concurrent upsert requests (default: {WORKERS})",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help=f"Initial records per upsert; adapts to latency (default: {BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--target-latency",
+        type=float,
+        default=TARGET_LATENCY,
+        help=f"Per-batch latency in seconds to aim for (default: {TARGET_LATENCY})",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=DEFAULT_CHECKPOINT_FILE,
+        help=f"Checkpoint file for resuming (default: {DEFAULT_CHECKPOINT_FILE})",
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        default=False,
+        help="Ignore and overwrite any existing checkpoint",
+    )
+    parser.add_argument(
+        "--diff",
+        action="store_true",
+        default=False,
+        help="Upsert only added/changed records and delete removed IDs",
+    )
+    parser.add_argument(
+        "--manifest",
+        default=DEFAULT_MANIFEST_FILE,
+        help=f"Content-hash manifest used by --diff (default: {DEFAULT_MANIFEST_FILE})",
+    )
+    args = parser.parse_args()
+    if args.diff and args.reset:
+        parser.error("--diff and --reset are mutually exclusive")
+    return args
 
 
 def main() -> None:
@@ -238,9 +1190,10 @@ def main() -> None:
     # so the script works correctly regardless of the working directory.
     file_path = Path(__file__).parent.parent / args.file
 
-    print(f"[INFO] Loading vectors from: {file_path}")
-    ids, embeddings, metadatas, documents = load_json(file_path)
-    print(f"[INFO] Loaded {len(ids)} records ({len(set(ids))} unique IDs)")
+    if not file_path.exists():
+        print(f"[ERROR] File not found: {file_path}", file=sys.stderr)
+        sys.exit(1)
+    print(f"[INFO] Streaming vectors from: {file_path}")
 
     # Connect to the ChromaDB HTTP server
     print(f"[INFO] Connecting to ChromaDB at {args.host}:{args.port} …")
@@ -257,9 +1210,32 @@ def main() -> None:
 
     print("[INFO] Connected.")
 
-    import_vectors(
-        client, args.collection, ids, embeddings, metadatas, documents, reset=args.reset
-    )
+    checkpoint_path = Path(__file__).parent.parent / args.checkpoint
+    if args.no_resume:
+        checkpoint_path.unlink(missing_ok=True)
+
+    manifest_path = Path(__file__).parent.parent / args.manifest
+    import_kwargs = {
+        "workers": args.workers,
+        "sizer": AdaptiveBatchSizer(
+            initial=args.batch_size, target_latency=args.target_latency
+        ),
+        "checkpoint_path": checkpoint_path,
+    }
+
+    try:
+        import_file(
+            client,
+            args.collection,
+            file_path,
+            reset=args.reset,
+            diff=args.diff,
+            manifest_path=manifest_path,
+            **import_kwargs,
+        )
+    except Exception as exc:
+        print(f"[ERROR] Import failed: {exc}", file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":